@@ -14,20 +14,26 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QDateTimeEdit, QPlainTextEdit, QTableWidget, 
                             QHeaderView, QAbstractItemView, QMessageBox,
                             QFileDialog, QGraphicsDropShadowEffect, QCheckBox,
-                            QTableWidgetItem, QStatusBar, QAction, QTreeWidget,
-                            QTreeWidgetItem, QDialog, QSpinBox)
-from PyQt5.QtCore import Qt, QSize, QDateTime, QSettings, pyqtSignal, QEvent, QRegExp
-from PyQt5.QtGui import QIcon, QColor, QResizeEvent, QCloseEvent, QPixmap, QStandardItem
+                            QTableWidgetItem, QStatusBar, QAction, QTreeView,
+                            QDialog, QSpinBox)
+from PyQt5.QtCore import Qt, QSize, QDateTime, QSettings, pyqtSignal, QEvent, QRegExp, QTimer, QStringListModel
+from PyQt5.QtGui import QIcon, QColor, QResizeEvent, QCloseEvent, QPixmap
 
 # Import the compiled resources
 import Cfg.Resources.resources_rc
 
 # Import modules
 from Modules.FileOperation.FileOperations import FileOperations
+from Modules.FileOperation.AutoSaver import AutoSaver
 from Modules.MenuOperation.menu_operations import MenuOperations
+from Modules.DataBaseOperation.database_operations import DatabaseOperations
 from Modules.Dialogs.SignalDialogs.SignalDetailsDialog import SignalDetailsDialog
+from Modules.Dialogs.SignalDialogs.BulkEditDialog import BulkEditDialog
 from Modules.Dialogs.CoreConfigurationManager.CoreConfig import CoreConfigManager
+from Modules.Dialogs.CoreConfigurationManager.CoreInfoTreeModel import CoreInfoTreeModel
 from Modules.SignalOperations.SignalManager import SignalManager
+from Modules.SignalOperations.SignalTreeModel import SignalTreeModel
+from Utils.widget_registry import WidgetRegistry
 
 class SignalManagerApp(QMainWindow):
     """Main application window for Signal Manager"""
@@ -35,6 +41,59 @@ class SignalManagerApp(QMainWindow):
     # Custom signal for resize events
     resized = pyqtSignal()
     
+    # Pause in typing after which the signal search runs
+    SEARCH_DEBOUNCE_MS = 200
+    
+    # Interval at which journaled edits are made durable
+    JOURNAL_SYNC_MS = 1000
+    
+    # Widgets used by handlers that run on every selection, edit or save,
+    # looked up once after the UI is loaded (object name -> type)
+    REGISTERED_WIDGETS = {
+        # Version details
+        "version_number_field": QLineEdit,
+        "version_date_field": QDateTimeEdit,
+        "updated_by_field": QLineEdit,
+        "change_desc_field": QPlainTextEdit,
+        "CoreInfoTreeObj": QTreeView,
+        # Core configuration combo boxes
+        "buildImageComboBox": QComboBox,
+        "socComboBox": QComboBox,
+        "boardComboBox": QComboBox,
+        "coreImageTypeCombo": QComboBox,
+        "coreSocCombo": QComboBox,
+        "coreBoardCombo": QComboBox,
+        # Signal database page
+        "signalTree": QTreeView,
+        "signalSearchInput": QLineEdit,
+        "filterBtn": QPushButton,
+        "groupSignalsCheck": QCheckBox,
+        "signal_details_card": QFrame,
+        "signalDetailsContainer": QWidget,
+        "dynamicAttrsFrame": QFrame,
+        "dynamicAttrsPlaceholder": QLabel,
+        # Signal details form
+        "varPortNameInput": QLineEdit,
+        "descriptionInput": QLineEdit,
+        "dataTypeCombo": QComboBox,
+        "initValueCombo": QComboBox,
+        "asilCombo": QComboBox,
+        "bufferCountSpinBox": QSpinBox,
+        "notifiersCombo": QComboBox,
+        "smBuffCountSpinBox": QSpinBox,
+        "timeoutSpinBox": QSpinBox,
+        "periodicitySpinBox": QSpinBox,
+        "checksumCombo": QComboBox,
+        # Edit actions
+        "actionUndo": QAction,
+        "actionRedo": QAction,
+    }
+    
+    # Widget lists found in a container (group name -> (container, types))
+    REGISTERED_GROUPS = {
+        "signal_details_inputs": ("signal_details_card", [QLineEdit, QComboBox, QSpinBox, QCheckBox, QPushButton]),
+    }
+    
     def __init__(self, parent=None):
         """Initialize the main window"""
         super(SignalManagerApp, self).__init__(parent)
@@ -48,13 +107,18 @@ class SignalManagerApp(QMainWindow):
         self.max_recent_files = 5
         self.current_file = None
         self.username = "Guest"  # Default username
-        self.signal_edit_stack = []  # For undo operations
+        self.core_config_models = {}  # Core configuration list -> QStringListModel
+        self.signal_selection_model = None  # Selection model of the signal tree's current model
         
         # Set project path
         self.project_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         
         # Load UI from file
         self.setup_ui()
+        
+        # Look up the widgets of the loaded UI once
+        self.widgets = WidgetRegistry(self, self.REGISTERED_WIDGETS, self.REGISTERED_GROUPS)
+        self.widgets.resolve()
 
         # Create SignalManager instance
         self.signal_manager = SignalManager(self)
@@ -63,6 +127,16 @@ class SignalManagerApp(QMainWindow):
         # Initialize file operations after UI setup
         self.file_operations = FileOperations(self)
         
+        # Flush the tail of the edit journal once edits pause
+        self.journal_sync_timer = QTimer(self)
+        self.journal_sync_timer.setInterval(self.JOURNAL_SYNC_MS)
+        self.journal_sync_timer.timeout.connect(self.file_operations.sync_journal)
+        self.journal_sync_timer.start()
+        
+        # Write a recovery copy of the project on a worker thread once edits pause
+        self.auto_saver = AutoSaver(self.file_operations, lambda: (self.project_data, self.current_file_path), self)
+        self.auto_saver.saved.connect(self.on_autosaved)
+        
         # Connect signals and slots
         self.connect_signals_slots()
         
@@ -187,6 +261,8 @@ class SignalManagerApp(QMainWindow):
         """Handle close event for the main window"""
         if self.maybe_save():
             self.save_settings()
+            # Edits undone back to the saved state must not be "recovered" on the next open
+            self.file_operations.close_journal(discard=not self.signal_manager.has_unsaved_signal_changes())
             event.accept()
         else:
             event.ignore()
@@ -281,6 +357,25 @@ class SignalManagerApp(QMainWindow):
             action_update_entry.setStatusTip("Update the selected entry")
             action_update_entry.triggered.connect(self.on_update_entry)
         
+        action_undo = self.findChild(QAction, "actionUndo")
+        if action_undo:
+            action_undo.setShortcut("Ctrl+Z")
+            action_undo.setStatusTip("Undo the last signal edit")
+            action_undo.triggered.connect(self.on_undo)
+        
+        action_redo = self.findChild(QAction, "actionRedo")
+        if action_redo:
+            action_redo.setShortcut("Ctrl+Y")
+            action_redo.setStatusTip("Redo the last undone signal edit")
+            action_redo.triggered.connect(self.on_redo)
+        
+        # Keep the undo/redo actions in step with the signal history
+        self.signal_manager.add_change_listener(lambda event, signal_ids: self.update_undo_actions())
+        
+        # Autosave after signal edits
+        self.signal_manager.add_change_listener(self.on_signals_edited)
+        self.update_undo_actions()
+        
         # Connect Code Generator menu actions
         action_signal_mgr = self.findChild(QAction, "actionSignalMgr")
         if action_signal_mgr:
@@ -432,6 +527,7 @@ class SignalManagerApp(QMainWindow):
             if self.file_operations.import_from_excel(file_path, imported_data):
                 # Update project data with imported data
                 self.project_data = imported_data
+                self.signal_manager.set_project_data(self.project_data)
                 
                 # Update UI with new data
                 self.update_ui_from_data()
@@ -469,6 +565,44 @@ class SignalManagerApp(QMainWindow):
         # Call the delete_signal method
         self.delete_signal()
     
+    def on_undo(self):
+        """Handler for undo action - reverts the last signal edit"""
+        label = self.signal_manager.undo()
+        if label is not None:
+            self.statusBar.showMessage(f"Undone: {label}", 3000)
+            # The selected signal may have changed under the details form
+            self.on_signal_selected()
+    
+    def on_redo(self):
+        """Handler for redo action - applies the last undone signal edit again"""
+        label = self.signal_manager.redo()
+        if label is not None:
+            self.statusBar.showMessage(f"Redone: {label}", 3000)
+            self.on_signal_selected()
+    
+    def on_signals_edited(self, event, signal_ids):
+        """Schedule an autosave after signals were added, edited or deleted"""
+        # A reset is a load or a new project, there is nothing to recover yet
+        if event in ("added", "updated", "removed"):
+            self.auto_saver.schedule()
+    
+    def on_autosaved(self, path, error):
+        """Report the result of a background autosave in the status bar"""
+        if error:
+            self.statusBar.showMessage(f"Autosave failed: {error}", 5000)
+        else:
+            self.statusBar.showMessage(f"Autosaved a recovery copy to {path}", 3000)
+    
+    def update_undo_actions(self):
+        """Enable the undo/redo actions when there is something to undo or redo"""
+        action_undo, action_redo = self.widgets.fetch("update_undo_actions", "actionUndo", "actionRedo")
+        history = self.signal_manager.history
+        for action, enabled, label in ((action_undo, history.can_undo(), history.undo_label()),
+                                       (action_redo, history.can_redo(), history.redo_label())):
+            if action:
+                action.setEnabled(enabled)
+                action.setToolTip(f"{action.text()}: {label}" if label else action.text())
+    
     def on_update_entry(self):
         """Handler for update entry menu action - forwards to edit_signal method"""
         # Make sure we're on the signal database page
@@ -491,79 +625,54 @@ class SignalManagerApp(QMainWindow):
     
     # Signal model operations
     def add_signal_to_model(self, signal_data):
-        """Add a signal to the model
+        """Show a signal that was added to the database in the signal tree
+        
+        The signal tree model already has the row (it follows the signal
+        store); this expands it, so its property rows are generated, and
+        selects it.
         
         Args:
             signal_data: Dictionary with signal data
         """
-        # Get the current model
-        model = self.signal_tree.model()
-        if not model:
-            return
-        
-        # Create parent item for the signal
-        parent_item = QStandardItem(signal_data["name"])
-        parent_item.setData(signal_data, Qt.UserRole)
-        
-        # Add child items for important properties
-        variable_port_name_item = QStandardItem("Variable Port: " + signal_data.get("variable_port_name", ""))
-        data_type_item = QStandardItem("Data Type: " + signal_data.get("data_type", ""))
-        memory_region_item = QStandardItem("Memory Region: " + signal_data.get("memory_region", ""))
-        
-        # Add items to parent
-        parent_item.appendRow(variable_port_name_item)
-        parent_item.appendRow(data_type_item)
-        parent_item.appendRow(memory_region_item)
-        
-        # Add parent item to model
-        model.appendRow(parent_item)
-        
-        # Expand the item
-        index = model.indexFromItem(parent_item)
-        self.signal_tree.expand(index)
-        
-        # Select the item
-        self.signal_tree.setCurrentIndex(index)
+        self.show_signal_in_tree(signal_data.get("id"))
     
     def update_signal_in_model(self, index, signal_data):
-        """Update a signal in the model
+        """Show a signal that was updated in the database in the signal tree
+        
+        The signal tree model repaints the row and its property rows by
+        itself; this expands and selects it.
         
         Args:
-            index: The index of the signal to update
+            index: The index of the signal in the signal tree model
             signal_data: Dictionary with updated signal data
         """
-        # Get the model
-        model = self.signal_tree.model()
-        if not model:
-            return
+        signal_tree, = self.widgets.fetch("update_signal_in_model", "signalTree")
+        if signal_tree and index.isValid():
+            signal_tree.expand(index)
+            signal_tree.setCurrentIndex(index)
+        else:
+            self.show_signal_in_tree(signal_data.get("id"))
+    
+    def show_signal_in_tree(self, signal_id):
+        """Expand and select a signal in the signal tree
         
-        # Get the item
-        item = model.itemFromIndex(index)
-        if not item:
+        Args:
+            signal_id: The ID of the signal
+        """
+        signal_tree, = self.widgets.fetch("show_signal_in_tree", "signalTree")
+        if not signal_tree:
             return
         
-        # Update the item
-        item.setText(signal_data["name"])
-        item.setData(signal_data, Qt.UserRole)
-        
-        # Remove all child items
-        item.removeRows(0, item.rowCount())
-        
-        # Add child items for important properties
-        variable_port_name_item = QStandardItem("Variable Port: " + signal_data.get("variable_port_name", ""))
-        data_type_item = QStandardItem("Data Type: " + signal_data.get("data_type", ""))
-        memory_region_item = QStandardItem("Memory Region: " + signal_data.get("memory_region", ""))
-        
-        # Add items to parent
-        item.appendRow(variable_port_name_item)
-        item.appendRow(data_type_item)
-        item.appendRow(memory_region_item)
-        
-        # Expand the item
-        self.signal_tree.expand(index)
+        # The index is invalid if the signal is filtered out
+        index = self.signal_manager.get_signal_tree_index(signal_id)
+        if not index.isValid():
+            return
         
-        # Select the item
-        self.signal_tree.setCurrentIndex(index)
+        # Expanding asks the model for the property rows (grouped signal
+        # rows have none); scrolling to it expands the groups above it
+        signal_tree.expand(index)
+        signal_tree.setCurrentIndex(index)
+        signal_tree.scrollTo(index)
     
     # Help menu actions
     def on_about_tool(self):
@@ -603,6 +712,8 @@ class SignalManagerApp(QMainWindow):
         self.current_file_path = ""
         self.has_unsaved_changes = False
         self.project_data = {}
+        self.file_operations.close_journal()
+        self.signal_manager.set_project_data(self.project_data)
         
         # Update UI
         self.update_ui_from_data()
@@ -613,6 +724,20 @@ class SignalManagerApp(QMainWindow):
         if self.file_operations.load_config_file(file_path):
             # Get the project data
             self.project_data = self.file_operations.get_current_data()
+            self.signal_manager.set_project_data(self.project_data, self.file_operations.string_pool)
+            
+            # Journal the signal edits from now on
+            self.file_operations.start_journal(self.signal_manager.store)
+            
+            # Offer the autosaved copy, unless the journal already recovered the edits
+            restored = not self.file_operations.recovered_records and self.offer_recovery(file_path)
+            
+            # Report the memory saved by sharing repeated category values
+            pool_stats = self.file_operations.string_pool.stats()
+            self.statusBar.showMessage(
+                f"Loaded {len(self.project_data.get('signals', []))} signals, "
+                f"{pool_stats['unique']} distinct category values "
+                f"({pool_stats['saved_bytes'] / 1024:.0f} KiB saved by interning)", 5000)
             
             # Update file path and project name
             self.current_file_path = file_path
@@ -622,23 +747,58 @@ class SignalManagerApp(QMainWindow):
             # Update UI with loaded data
             self.update_ui_from_data()
             
-            # Reset unsaved changes flag
-            self.has_unsaved_changes = False
+            # Reset unsaved changes flag, unless edits were recovered
+            self.has_unsaved_changes = self.file_operations.recovered_records > 0 or restored
             self.update_window_title()
             
             # Add to recent files
             self.add_recent_file(file_path)
             
-            QMessageBox.information(self, "Load Successful", f"Project was successfully loaded from {file_path}")
+            message = f"Project was successfully loaded from {file_path}"
+            if self.file_operations.recovered_records:
+                message += (f"\n\n{self.file_operations.recovered_records} unsaved signal edits were "
+                            "recovered from the edit journal. Save the project to keep them.")
+            elif restored:
+                message += "\n\nThe autosaved copy was restored. Save the project to keep it."
+            QMessageBox.information(self, "Load Successful", message)
             return True
         else:
             QMessageBox.warning(self, "Load Failed", f"Failed to load project from {file_path}")
             return False
     
+    def offer_recovery(self, file_path):
+        """Offer to restore the autosaved copy of a project newer than its file
+        
+        Returns:
+            bool: True if the autosaved copy replaced the loaded project data
+        """
+        recovery_path = self.auto_saver.find_recovery(file_path)
+        if recovery_path is None:
+            return False
+        
+        saved_at = QDateTime.fromSecsSinceEpoch(int(os.path.getmtime(recovery_path)))
+        reply = QMessageBox.question(
+            self,
+            "Restore Autosaved Copy",
+            f"An autosaved copy of this project from {saved_at.toString('yyyy-MM-dd hh:mm:ss')} "
+            "is newer than the file, e.g. after a crash.\n\nDo you want to restore it?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            self.auto_saver.discard(file_path)
+            return False
+        
+        if not self.file_operations.load_recovery_file(recovery_path):
+            return False
+        # The journal records the restored signals as one reset
+        self.project_data = self.file_operations.get_current_data()
+        self.signal_manager.set_project_data(self.project_data, self.file_operations.string_pool)
+        return True
+    
     def save_project(self, file_path):
         """Save the current project to a file"""
         # Check if change description is empty
-        change_desc_field = self.findChild(QPlainTextEdit, "change_desc_field")
+        change_desc_field, = self.widgets.fetch("save_project", "change_desc_field")
         if change_desc_field and not change_desc_field.toPlainText().strip():
             # Highlight the change description field
             change_desc_field.setFocus()
@@ -661,14 +821,21 @@ class SignalManagerApp(QMainWindow):
         self.update_data_from_ui()
         
         if self.file_operations.save_config_file(file_path, self.project_data):
+            # A project saved for the first time starts its journal here
+            self.file_operations.start_journal(self.signal_manager.store)
+            
+            # The recovery copy is older than the saved file now
+            self.auto_saver.discard(self.current_file_path)
+            
             # Update file path and project name
             self.current_file_path = file_path
             file_info = os.path.basename(file_path)
             self.current_project_name = os.path.splitext(file_info)[0]
             
-            # Reset unsaved changes flag
+            # Reset unsaved changes flag; later edits are compared with this state
+            self.signal_manager.mark_saved()
             self.has_unsaved_changes = False
-            self.update_window_title()
+            self.set_project_modified(False)
             
             # Add to recent files
             self.add_recent_file(file_path)
@@ -682,10 +849,10 @@ class SignalManagerApp(QMainWindow):
     def update_data_from_ui(self):
         """Update project data from UI elements"""
         # Version Details Card
-        version_number_field = self.findChild(QLineEdit, "version_number_field")
-        version_date_field = self.findChild(QDateTimeEdit, "version_date_field")
-        updated_by_field = self.findChild(QLineEdit, "updated_by_field")
-        change_desc_field = self.findChild(QPlainTextEdit, "change_desc_field")
+        (version_number_field, version_date_field, updated_by_field, change_desc_field,
+         core_info_tree) = self.widgets.fetch(
+            "update_data_from_ui", "version_number_field", "version_date_field", "updated_by_field",
+            "change_desc_field", "CoreInfoTreeObj")
         
         # Update project data with form values
         if "version" not in self.project_data:
@@ -707,7 +874,6 @@ class SignalManagerApp(QMainWindow):
             self.project_data["version"]["change_description"] = change_desc_field.toPlainText()
         
         # Handle Core Info Tree if it exists
-        core_info_tree = self.findChild(QTreeWidget, "CoreInfoTreeObj")
         if core_info_tree:
             # Here you would implement the logic to extract data from the tree widget
             # This is a placeholder for the actual implementation
@@ -720,10 +886,10 @@ class SignalManagerApp(QMainWindow):
     def update_ui_from_data(self):
         """Update UI elements from project data"""
         # Version Details Card
-        version_number_field = self.findChild(QLineEdit, "version_number_field")
-        version_date_field = self.findChild(QDateTimeEdit, "version_date_field")
-        updated_by_field = self.findChild(QLineEdit, "updated_by_field")
-        change_desc_field = self.findChild(QPlainTextEdit, "change_desc_field")
+        (version_number_field, version_date_field, updated_by_field, change_desc_field,
+         core_info_tree) = self.widgets.fetch(
+            "update_ui_from_data", "version_number_field", "version_date_field", "updated_by_field",
+            "change_desc_field", "CoreInfoTreeObj")
         
         # Update form values from project data
         if "version" in self.project_data:
@@ -741,71 +907,38 @@ class SignalManagerApp(QMainWindow):
             if change_desc_field and "change_description" in self.project_data["version"]:
                 change_desc_field.setPlainText(self.project_data["version"]["change_description"])
         
-        # Handle Core Info Tree if it exists
-        core_info_tree = self.findChild(QTreeWidget, "CoreInfoTreeObj")
+        # Handle Core Info Tree if it exists; the model only updates the rows
+        # whose configuration changed
         if core_info_tree:
-            # Here you would implement the logic to populate the tree widget from data
-            # This is a placeholder for the actual implementation
-            core_info_tree.clear()
-            # Set column headers
-            core_info_tree.setHeaderLabels(["Property", "Value"])
-            # Example of populating tree (adjust based on your data structure)
-            if "core_info" in self.project_data:
-                self.populate_tree(core_info_tree, self.project_data["core_info"])
+            self.populate_tree(core_info_tree, self.project_data.get("core_info", {}))
         
         # Sync ComboBoxes with core configuration data
         if "core_info" in self.project_data:
             self.sync_combo_boxes_with_core_config(self.project_data["core_info"])
     
-    def populate_tree(self, tree_widget, data_dict, parent_item=None):
-        """Recursively populate a tree widget from a dictionary"""
+    def populate_tree(self, tree_view, data_dict):
+        """Show a core configuration in a tree view
+        
+        The rows come from a CoreInfoTreeModel, created on first use: the
+        rows below a SoC, core or entry are only created when it is expanded,
+        and showing a changed configuration only updates the rows that differ.
+        
+        Args:
+            tree_view: The QTreeView to show the configuration in
+            data_dict: The core_info dictionary
+        """
+        model = tree_view.model()
+        if not isinstance(model, CoreInfoTreeModel):
+            model = CoreInfoTreeModel(tree_view)
+            tree_view.setModel(model)
+        
         # If this is core_info data, only show core_properties
         if 'core_properties' in data_dict:
-            # Clear and set header style
-            tree_widget.setStyleSheet("QTreeWidget { background-color: #f5f5f5; }")
-            
-            # Create Core Properties parent item
-            core_properties_item = QTreeWidgetItem(tree_widget, ["Core Properties", ""])
-            core_properties_item.setBackground(0, QColor("#e0e0e0"))
-            core_properties_item.setBackground(1, QColor("#e0e0e0"))
-            
-            # For each SoC in core_properties
-            for soc_name, cores in data_dict['core_properties'].items():
-                # Create SoC item
-                soc_item = QTreeWidgetItem(core_properties_item, [soc_name, ""])
-                soc_item.setBackground(0, QColor("#f0f0f0"))
-                
-                # For each core in the SoC
-                for core_name, properties in cores.items():
-                    # Create core item
-                    core_item = QTreeWidgetItem(soc_item, [core_name, ""])
-                    core_item.setBackground(0, QColor("#f8f8f8"))
-                    
-                    # Add properties as child items
-                    for prop_name, prop_value in properties.items():
-                        if prop_name != 'name':  # Skip the name as it's already shown
-                            # Format property name for better display
-                            display_name = prop_name.replace('_', ' ').title()
-                            prop_item = QTreeWidgetItem(core_item, [display_name, str(prop_value)])
-                
-                # Expand the SoC item
-                soc_item.setExpanded(True)
-            
-            # Expand the Core Properties item
-            core_properties_item.setExpanded(True)
-            return
-            
-        # Default recursive behavior for other dictionary data
-        for key, value in data_dict.items():
-            if parent_item:
-                item = QTreeWidgetItem(parent_item, [str(key), ""])
-            else:
-                item = QTreeWidgetItem(tree_widget, [str(key), ""])
-            
-            if isinstance(value, dict):
-                self.populate_tree(tree_widget, value, item)
-            else:
-                item.setText(1, str(value))
+            tree_view.setStyleSheet("QTreeView { background-color: #f5f5f5; }")
+        
+        # Expand the Core Properties and SoC rows that were not shown before
+        for index in model.set_core_info(data_dict):
+            tree_view.expand(index)
     
     def update_window_title(self):
         """Update the window title based on project state"""
@@ -823,13 +956,24 @@ class SignalManagerApp(QMainWindow):
     
     def maybe_save(self):
         """Check if current project has unsaved changes and prompt to save"""
-        if not self.has_unsaved_changes:
+        # Signal edits are tracked by the signal manager, not has_unsaved_changes
+        signals_modified = self.signal_manager.has_unsaved_signal_changes()
+        if not signals_modified:
+            # Edits undone back to the saved state leave nothing worth replaying
+            self.file_operations.compact_journal()
+        if not (self.has_unsaved_changes or signals_modified):
             return True
         
+        message = "The document has been modified."
+        added, removed, changed = self.signal_manager.get_changes_since_saved()
+        if added or removed or changed:
+            message += (f"\n\nSignals since the last save: {len(added)} added, "
+                        f"{len(changed)} changed, {len(removed)} deleted.")
+        
         reply = QMessageBox.question(
             self,
             "Signal Manager",
-            "The document has been modified.\nDo you want to save your changes?",
+            message + "\nDo you want to save your changes?",
             QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel
         )
         
@@ -838,6 +982,9 @@ class SignalManagerApp(QMainWindow):
         elif reply == QMessageBox.Cancel:
             return False
         
+        # Discarded: the journaled edits must not come back on the next open
+        self.file_operations.close_journal(discard=True)
+        self.auto_saver.discard(self.current_file_path)
         return True
     
     def load_settings(self):
@@ -867,6 +1014,18 @@ class SignalManagerApp(QMainWindow):
             # Update the recent files menu
             self.update_recent_files_menu()
         
+        # Autosave
+        self.auto_saver.enabled = settings.value("autosave/enabled", True, type=bool)
+        self.auto_saver.set_delay(int(settings.value("autosave/delaySeconds", AutoSaver.DELAY_MS // 1000)) * 1000)
+        
+        # Project file format
+        self.file_operations.compact_json = settings.value("save/compactJson", False, type=bool)
+        
+        # Undo history
+        self.signal_manager.set_undo_options(
+            memory_budget=int(settings.value("undo/memoryBudgetMB", 64)) * 1024 * 1024,
+            merge_edits=settings.value("undo/mergeEdits", False, type=bool))
+        
         # Other settings can be loaded here
     
     def save_settings(self):
@@ -1056,114 +1215,46 @@ class SignalManagerApp(QMainWindow):
             self.update_ui_from_data()
             self.has_unsaved_changes = True
             self.update_window_title()
+            self.auto_saver.schedule()
             QMessageBox.information(self, "Configuration Updated", "The core configuration has been updated.")
 
     def sync_combo_boxes_with_core_config(self, core_info):
-        """Synchronize ComboBoxes in signal_database.ui with core configuration data"""
-        # Find the ComboBoxes in signal_database UI
-        build_image_combo = self.findChild(QComboBox, "buildImageComboBox")
-        soc_combo = self.findChild(QComboBox, "socComboBox")
-        board_combo = self.findChild(QComboBox, "boardComboBox")
-        
-        # Also find ComboBoxes in core_configuration UI to ensure they're in sync
-        core_build_image_combo = self.findChild(QComboBox, "coreImageTypeCombo")
-        core_soc_combo = self.findChild(QComboBox, "coreSocCombo")
-        core_board_combo = self.findChild(QComboBox, "coreBoardCombo")
-        
-        # Clear the ComboBoxes
-        if build_image_combo:
-            build_image_combo.clear()
-        
-        if soc_combo:
-            soc_combo.clear()
-        
-        if board_combo:
-            board_combo.clear()
-            
-        # Clear core config ComboBoxes if they exist
-        if core_build_image_combo:
-            core_build_image_combo.clear()
-        
-        if core_soc_combo:
-            core_soc_combo.clear()
-        
-        if core_board_combo:
-            core_board_combo.clear()
-        
-        # Populate build image ComboBox
-        if 'image_types' in core_info:
-            for image_type in core_info['image_types']:
-                # Add to signal database combo
-                if build_image_combo:
-                    build_image_combo.addItem(image_type)
-                # Add to core config combo
-                if core_build_image_combo:
-                    core_build_image_combo.addItem(image_type)
-        
-        # Populate SoC ComboBox
-        if 'socs' in core_info:
-            for soc in core_info['socs']:
-                # Add to signal database combo
-                if soc_combo:
-                    soc_combo.addItem(soc)
-                # Add to core config combo
-                if core_soc_combo:
-                    core_soc_combo.addItem(soc)
-        
-        # Populate board ComboBox
-        if 'boards' in core_info:
-            for board in core_info['boards']:
-                # Add to signal database combo
-                if board_combo:
-                    board_combo.addItem(board)
-                # Add to core config combo
-                if core_board_combo:
-                    core_board_combo.addItem(board)
-        
-        # Connect signals and slots for synchronization between UIs
-        # Only connect if not already connected (avoid multiple connections)
-        if build_image_combo and core_build_image_combo:
-            # Disconnect existing connections if any
-            try:
-                build_image_combo.currentIndexChanged.disconnect()
-                core_build_image_combo.currentIndexChanged.disconnect()
-            except TypeError:
-                pass  # No connections to disconnect
-                
-            # Connect new signals
-            build_image_combo.currentIndexChanged.connect(
-                lambda idx: core_build_image_combo.setCurrentIndex(idx) if core_build_image_combo.count() > idx else None)
-            core_build_image_combo.currentIndexChanged.connect(
-                lambda idx: build_image_combo.setCurrentIndex(idx) if build_image_combo.count() > idx else None)
-        
-        if soc_combo and core_soc_combo:
-            # Disconnect existing connections if any
-            try:
-                soc_combo.currentIndexChanged.disconnect()
-                core_soc_combo.currentIndexChanged.disconnect()
-            except TypeError:
-                pass  # No connections to disconnect
-                
-            # Connect new signals
-            soc_combo.currentIndexChanged.connect(
-                lambda idx: core_soc_combo.setCurrentIndex(idx) if core_soc_combo.count() > idx else None)
-            core_soc_combo.currentIndexChanged.connect(
-                lambda idx: soc_combo.setCurrentIndex(idx) if soc_combo.count() > idx else None)
-        
-        if board_combo and core_board_combo:
-            # Disconnect existing connections if any
-            try:
-                board_combo.currentIndexChanged.disconnect()
-                core_board_combo.currentIndexChanged.disconnect()
-            except TypeError:
-                pass  # No connections to disconnect
-                
-            # Connect new signals
-            board_combo.currentIndexChanged.connect(
-                lambda idx: core_board_combo.setCurrentIndex(idx) if core_board_combo.count() > idx else None)
-            core_board_combo.currentIndexChanged.connect(
-                lambda idx: board_combo.setCurrentIndex(idx) if board_combo.count() > idx else None)
+        """Synchronize ComboBoxes in signal_database.ui with core configuration data
+        
+        The signal database combo box and the core configuration combo box of
+        a category share one QStringListModel, so a new configuration is one
+        model reset per category however many combo boxes show it.
+        """
+        # Find the ComboBoxes in signal_database UI, and the ComboBoxes in
+        # core_configuration UI to ensure they're in sync
+        (build_image_combo, soc_combo, board_combo,
+         core_build_image_combo, core_soc_combo, core_board_combo) = self.widgets.fetch(
+            "sync_combo_boxes_with_core_config", "buildImageComboBox", "socComboBox", "boardComboBox",
+            "coreImageTypeCombo", "coreSocCombo", "coreBoardCombo")
+        
+        for category, combo, core_combo in (("image_types", build_image_combo, core_build_image_combo),
+                                            ("socs", soc_combo, core_soc_combo),
+                                            ("boards", board_combo, core_board_combo)):
+            model = self.core_config_models.get(category)
+            if model is None:
+                model = self.core_config_models[category] = QStringListModel(self)
+                for box in (combo, core_combo):
+                    if box:
+                        box.setModel(model)
                 
+                # Keep the selections of both UIs in sync (connected once, as
+                # the combo boxes keep their model)
+                if combo and core_combo:
+                    combo.currentIndexChanged.connect(
+                        lambda idx, other=core_combo: other.setCurrentIndex(idx) if other.count() > idx else None)
+                    core_combo.currentIndexChanged.connect(
+                        lambda idx, other=combo: other.setCurrentIndex(idx) if other.count() > idx else None)
+            
+            # Populate the ComboBoxes, skipping the reset if nothing changed
+            values = [str(value) for value in core_info.get(category, [])]
+            if model.stringList() != values:
+                model.setStringList(values)
+        
         # Also update the source_combo in SignalDetailsDialog if it exists
         signal_details_dialogs = self.findChildren(QDialog)
         for dialog in signal_details_dialogs:
@@ -1203,17 +1294,22 @@ class SignalManagerApp(QMainWindow):
     def setup_signal_database_page(self):
         """Set up the signal database page"""
         # Find widgets
-        signal_tree = self.findChild(QTreeWidget, "signalTree")
+        signal_tree = self.findChild(QTreeView, "signalTree")
         add_signal_btn = self.findChild(QPushButton, "addSignalBtn")
         delete_signal_btn = self.findChild(QPushButton, "deleteSignalBtn")
         edit_signal_btn = self.findChild(QPushButton, "editSignalBtn")
         save_signal_btn = self.findChild(QPushButton, "saveSignalBtn")
         cancel_btn = self.findChild(QPushButton, "cancelBtn")
+        signal_search_input = self.findChild(QLineEdit, "signalSearchInput")
+        filter_btn = self.findChild(QPushButton, "filterBtn")
         signal_details_card = self.findChild(QFrame, "signal_details_card")
         
+        group_signals_check = self.findChild(QCheckBox, "groupSignalsCheck")
+        
         # Connect signals
         if signal_tree:
-            signal_tree.itemSelectionChanged.connect(self.on_signal_selected)
+            # Also connects the selection model, which only exists once the view has its model
+            self.update_signal_tree()
         
         if add_signal_btn:
             add_signal_btn.clicked.connect(self.add_signal)
@@ -1230,20 +1326,74 @@ class SignalManagerApp(QMainWindow):
         if cancel_btn:
             cancel_btn.clicked.connect(self.cancel_signal_edit)
         
+        if signal_search_input:
+            # Search once typing pauses rather than on every keystroke
+            self.signal_search_timer = QTimer(self)
+            self.signal_search_timer.setSingleShot(True)
+            self.signal_search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+            self.signal_search_timer.timeout.connect(self.apply_signal_search)
+            signal_search_input.textChanged.connect(lambda text: self.signal_search_timer.start())
+        
+        if filter_btn:
+            filter_btn.clicked.connect(self.apply_signal_search)
+        
+        if group_signals_check:
+            group_signals_check.toggled.connect(self.set_signal_grouping)
+        
         # Initialize the signal details section as disabled
         if signal_details_card:
             self.set_signal_details_enabled(False)
     
+    def apply_signal_search(self):
+        """Filter the signal tree by the text of the search box"""
+        signal_search_input, = self.widgets.fetch("apply_signal_search", "signalSearchInput")
+        if not signal_search_input:
+            return
+        
+        # A click on Filter applies the search without waiting for the pause
+        self.signal_search_timer.stop()
+        self.signal_manager.set_signal_search_text(signal_search_input.text())
+        
+        match_count = self.signal_manager.get_signal_filter_model().match_count()
+        if match_count is not None:
+            self.statusBar.showMessage(f"{match_count} signals match \"{signal_search_input.text()}\"", 5000)
+    
+    def set_signal_grouping(self, grouped):
+        """Show the signal tree flat or grouped by board, SoC and build image
+        
+        Args:
+            grouped: True to show the groups
+        """
+        signal_search_input, filter_btn = self.widgets.fetch("set_signal_grouping", "signalSearchInput", "filterBtn")
+        signal_id = self.get_selected_signal_id()
+        
+        self.signal_manager.set_signal_grouping(grouped)
+        self.update_signal_tree()
+        
+        # The search filters the flat list only
+        for widget in (signal_search_input, filter_btn):
+            if widget:
+                widget.setEnabled(not grouped)
+        
+        # Keep the selected signal selected in the other view
+        if signal_id is not None:
+            self.show_signal_in_tree(signal_id)
+        else:
+            self.set_signal_details_enabled(False)
+    
     def set_signal_details_enabled(self, enabled):
         """Enable or disable the signal details section"""
-        signal_details_card = self.findChild(QFrame, "signal_details_card")
+        (signal_details_card, input_widgets, dynamic_attrs_frame,
+         dynamic_attrs_placeholder) = self.widgets.fetch(
+            "set_signal_details_enabled", "signal_details_card", "signal_details_inputs",
+            "dynamicAttrsFrame", "dynamicAttrsPlaceholder")
         if not signal_details_card:
             return
         
-        # Find all input widgets in the signal details card
-        input_widgets = []
-        for input_type in [QLineEdit, QComboBox, QSpinBox, QCheckBox, QPushButton]:
-            input_widgets.extend(signal_details_card.findChildren(input_type))
+        # The registered input widgets come from the UI file; the dynamic
+        # attribute fields are created per signal, so look them up in their frame
+        if dynamic_attrs_frame:
+            input_widgets = input_widgets + dynamic_attrs_frame.findChildren(QLineEdit)
         
         # Enable or disable each widget
         for widget in input_widgets:
@@ -1254,7 +1404,6 @@ class SignalManagerApp(QMainWindow):
             widget.setEnabled(enabled)
         
         # Set visual indicator that the section is disabled
-        dynamic_attrs_placeholder = self.findChild(QLabel, "dynamicAttrsPlaceholder")
         if dynamic_attrs_placeholder:
             if enabled:
                 dynamic_attrs_placeholder.setText("Dynamic attributes based on Core Configuration")
@@ -1263,12 +1412,8 @@ class SignalManagerApp(QMainWindow):
     
     def on_signal_selected(self):
         """Handle signal selection from the tree"""
-        signal_tree = self.findChild(QTreeWidget, "signalTree")
-        if not signal_tree:
-            return
-        
-        selected_items = signal_tree.selectedItems()
-        if not selected_items:
+        signal_id = self.get_selected_signal_id()
+        if signal_id is None:
             # No selection, disable details section
             self.set_signal_details_enabled(False)
             return
@@ -1276,11 +1421,6 @@ class SignalManagerApp(QMainWindow):
         # Enable details section and populate with selected signal data
         self.set_signal_details_enabled(True)
         
-        # Get the selected signal data
-        selected_item = selected_items[0]
-        signal_id = selected_item.text(0)
-        signal_name = selected_item.text(1)
-        
         # Find the signal data in the project data
         signal_data = self.find_signal_by_id(signal_id)
         if signal_data:
@@ -1319,10 +1459,8 @@ class SignalManagerApp(QMainWindow):
             return
         
         # If the user completed all steps, add the signal to the database
+        # (the signal tree model shows the new row by itself)
         self.add_signal_to_database(signal_details)
-        
-        # Refresh the signal tree
-        self.update_signal_tree()
     
     def show_data_type_selection_dialog(self):
         """Show dialog for selecting data type"""
@@ -1588,75 +1726,80 @@ class SignalManagerApp(QMainWindow):
                     array_size_spin.setValue(size_spin.value())
     
     def edit_signal(self):
-        """Edit the selected signal"""
-        # Find the signal tree
-        signal_tree = self.findChild(QTreeWidget, "signalTree")
-        if not signal_tree:
+        """Edit the selected signal, or set attributes on all selected signals"""
+        signal_ids = self.get_selected_signal_ids()
+        if len(signal_ids) > 1:
+            self.bulk_edit_signals(signal_ids)
             return
         
-        # Get the selected signal
-        selected_items = signal_tree.selectedItems()
-        if not selected_items:
+        # Get the selected signal ID
+        signal_id = signal_ids[0] if signal_ids else None
+        if signal_id is None:
             QtWidgets.QMessageBox.warning(self, "Warning", "Please select a signal to edit.")
             return
         
-        # Get the selected signal ID
-        selected_item = selected_items[0]
-        signal_id = selected_item.text(0)
-        
         # Find the signal in the project data
         signal_data = self.find_signal_by_id(signal_id)
         if not signal_data:
             QtWidgets.QMessageBox.warning(self, "Error", f"Signal with ID {signal_id} not found.")
             return
         
-        # Save current state for undo
-        if "signals" in self.project_data:
-            self.signal_edit_stack.append(self.project_data["signals"].copy())
-        
         # Show signal details dialog
         signal_details = SignalDetailsDialog.get_signal_details(self, signal_data)
         if not signal_details:
             return
         
         # Update the signal in the database
+        # (the signal tree model repaints the row by itself)
         self.update_signal_in_database(signal_id, signal_details)
-        
-        # Refresh the signal tree
-        self.update_signal_tree()
     
-    def delete_signal(self):
-        """Delete the selected signal"""
-        # Find the signal tree
-        signal_tree = self.findChild(QTreeWidget, "signalTree")
-        if not signal_tree:
+    def bulk_edit_signals(self, signal_ids):
+        """Set the same attributes on several signals in one update
+        
+        Args:
+            signal_ids: IDs of the selected signals
+        """
+        attributes = BulkEditDialog.get_attributes(self, len(signal_ids))
+        if not attributes:
+            return
+        
+        # One validation pass, one change notification and one undo step, so
+        # the signal tree model repaints the edited rows once
+        updated_ids, errors = self.signal_manager.set_signal_attributes(signal_ids, attributes)
+        if errors:
+            error_lines = [f"{name}: {error}" for name, error in list(errors.items())[:10]]
+            if len(errors) > 10:
+                error_lines.append(f"... and {len(errors) - 10} more")
+            QtWidgets.QMessageBox.warning(self, "Error", "No signal was changed:\n" + "\n".join(error_lines))
             return
         
-        # Get the selected signal
-        selected_items = signal_tree.selectedItems()
-        if not selected_items:
+        self.statusBar.showMessage(f"Updated {len(updated_ids)} signals", 3000)
+    
+    def delete_signal(self):
+        """Delete the selected signals"""
+        signal_ids = self.get_selected_signal_ids()
+        if not signal_ids:
             QtWidgets.QMessageBox.warning(self, "Warning", "Please select a signal to delete.")
             return
         
-        # Get the selected signal ID
-        selected_item = selected_items[0]
-        signal_id = selected_item.text(0)
-        signal_name = selected_item.text(1)
+        if len(signal_ids) == 1:
+            signal_data = self.find_signal_by_id(signal_ids[0]) or {}
+            message = f"Are you sure you want to delete the signal '{signal_data.get('name', '')}'?"
+        else:
+            message = f"Are you sure you want to delete the {len(signal_ids)} selected signals?"
         
         # Confirm deletion
         confirm = QtWidgets.QMessageBox.question(
             self, "Confirm Delete",
-            f"Are you sure you want to delete the signal '{signal_name}'?",
+            message,
             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
             QtWidgets.QMessageBox.No
         )
         
         if confirm == QtWidgets.QMessageBox.Yes:
-            # Delete the signal from the database
-            self.delete_signal_from_database(signal_id)
-            
-            # Refresh the signal tree
-            self.update_signal_tree()
+            # Delete the signals from the database in one batch
+            # (the signal tree model removes the rows by itself)
+            self.delete_signals_from_database(signal_ids)
             
             # Disable the signal details section
             self.set_signal_details_enabled(False)
@@ -1665,7 +1808,11 @@ class SignalManagerApp(QMainWindow):
         """Initialize UI elements and connect signals."""
         # Initialize empty data structures
         self.project_data = {}
-        self.signal_edit_stack = []
+        self.signal_manager.set_project_data(self.project_data)
+        
+        # Lookups and queries go through the database operations, which share
+        # the signal manager's store and so see every edit made through it
+        self.database_ops = DatabaseOperations(self, store=self.signal_manager.store)
         
         # Setup menu operations
         self.menu_ops = MenuOperations(self)
@@ -1690,7 +1837,7 @@ class SignalManagerApp(QMainWindow):
 
     def find_signal_by_id(self, signal_id):
         """Find signal by ID in the project data"""
-        return self.signal_manager.find_signal_by_id(signal_id)
+        return self.database_ops.get_signal(signal_id)
     
     def generate_signal_id(self):
         """Generate a unique signal ID"""
@@ -1706,52 +1853,80 @@ class SignalManagerApp(QMainWindow):
     
     def delete_signal_from_database(self, signal_id):
         """Delete a signal from the database"""
-        # Save current state for potential undo before deleting
-        if "signals" in self.project_data:
-            self.signal_edit_stack.append(self.project_data["signals"].copy())
-            
         return self.signal_manager.delete_signal_from_database(signal_id)
     
+    def delete_signals_from_database(self, signal_ids):
+        """Delete several signals from the database as one undoable change"""
+        return self.signal_manager.delete_signals(signal_ids)
+    
     def update_signal_tree(self):
         """Update the signal tree with current data"""
-        signal_tree = self.findChild(QTreeWidget, "signalTree")
+        signal_tree, = self.widgets.fetch("update_signal_tree", "signalTree")
         if signal_tree:
             self.signal_manager.update_signal_tree(signal_tree)
+            
+            # Each model the view is given comes with a new selection model
+            selection_model = signal_tree.selectionModel()
+            if selection_model is not None and selection_model is not self.signal_selection_model:
+                self.signal_selection_model = selection_model
+                selection_model.selectionChanged.connect(lambda selected, deselected: self.on_signal_selected())
+    
+    def get_selected_signal_id(self):
+        """Get the ID of the signal selected in the signal tree
+        
+        Returns:
+            str: The selected signal ID, or None if no signal is selected
+        """
+        signal_tree, = self.widgets.fetch("get_selected_signal_id", "signalTree")
+        if not signal_tree or not signal_tree.selectionModel():
+            return None
+        
+        # Group rows of the grouped view have no signal ID
+        for index in signal_tree.selectionModel().selectedRows():
+            signal_id = index.data(SignalTreeModel.SIGNAL_ID_ROLE)
+            if signal_id is not None:
+                return signal_id
+        return None
+    
+    def get_selected_signal_ids(self):
+        """Get the IDs of the signals selected in the signal tree
+        
+        Returns:
+            list: The selected signal IDs in selection order, each once even
+                if rows of its properties are selected too; selected group
+                rows are skipped
+        """
+        signal_tree, = self.widgets.fetch("get_selected_signal_ids", "signalTree")
+        if not signal_tree or not signal_tree.selectionModel():
+            return []
+        
+        signal_ids = {}
+        for index in signal_tree.selectionModel().selectedRows():
+            signal_id = index.data(SignalTreeModel.SIGNAL_ID_ROLE)
+            if signal_id is not None:
+                signal_ids[signal_id] = None
+        return list(signal_ids)
     
     def populate_signal_details(self, signal_data):
         """Populate the signal details section with signal data"""
-        # Find all input fields
-        var_port_name_input = self.findChild(QLineEdit, "varPortNameInput")
-        description_input = self.findChild(QLineEdit, "descriptionInput")
-        data_type_combo = self.findChild(QComboBox, "dataTypeCombo")
-        init_value_combo = self.findChild(QComboBox, "initValueCombo")
-        asil_combo = self.findChild(QComboBox, "asilCombo")
-        buffer_count_spin = self.findChild(QSpinBox, "bufferCountSpinBox")
-        notifiers_combo = self.findChild(QComboBox, "notifiersCombo")
-        sm_buff_count_spin = self.findChild(QSpinBox, "smBuffCountSpinBox")
-        timeout_spin = self.findChild(QSpinBox, "timeoutSpinBox")
-        periodicity_spin = self.findChild(QSpinBox, "periodicitySpinBox")
-        checksum_combo = self.findChild(QComboBox, "checksumCombo")
-        
-        # Create a form layout for signal details
-        signal_details_layout = QFormLayout()
-        
         # Find container for signal details
-        details_container = self.findChild(QWidget, "signalDetailsContainer")
+        details_container, = self.widgets.fetch("populate_signal_details", "signalDetailsContainer")
         if details_container:
-            # Clear any existing layout
-            if details_container.layout():
-                # Remove all items from the layout
-                while details_container.layout().count():
-                    item = details_container.layout().takeAt(0)
-                    widget = item.widget()
-                    if widget:
-                        widget.deleteLater()
-                # Delete the layout
-                QWidget().setLayout(details_container.layout())
-            
-            # Set the new layout
-            details_container.setLayout(signal_details_layout)
+            signal_details_layout = details_container.layout()
+            # Keep the form layout between selections so its rows are reused
+            if not isinstance(signal_details_layout, QFormLayout):
+                if signal_details_layout:
+                    # Remove all items from the layout
+                    while signal_details_layout.count():
+                        item = signal_details_layout.takeAt(0)
+                        widget = item.widget()
+                        if widget:
+                            widget.deleteLater()
+                    # Delete the layout
+                    QWidget().setLayout(signal_details_layout)
+                
+                signal_details_layout = QFormLayout()
+                details_container.setLayout(signal_details_layout)
             
             # Use the SignalManager to populate details
             self.signal_manager.populate_signal_details(self, signal_data, signal_details_layout)
@@ -1762,7 +1937,7 @@ class SignalManagerApp(QMainWindow):
     def populate_dynamic_attributes(self, signal_data):
         """Populate dynamic attributes based on core configuration"""
         # Find the dynamic attributes frame
-        dynamic_attrs_frame = self.findChild(QFrame, "dynamicAttrsFrame")
+        dynamic_attrs_frame, = self.widgets.fetch("populate_dynamic_attributes", "dynamicAttrsFrame")
         if not dynamic_attrs_frame:
             return
         
@@ -1808,19 +1983,10 @@ class SignalManagerApp(QMainWindow):
     
     def save_signal(self):
         """Save changes to the current signal"""
-        # Find the signal tree
-        signal_tree = self.findChild(QTreeWidget, "signalTree")
-        if not signal_tree:
-            return
-        
-        # Get the selected signal
-        selected_items = signal_tree.selectedItems()
-        if not selected_items:
-            return
-        
         # Get the selected signal ID
-        selected_item = selected_items[0]
-        signal_id = selected_item.text(0)
+        signal_id = self.get_selected_signal_id()
+        if signal_id is None:
+            return
         
         # Collect data from form
         signal_data = self.collect_signal_form_data()
@@ -1831,10 +1997,6 @@ class SignalManagerApp(QMainWindow):
         # Update the signal in the database
         self.update_signal_in_database(signal_id, signal_data)
         
-        # Update the signal name in the tree if it changed
-        if "name" in signal_data:
-            selected_item.setText(1, signal_data["name"])
-        
         # Show success message
         QMessageBox.information(self, "Success", "Signal updated successfully.")
     
@@ -1845,17 +2007,12 @@ class SignalManagerApp(QMainWindow):
         
         # Add any additional signal-specific data collection here
         # Find all input fields
-        var_port_name_input = self.findChild(QLineEdit, "varPortNameInput")
-        description_input = self.findChild(QLineEdit, "descriptionInput")
-        data_type_combo = self.findChild(QComboBox, "dataTypeCombo")
-        init_value_combo = self.findChild(QComboBox, "initValueCombo")
-        asil_combo = self.findChild(QComboBox, "asilCombo")
-        buffer_count_spin = self.findChild(QSpinBox, "bufferCountSpinBox")
-        notifiers_combo = self.findChild(QComboBox, "notifiersCombo")
-        sm_buff_count_spin = self.findChild(QSpinBox, "smBuffCountSpinBox")
-        timeout_spin = self.findChild(QSpinBox, "timeoutSpinBox")
-        periodicity_spin = self.findChild(QSpinBox, "periodicitySpinBox")
-        checksum_combo = self.findChild(QComboBox, "checksumCombo")
+        (var_port_name_input, description_input, data_type_combo, init_value_combo, asil_combo,
+         buffer_count_spin, notifiers_combo, sm_buff_count_spin, timeout_spin, periodicity_spin,
+         checksum_combo) = self.widgets.fetch(
+            "collect_signal_form_data", "varPortNameInput", "descriptionInput", "dataTypeCombo",
+            "initValueCombo", "asilCombo", "bufferCountSpinBox", "notifiersCombo", "smBuffCountSpinBox",
+            "timeoutSpinBox", "periodicitySpinBox", "checksumCombo")
         
         # Collect data from each field
         if var_port_name_input:
@@ -1895,22 +2052,13 @@ class SignalManagerApp(QMainWindow):
     
     def cancel_signal_edit(self):
         """Cancel editing the signal"""
-        # Find the signal tree
-        signal_tree = self.findChild(QTreeWidget, "signalTree")
-        if not signal_tree:
-            return
-        
-        # Get the selected signal
-        selected_items = signal_tree.selectedItems()
-        if not selected_items:
+        # Get the selected signal ID
+        signal_id = self.get_selected_signal_id()
+        if signal_id is None:
             # If no signal is selected, just disable the form
             self.set_signal_details_enabled(False)
             return
         
-        # Get the selected signal ID
-        selected_item = selected_items[0]
-        signal_id = selected_item.text(0)
-        
         # Re-populate form with original signal data
         signal_data = self.find_signal_by_id(signal_id)
         if signal_data:
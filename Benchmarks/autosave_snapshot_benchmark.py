@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for the autosave snapshot
+
+Compares, for a 100k-signal project, the time the GUI thread spends on an
+autosave (taking the snapshot) with copy.deepcopy of the project and with
+writing the file itself, which the AutoSaver leaves to its worker thread.
+"""
+
+import copy
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from Modules.FileOperation.AutoSaver import snapshot_project_data
+from Modules.SignalOperations.SignalRecord import json_default, signals_from_json
+
+SIGNAL_COUNT = 100000
+REPEAT = 5
+
+
+def make_project(count):
+    """Create a synthetic project"""
+    signals = [{"id": f"{i:08x}", "name": f"Signal_{i}", "data_type": "UINT32", "timeout": 100,
+                "description": f"Synthetic signal number {i}"} for i in range(count)]
+    return {"version": {"number": "1.0", "change_description": "Benchmark"},
+            "core_info": {"socs": [f"SoC_{i}" for i in range(4)], "boards": [f"Board_{i}" for i in range(8)]},
+            "signals": signals_from_json(signals)}
+
+
+def timed(label, func, repeat=REPEAT):
+    """Run func repeat times and print the mean time"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    print(f"{label:<28} {(time.perf_counter() - start) * 1000 / repeat:>9.1f} ms")
+
+
+def write(path, project_data):
+    """Write the project as FileOperations.write_config_file does"""
+    with open(path, "w") as f:
+        json.dump(project_data, f, indent=4, default=json_default)
+
+
+def run():
+    """Run the benchmark and print timings"""
+    project_data = make_project(SIGNAL_COUNT)
+    print(f"{SIGNAL_COUNT} signals")
+    timed("snapshot (GUI thread)", lambda: snapshot_project_data(project_data))
+    timed("copy.deepcopy", lambda: copy.deepcopy(project_data), repeat=1)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "recovery.smgr")
+        timed("json.dump (worker thread)", lambda: write(path, project_data), repeat=1)
+
+
+if __name__ == "__main__":
+    run()
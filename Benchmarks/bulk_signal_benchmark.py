@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for the SignalManager batch API
+
+Imports 20k signals one at a time (validate + add per signal, one change
+notification each) and through add_signals, then compares the batch update
+and delete calls with their per-signal equivalents.
+"""
+
+import os
+import sys
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from Modules.SignalOperations.SignalManager import SignalManager
+
+BATCH_SIZE = 20000
+
+
+def make_signals(count, prefix="Signal"):
+    """Create a list of synthetic signals without IDs"""
+    return [{"name": f"{prefix}_{i}", "data_type": "UINT32"} for i in range(count)]
+
+
+def timed(label, func):
+    """Run func once and print how long it took"""
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<32} {(time.perf_counter() - start) * 1000:>9.1f} ms")
+    return result
+
+
+def one_at_a_time(manager, signals):
+    """Import the signals through the single-signal API"""
+    notifications = []
+    manager.add_change_listener(lambda event, ids: notifications.append(event))
+    for signal in signals:
+        valid, _ = manager.validate_signal_data(signal)
+        if valid:
+            manager.add_signal_to_database(signal)
+    return len(notifications)
+
+
+def in_one_batch(manager, signals):
+    """Import the signals through add_signals"""
+    notifications = []
+    manager.add_change_listener(lambda event, ids: notifications.append(event))
+    manager.add_signals(signals)
+    return len(notifications)
+
+
+def run():
+    """Run the benchmark and print timings"""
+    single = SignalManager()
+    single.set_project_data({})
+    count = timed(f"add {BATCH_SIZE} one at a time", lambda: one_at_a_time(single, make_signals(BATCH_SIZE)))
+    print(f"{'':<32} {count} notifications")
+
+    batch = SignalManager()
+    batch.set_project_data({})
+    count = timed(f"add_signals({BATCH_SIZE})", lambda: in_one_batch(batch, make_signals(BATCH_SIZE)))
+    print(f"{'':<32} {count} notification")
+
+    ids = [signal["id"] for signal in batch.project_data["signals"]]
+    updates = {signal_id: {"name": f"Renamed_{signal_id}", "data_type": "UINT8"} for signal_id in ids}
+    timed(f"update_signals({BATCH_SIZE})", lambda: batch.update_signals(updates))
+    timed(f"update {BATCH_SIZE} one at a time",
+          lambda: [single.update_signal_in_database(signal["id"], dict(signal))
+                   for signal in list(single.project_data["signals"])])
+
+    timed(f"delete_signals({BATCH_SIZE // 2})", lambda: batch.delete_signals(ids[::2]))
+    single_ids = [signal["id"] for signal in single.project_data["signals"]]
+    timed(f"delete {BATCH_SIZE // 2} one at a time",
+          lambda: [single.delete_signal_from_database(signal_id) for signal_id in single_ids[::2]])
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for the SignalColumnStore analytics
+
+Compares a range filter, a grouped sum and a histogram over 100k signals
+computed from the column store with the same loops over the signal
+dictionaries.
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from Modules.SignalOperations.SignalColumns import SignalColumnStore
+
+SIGNAL_COUNT = 100000
+BINS = [0, 10, 50, 100, 500, 1000]
+
+
+def make_signals(count, seed=0):
+    """Create a list of synthetic signals"""
+    rng = random.Random(seed)
+    return [{
+        "id": f"{i:08x}",
+        "memory_region": rng.choice(["DDR", "SRAM", "TCM"]),
+        "sm_buff_count": rng.randrange(1, 8),
+        "timeout": rng.randrange(1000),
+        "periodicity": rng.choice([10, 20, 50, 100]),
+    } for i in range(count)]
+
+
+def timed(label, func):
+    """Run func once and print how long it took"""
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<40} {(time.perf_counter() - start) * 1000:>9.2f} ms")
+    return result
+
+
+def loop_sum_by(signals):
+    """Total SM buffers per memory region with a Python loop"""
+    totals = {}
+    for signal in signals:
+        region = signal.get("memory_region")
+        totals[region] = totals.get(region, 0) + signal.get("sm_buff_count", 0)
+    return totals
+
+
+def loop_histogram(signals):
+    """Timeout histogram with a Python loop"""
+    counts = [0] * (len(BINS) - 1)
+    for signal in signals:
+        timeout = signal["timeout"]
+        for index in range(len(BINS) - 1):
+            if BINS[index] <= timeout < BINS[index + 1]:
+                counts[index] += 1
+                break
+    return counts
+
+
+def run():
+    """Run the benchmark and print timings"""
+    signals = make_signals(SIGNAL_COUNT)
+    for use_numpy in (True, False):
+        store = timed(f"load ({'numpy' if use_numpy else 'array'})",
+                      lambda: SignalColumnStore(signals, use_numpy=use_numpy))
+        if use_numpy and not store.use_numpy:
+            print("NumPy is not installed, skipping the NumPy run")
+            continue
+        timed("  ids_in_range(timeout, 100, 200)", lambda: store.ids_in_range("timeout", 100, 200))
+        timed("  sum_by(sm_buff_count, memory_region)", lambda: store.sum_by("sm_buff_count", "memory_region"))
+        timed("  histogram(timeout)", lambda: store.histogram("timeout", BINS))
+
+    print("dict loops")
+    timed("  range filter", lambda: {s["id"] for s in signals if 100 <= s["timeout"] <= 200})
+    timed("  sum per memory region", lambda: loop_sum_by(signals))
+    timed("  histogram", lambda: loop_histogram(signals))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for filling the core configuration combo boxes
+
+Fills the six combo boxes of the image type, SoC and board lists (one on
+the signal database page and one on the core configuration page per list)
+from a configuration with many boards and image types, once with clear()
+and addItem per entry as a project load used to, and once through one
+shared QStringListModel per list. Runs offscreen when no display is set.
+"""
+
+import os
+import sys
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QStringListModel
+from PyQt5.QtWidgets import QApplication, QComboBox, QVBoxLayout, QWidget
+
+CATEGORIES = ("image_types", "socs", "boards")
+LOAD_COUNT = 20
+
+
+def make_core_info(size):
+    """Create a core configuration with size boards, size // 4 images and size // 20 SoCs"""
+    return {
+        "image_types": [f"Image_{i}" for i in range(size // 4)],
+        "socs": [f"SoC_{i}" for i in range(max(size // 20, 1))],
+        "boards": [f"Board_{i}" for i in range(size)],
+    }
+
+
+def make_combos():
+    """Create a page holding two combo boxes per category"""
+    page = QWidget()
+    layout = QVBoxLayout(page)
+    combos = {}
+    for category in CATEGORIES:
+        combos[category] = (QComboBox(), QComboBox())
+        for combo in combos[category]:
+            layout.addWidget(combo)
+    page.show()
+    return page, combos
+
+
+def fill_items(combos, core_info):
+    """Clear the combo boxes and add the entries one by one"""
+    for category in CATEGORIES:
+        for combo in combos[category]:
+            combo.clear()
+        for value in core_info[category]:
+            for combo in combos[category]:
+                combo.addItem(value)
+
+
+def fill_models(models, core_info):
+    """Reset each shared model once"""
+    for category in CATEGORIES:
+        values = [str(value) for value in core_info[category]]
+        if models[category].stringList() != values:
+            models[category].setStringList(values)
+
+
+def timed_loads(app, fill, configs):
+    """Return the mean time in milliseconds of filling the combo boxes with each config"""
+    start = time.perf_counter()
+    for core_info in configs:
+        fill(core_info)
+        app.processEvents()
+    return (time.perf_counter() - start) * 1000 / len(configs)
+
+
+def run():
+    """Run the benchmark and print timings"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    for size in (100, 1000, 5000):
+        # Alternate between two configurations, as loading different projects does
+        configs = [make_core_info(size + i % 2) for i in range(LOAD_COUNT)]
+
+        item_page, item_combos = make_combos()
+        items = timed_loads(app, lambda core_info: fill_items(item_combos, core_info), configs)
+
+        model_page, model_combos = make_combos()
+        models = {category: QStringListModel() for category in CATEGORIES}
+        for category in CATEGORIES:
+            for combo in model_combos[category]:
+                combo.setModel(models[category])
+        shared = timed_loads(app, lambda core_info: fill_models(models, core_info), configs)
+
+        print(f"{size:>5} boards: {shared:>8.2f} ms shared models  {items:>8.2f} ms addItem per load")
+        item_page.close()
+        model_page.close()
+
+
+if __name__ == "__main__":
+    run()
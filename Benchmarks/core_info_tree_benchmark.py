@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for showing the core configuration in the Core Info tree
+
+Shows a synthetic configuration of 24 SoCs with 40 cores each in a
+QTreeView through CoreInfoTreeModel, and in a QTreeWidget built eagerly
+item by item as the tree used to be, every SoC expanded. Then times showing
+the same configuration again and one with a single changed property, as
+update_ui_from_data does after every configuration change. Runs offscreen
+when no display is set.
+"""
+
+import copy
+import os
+import sys
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QApplication, QTreeView, QTreeWidget, QTreeWidgetItem
+
+from Modules.Dialogs.CoreConfigurationManager.CoreInfoTreeModel import CoreInfoTreeModel
+
+SOC_COUNT = 24
+CORE_COUNT = 40
+
+PROPERTIES = ("core_type", "os", "clock_mhz", "cache_kb", "memory_region", "safety_level",
+              "ipc_channel", "ipc_priority", "boot_order", "shared_memory_kb")
+
+
+def make_core_info():
+    """Create a synthetic core configuration"""
+    core_properties = {}
+    for soc in range(SOC_COUNT):
+        soc_name = f"SoC_{soc}"
+        core_properties[soc_name] = {}
+        for core in range(CORE_COUNT):
+            core_name = f"Core_{soc}_{core}"
+            properties = {"name": core_name}
+            properties.update({prop_name: f"{prop_name}_{core % 7}" for prop_name in PROPERTIES})
+            core_properties[soc_name][core_name] = properties
+    return {"socs": list(core_properties), "core_properties": core_properties}
+
+
+def build_tree_widget(tree_widget, core_info):
+    """Fill a QTreeWidget item by item as the Core Info tree used to be"""
+    tree_widget.clear()
+    tree_widget.setHeaderLabels(["Property", "Value"])
+    core_properties_item = QTreeWidgetItem(tree_widget, ["Core Properties", ""])
+    core_properties_item.setBackground(0, QColor("#e0e0e0"))
+    core_properties_item.setBackground(1, QColor("#e0e0e0"))
+    for soc_name, cores in core_info["core_properties"].items():
+        soc_item = QTreeWidgetItem(core_properties_item, [soc_name, ""])
+        soc_item.setBackground(0, QColor("#f0f0f0"))
+        for core_name, properties in cores.items():
+            core_item = QTreeWidgetItem(soc_item, [core_name, ""])
+            core_item.setBackground(0, QColor("#f8f8f8"))
+            for prop_name, prop_value in properties.items():
+                if prop_name != 'name':
+                    QTreeWidgetItem(core_item, [prop_name.replace('_', ' ').title(), str(prop_value)])
+        soc_item.setExpanded(True)
+    core_properties_item.setExpanded(True)
+
+
+def show_model(tree_view, core_info):
+    """Show a configuration through the view's CoreInfoTreeModel"""
+    for index in tree_view.model().set_core_info(core_info):
+        tree_view.expand(index)
+
+
+def timed(app, func):
+    """Return the time of func and the event processing after it in milliseconds"""
+    start = time.perf_counter()
+    func()
+    app.processEvents()
+    return (time.perf_counter() - start) * 1000
+
+
+def run():
+    """Run the benchmark and print timings"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    core_info = make_core_info()
+    changed = copy.deepcopy(core_info)
+    changed["core_properties"]["SoC_3"]["Core_3_5"]["os"] = "QNX"
+    print(f"{SOC_COUNT} SoCs, {SOC_COUNT * CORE_COUNT} cores, {len(PROPERTIES)} properties per core")
+
+    tree_widget = QTreeWidget()
+    tree_widget.show()
+    tree_view = QTreeView()
+    tree_view.setModel(CoreInfoTreeModel(tree_view))
+    tree_view.show()
+    for label, data in (("first show", core_info), ("same again", core_info), ("one change", changed)):
+        eager = timed(app, lambda: build_tree_widget(tree_widget, data))
+        lazy = timed(app, lambda: show_model(tree_view, data))
+        print(f"{label:>11}: {lazy:>8.2f} ms model  {eager:>8.2f} ms QTreeWidget")
+
+
+if __name__ == "__main__":
+    run()
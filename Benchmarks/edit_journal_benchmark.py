@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for the edit journal
+
+Journals 5,000 single-signal edits of a 100k-signal project and compares
+the cost per edit with rewriting the whole project file as save_project
+does (5 saves, the rest is extrapolated). Then replays the journal onto
+the signals read from the project file, as load_config_file does.
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from Modules.FileOperation.EditJournal import EditJournal
+from Modules.SignalOperations.SignalRecord import json_default
+from Modules.SignalOperations.SignalStore import SignalStore
+
+SIGNAL_COUNT = 100000
+EDIT_COUNT = 5000
+SAVE_COUNT = 5
+
+
+def make_signals(count):
+    """Create a list of synthetic signals"""
+    return [{"id": f"{i:08x}", "name": f"Signal_{i}", "data_type": "UINT32", "timeout": 100,
+             "description": f"Synthetic signal number {i}"} for i in range(count)]
+
+
+def edit(store, rng, step):
+    """Rename, add or delete a random signal"""
+    choice = rng.random()
+    if choice < 0.8:
+        signal = dict(store.signals[rng.randrange(len(store.signals))])
+        signal["name"] = f"Edited_{step}"
+        store.replace(signal["id"], signal)
+    elif choice < 0.9:
+        store.add({"name": f"Added_{step}", "data_type": "UINT8"})
+    else:
+        store.remove(store.signals[rng.randrange(len(store.signals))]["id"])
+
+
+def timed_edits(path, journaled):
+    """Apply EDIT_COUNT edits to the project at path, returning (ms, store, journal size)"""
+    rng = random.Random(0)
+    with open(path) as f:
+        store = SignalStore(json.load(f)["signals"])
+    journal = EditJournal(path)
+    if journaled:
+        journal.start(store)
+
+    start = time.perf_counter()
+    for step in range(EDIT_COUNT):
+        edit(store, rng, step)
+    journal.sync()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    size = os.path.getsize(journal.path) if journaled else 0
+    return elapsed_ms, store, size
+
+
+def run():
+    """Run the benchmark and print timings"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "project.smgr")
+        with open(path, "w") as f:
+            json.dump({"signals": make_signals(SIGNAL_COUNT)}, f, indent=4)
+
+        store_ms, store, _ = timed_edits(path, journaled=False)
+        journal_ms, _, size = timed_edits(path, journaled=True)
+
+        save_path = os.path.join(directory, "save.smgr")
+        start = time.perf_counter()
+        for _ in range(SAVE_COUNT):
+            with open(save_path, "w") as f:
+                json.dump({"signals": store.signals}, f, indent=4, default=json_default)
+        save_ms = (time.perf_counter() - start) * 1000 / SAVE_COUNT
+
+        # Replay the journal onto a fresh load
+        with open(path) as f:
+            signals = json.load(f)["signals"]
+        start = time.perf_counter()
+        replayed = EditJournal(path).replay(signals)
+        replay_ms = (time.perf_counter() - start) * 1000
+
+    # The store's own work is timed without a journal and taken out
+    record_us = (journal_ms - store_ms) * 1000 / EDIT_COUNT
+    print(f"{SIGNAL_COUNT} signals, {EDIT_COUNT} edits")
+    print(f"{'journal':>12}: {record_us:>10.1f} us/edit on top of the store ({size / 1024:.0f} KiB journal)")
+    print(f"{'full save':>12}: {save_ms * 1000:>10.1f} us/save")
+    print(f"{'replay':>12}: {replay_ms:>10.1f} ms for {replayed} records")
+
+
+if __name__ == "__main__":
+    run()
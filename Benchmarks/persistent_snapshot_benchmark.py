@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for the persistent signal snapshots
+
+Applies 2,000 single-signal edits to a 100k-signal store with a
+SignalSnapshots index attached, taking a snapshot after every edit, and
+compares it with taking a copy.deepcopy of the signals list (5 copies,
+the rest is extrapolated). Then diffs the last snapshot against the saved
+one and against the previous snapshot, and times the unsaved-changes check
+(answered from the IDs tracked as edits come in, without a diff).
+"""
+
+import copy
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from Modules.SignalOperations.SignalStore import SignalStore
+from Modules.SignalOperations.SignalSnapshots import SignalSnapshots
+
+SIGNAL_COUNT = 100000
+EDIT_COUNT = 2000
+DEEPCOPY_COUNT = 5
+
+
+def make_signals(count):
+    """Create a list of synthetic signals"""
+    return [{"id": f"{i:08x}", "name": f"Signal_{i}", "data_type": "UINT32", "timeout": 100,
+             "description": f"Synthetic signal number {i}"} for i in range(count)]
+
+
+def edit(store, rng, step):
+    """Rename a random signal"""
+    signal = store.signals[rng.randrange(len(store.signals))]
+    updated = dict(signal)
+    updated["name"] = f"Edited_{step}"
+    store.replace(signal["id"], updated)
+
+
+def run_snapshots():
+    """Time and measure persistent snapshots"""
+    rng = random.Random(0)
+    store = SignalStore(make_signals(SIGNAL_COUNT))
+    snapshots = SignalSnapshots()
+    start = time.perf_counter()
+    store.attach(snapshots)
+    build_ms = (time.perf_counter() - start) * 1000
+    snapshots.mark_saved()
+
+    taken = []
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    for step in range(EDIT_COUNT):
+        edit(store, rng, step)
+        taken.append(snapshots.snapshot())
+    edit_ms = (time.perf_counter() - start) * 1000
+    kept = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    added, removed, changed = snapshots.saved.diff(snapshots.current)
+    saved_diff_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    taken[-2].diff(taken[-1])
+    step_diff_us = (time.perf_counter() - start) * 1000000
+    start = time.perf_counter()
+    snapshots.is_modified()
+    check_ms = (time.perf_counter() - start) * 1000
+    return build_ms, edit_ms, kept, saved_diff_ms, len(changed), step_diff_us, check_ms
+
+
+def run_deepcopies():
+    """Time and measure deep copies of the signals list"""
+    rng = random.Random(0)
+    store = SignalStore(make_signals(SIGNAL_COUNT))
+    taken = []
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    for step in range(DEEPCOPY_COUNT):
+        edit(store, rng, step)
+        taken.append(copy.deepcopy(store.signals))
+    edit_ms = (time.perf_counter() - start) * 1000
+    kept = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    tracemalloc.stop()
+    scale = EDIT_COUNT / DEEPCOPY_COUNT
+    return edit_ms * scale, kept * scale
+
+
+def run():
+    """Run the benchmark and print timings"""
+    print(f"{SIGNAL_COUNT} signals, {EDIT_COUNT} edits, one snapshot per edit")
+    build_ms, edit_ms, kept, saved_diff_ms, changed, step_diff_us, check_ms = run_snapshots()
+    print(f"{'persistent map':>15}: build {build_ms:.1f} ms, edits + snapshots {edit_ms:>9.1f} ms "
+          f"({edit_ms * 1000 / EDIT_COUNT:.1f} us/edit)  kept {kept / 1024 / 1024:>8.2f} MiB")
+    print(f"{'':>15}  diff with saved {saved_diff_ms:.1f} ms ({changed} changed), "
+          f"diff with previous {step_diff_us:.1f} us, unsaved check {check_ms * 1000:.1f} us")
+    edit_ms, kept = run_deepcopies()
+    print(f"{'deepcopy':>15}: edits + snapshots {edit_ms:>9.1f} ms "
+          f"({edit_ms * 1000 / EDIT_COUNT:.1f} us/edit)  kept {kept / 1024 / 1024:>8.2f} MiB")
+
+
+if __name__ == "__main__":
+    run()
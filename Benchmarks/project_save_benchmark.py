@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for saving a project file
+
+Writes a 100k-signal project (Signal records, as loaded from a file) with
+the previous json.dump(indent=4) into the file, and with the atomic,
+streaming writer in indented and compact form. Reports the time, file size,
+throughput and peak memory of each, and checks compact mode against its
+throughput target.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from Modules.FileOperation.ProjectWriter import write_project_file
+from Modules.SignalOperations.SignalRecord import json_default, signals_from_json
+
+SIGNAL_COUNT = 100000
+
+# Throughput the compact mode must reach, in MB of output per second. Each
+# record costs about as much to convert to a dict as to encode, which caps
+# it well below the ~65 MB/s the C encoder reaches on plain dicts
+COMPACT_TARGET_MB_S = 20
+
+
+def make_project(count):
+    """Create a project with synthetic signals"""
+    signals = [{"id": f"{i:08x}", "name": f"Signal_{i}", "data_type": "UINT32", "timeout": 100,
+                "asil": "B", "memory_region": "DDR", "periodicity": 10, "sm_buff_count": 2,
+                "description": f"Synthetic signal number {i}"} for i in range(count)]
+    return {"version_info": {"version": "1.0", "updated_by": "benchmark"},
+            "core_info": {"soc_list": ["SoC_A", "SoC_B"]},
+            "signals": signals_from_json(signals)}
+
+
+def dump_in_place(path, project_data):
+    """The previous save: json.dump straight into the target file"""
+    with open(path, "w") as f:
+        json.dump(project_data, f, indent=4, default=json_default)
+
+
+def measure(write, path, project_data):
+    """Time a write and measure its peak memory
+
+    Returns:
+        tuple: (seconds, file size in bytes, peak traced bytes)
+    """
+    start = time.perf_counter()
+    write(path, project_data)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    write(path, project_data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, os.path.getsize(path), peak
+
+
+def run():
+    """Run the benchmark and print timings"""
+    project_data = make_project(SIGNAL_COUNT)
+    writers = [
+        ("json.dump", dump_in_place),
+        ("streamed", lambda path, data: write_project_file(path, data)),
+        ("compact", lambda path, data: write_project_file(path, data, compact=True)),
+    ]
+    print(f"{SIGNAL_COUNT} signals")
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "project.smgr")
+        for name, write in writers:
+            seconds, size, peak = measure(write, path, project_data)
+            results[name] = size / seconds / 1e6
+            print(f"{name:>10}: {seconds * 1000:>8.1f} ms  {size / 1e6:>6.1f} MB  "
+                  f"{results[name]:>6.1f} MB/s  peak {peak / 1024 / 1024:>6.1f} MiB")
+    met = "met" if results["compact"] >= COMPACT_TARGET_MB_S else "MISSED"
+    print(f"compact target {COMPACT_TARGET_MB_S} MB/s: {met}")
+
+
+if __name__ == "__main__":
+    run()
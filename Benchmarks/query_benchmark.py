@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for DatabaseOperations.query
+
+Runs a set of compound queries against 100k synthetic signals, once through
+the query planner and once as a plain scan over every signal.
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from Modules.DataBaseOperation.database_operations import DatabaseOperations
+from Modules.DataBaseOperation.query_engine import Eq, In, Prefix, Range, Regex
+
+SIGNAL_COUNT = 100000
+
+
+def make_signals(count, seed=0):
+    """Create a list of synthetic signals"""
+    rng = random.Random(seed)
+    return [{
+        "id": f"{i:08x}",
+        "name": f"Signal_{rng.randrange(10 ** 6)}",
+        "board": rng.choice(["DCu1", "DCu2", "ZCU"]),
+        "soc": rng.choice(["SoC_A", "SoC_B"]),
+        "asil": rng.choice(["QM", "A", "B", "C", "D"]),
+        "timeout": rng.randrange(1000),
+        "periodicity": rng.choice([10, 20, 50, 100]),
+    } for i in range(count)]
+
+
+QUERIES = [
+    Eq("asil", "D") & Range("timeout", 10, 20),
+    Prefix("name", "Signal_12"),
+    Regex("name", "^Signal_1234"),
+    In("asil", ["A", "B"]) & Range("timeout", high=5),
+    Range("timeout", 0, 3) | (Eq("board", "ZCU") & Prefix("name", "Signal_99")),
+    Eq("board", "DCu1") & Eq("soc", "SoC_B"),
+]
+
+
+def timed(func, repeat=5):
+    """Return the best time of func in milliseconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run():
+    """Run the benchmark and print timings"""
+    database = DatabaseOperations()
+    database.load_signals({"signals": make_signals(SIGNAL_COUNT)})
+
+    print(f"{SIGNAL_COUNT} signals")
+    for predicate in QUERIES:
+        indexed = timed(lambda: database.query(predicate))
+        scanned = timed(lambda: [signal for signal in database.signals if predicate.matches(signal)])
+        print(f"{indexed:>8.2f} ms  {scanned:>8.2f} ms scan  "
+              f"{len(database.query(predicate)):>6} hits  {predicate}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for editing and deleting a multi-selection of signals
+
+Selects every tenth of 50k signals shown in a QTreeView (5,000 signals),
+then sets asil, memory_region and timeout on all of them and deletes them,
+once with the batch calls the main window uses for a multi-selection
+(one validation pass and one change notification each) and once signal
+by signal. Reports the time of each action, including the event
+processing that repaints the view, and the number of change
+notifications the store sent. Deleting signal by signal takes a few
+minutes, as the view lays out its remaining rows again after every
+removal. Runs offscreen when no display is set.
+"""
+
+import os
+import sys
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QItemSelection, QItemSelectionModel, QModelIndex
+from PyQt5.QtWidgets import QApplication, QTreeView
+
+from Modules.SignalOperations.SignalManager import SignalManager
+from Modules.SignalOperations.SignalTreeModel import SignalTreeModel
+
+SIGNAL_COUNT = 50000
+SELECTION_STEP = 10
+ATTRIBUTES = {"asil": "B", "memory_region": "Cached", "timeout": 50}
+
+
+def make_signals(count):
+    """Create a list of synthetic signals"""
+    return [{"id": f"{i:08x}", "name": f"Signal_{i}", "data_type": "UINT32", "asil": "QM",
+             "memory_region": "DDR", "timeout": 10} for i in range(count)]
+
+
+def edit_in_batch(manager, signal_ids):
+    """Set the attributes as the main window does for a multi-selection"""
+    updated_ids, errors = manager.set_signal_attributes(signal_ids, ATTRIBUTES)
+    assert not errors and len(updated_ids) == len(signal_ids)
+
+
+def edit_one_by_one(manager, signal_ids):
+    """Set the attributes with one update per signal"""
+    for signal_id in signal_ids:
+        updated_data = manager.find_signal_by_id(signal_id).copy()
+        updated_data.update(ATTRIBUTES)
+        manager.update_signal_in_database(signal_id, updated_data)
+
+
+def delete_in_batch(manager, signal_ids):
+    """Delete the signals as the main window does for a multi-selection"""
+    assert len(manager.delete_signals(signal_ids)) == len(signal_ids)
+
+
+def delete_one_by_one(manager, signal_ids):
+    """Delete the signals with one removal per signal"""
+    for signal_id in signal_ids:
+        manager.delete_signal_from_database(signal_id)
+
+
+def run_actions(app, edit, delete):
+    """Edit then delete the selection and return [(ms, notifications)] of both"""
+    manager = SignalManager()
+    manager.set_project_data({"signals": make_signals(SIGNAL_COUNT)})
+    view = QTreeView()
+    view.setUniformRowHeights(True)
+    view.setSelectionMode(QTreeView.ExtendedSelection)
+    manager.update_signal_tree(view)
+    view.show()
+    model = manager.get_signal_tree_model()
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+
+    proxy = view.model()
+    selection = QItemSelection()
+    for row in range(0, SIGNAL_COUNT, SELECTION_STEP):
+        index = proxy.mapFromSource(model.index(row, 0))
+        selection.select(index, index)
+    view.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
+    app.processEvents()
+
+    # Collected as the main window's get_selected_signal_ids does
+    signal_ids = list(dict.fromkeys(index.data(SignalTreeModel.SIGNAL_ID_ROLE)
+                                    for index in view.selectionModel().selectedRows()))
+    notifications = []
+    manager.add_change_listener(lambda event, ids: notifications.append(event))
+
+    results = []
+    for action in (edit, delete):
+        notifications.clear()
+        start = time.perf_counter()
+        action(manager, signal_ids)
+        app.processEvents()
+        results.append(((time.perf_counter() - start) * 1000, len(notifications)))
+
+    assert len(manager.project_data["signals"]) == SIGNAL_COUNT - len(signal_ids)
+    view.close()
+    return len(signal_ids), results
+
+
+def run():
+    """Run the benchmark and print timings"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    for label, edit, delete in (("batch", edit_in_batch, delete_in_batch),
+                                ("one by one", edit_one_by_one, delete_one_by_one)):
+        selected, ((edit_ms, edit_events), (delete_ms, delete_events)) = run_actions(app, edit, delete)
+        print(f"{label:>11}: {selected} of {SIGNAL_COUNT} signals selected  "
+              f"edit {edit_ms:>9.1f} ms ({edit_events} notifications)  "
+              f"delete {delete_ms:>9.1f} ms ({delete_events} notifications)")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for showing signal details on selection changes
+
+Alternates the selection between plain signals and a STRUCT signal with
+200 fields, showing each in a details form once through SignalDetailsPanel
+and once rebuilding the form's widgets as every selection used to. Each
+selection includes the event processing that lays out and paints the form.
+Runs offscreen when no display is set.
+"""
+
+import os
+import sys
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QFormLayout, QLabel, QVBoxLayout, QWidget
+
+from Modules.SignalOperations.SignalManager import SignalManager
+
+SELECTION_COUNT = 200
+STRUCT_FIELD_COUNT = 200
+
+
+def make_signal(number, struct=False):
+    """Create a synthetic signal with the attributes of a project signal"""
+    signal = {
+        "id": f"{number:08x}",
+        "name": f"Signal_{number}",
+        "variable_port_name": f"Rp_Signal_{number}",
+        "description": f"Synthetic signal {number}",
+        "memory_region": "DDR",
+        "type": "Concurrent",
+        "init_value": "ZeroMemory",
+        "asil": "QM",
+        "buffer_count_ipc": 1,
+        "impl_approach": "SharedMemory",
+        "get_obj_ref": number % 2 == 0,
+        "notifiers": False,
+        "sm_buff_count": 1,
+        "timeout": 10,
+        "periodicity": 10,
+        "checksum": "None",
+        "source": "SOC",
+        "destination": "MCU",
+        "data_type": "UINT32",
+    }
+    if struct:
+        signal["data_type"] = "STRUCT"
+        signal["struct_fields"] = [
+            {"field_name": f"field_{i}", "data_type": "UINT8", "description": f"Field {i}"}
+            for i in range(STRUCT_FIELD_COUNT)
+        ]
+    return signal
+
+
+def rebuild_details(signal_data, form_layout):
+    """Show a signal by deleting and recreating every widget of the form"""
+    while form_layout.count() > 0:
+        item = form_layout.takeAt(0)
+        if item.widget():
+            item.widget().deleteLater()
+
+    for key, value in signal_data.items():
+        if key in ["id", "struct_fields"]:
+            continue
+        label = QLabel(f"{key.replace('_', ' ').title()}:")
+        value_widget = QLabel(("Yes" if value else "No") if isinstance(value, bool) else str(value))
+        form_layout.addRow(label, value_widget)
+
+    if "struct_fields" in signal_data and signal_data.get("data_type") == "STRUCT":
+        struct_container = QWidget()
+        struct_layout = QVBoxLayout(struct_container)
+        struct_layout.addWidget(QLabel("<b>Struct Fields:</b>"))
+        for field in signal_data["struct_fields"]:
+            field_form = QFormLayout()
+            for key, value in field.items():
+                field_form.addRow(QLabel(f"{key.replace('_', ' ').title()}:"), QLabel(str(value)))
+            struct_layout.addLayout(field_form)
+            struct_layout.addWidget(QLabel("----------"))
+        form_layout.addRow(QLabel(""), struct_container)
+
+
+def run_selections(app, show):
+    """Show the selections and return the per-selection times in milliseconds"""
+    container = QWidget()
+    form_layout = QFormLayout(container)
+    container.show()
+    signals = [make_signal(i, struct=i % 4 == 3) for i in range(8)]
+    # Warm up once with every signal, as the form is after the first selections
+    for signal in signals:
+        show(signal, form_layout)
+        app.processEvents()
+
+    times = []
+    for step in range(SELECTION_COUNT):
+        start = time.perf_counter()
+        show(signals[step % len(signals)], form_layout)
+        app.processEvents()
+        times.append((time.perf_counter() - start) * 1000)
+    container.close()
+    return sorted(times)
+
+
+def run():
+    """Run the benchmark and print timings"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    manager = SignalManager()
+    print(f"{SELECTION_COUNT} selection changes, a STRUCT signal with "
+          f"{STRUCT_FIELD_COUNT} fields every fourth selection")
+    for label, show in (("pooled panel", lambda signal, layout: manager.populate_signal_details(None, signal, layout)),
+                        ("rebuild", rebuild_details)):
+        times = run_selections(app, show)
+        print(f"{label:>13}: median {times[len(times) // 2]:>7.2f} ms  "
+              f"p95 {times[int(len(times) * 0.95)]:>7.2f} ms  max {times[-1]:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for the grouped signal view
+
+Shows a 100k-signal project spread over 8 boards, 4 SoCs and 3 build
+images in a QTreeView grouped by board > SoC > build image, then expands
+one build image and applies 1,000 edits (renames, moves to another build
+image, additions, deletions) while its group counts stay live. The same
+steps are timed with a QStandardItemModel holding every group and signal
+item, rebuilt after each edit as a grouped tree built by scanning the
+signals must be (20 edits, the rest is extrapolated). Runs offscreen when
+no display is set.
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QModelIndex
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+from PyQt5.QtWidgets import QApplication, QTreeView
+
+from Modules.SignalOperations.SignalManager import SignalManager
+
+SIGNAL_COUNT = 100000
+EDIT_COUNT = 1000
+REBUILD_EDIT_COUNT = 20
+BOARDS = [f"Board_{i}" for i in range(8)]
+SOCS = [f"SoC_{i}" for i in range(4)]
+BUILD_IMAGES = [f"Image_{i}" for i in range(3)]
+
+
+def make_signal(number, rng):
+    """Create a synthetic signal on a random board / SoC / build image"""
+    return {"id": f"{number:08x}", "name": f"Signal_{number}", "data_type": "UINT32",
+            "board": rng.choice(BOARDS), "soc": rng.choice(SOCS), "build_image": rng.choice(BUILD_IMAGES)}
+
+
+def apply_edit(manager, rng, step):
+    """Apply one random edit to the project"""
+    signals = manager.project_data["signals"]
+    choice = rng.random()
+    if choice < 0.5:
+        signal = signals[rng.randrange(len(signals))].copy()
+        signal["name"] = f"Edited_{step}"
+        manager.update_signal_in_database(signal["id"], signal)
+    elif choice < 0.7:
+        signal = signals[rng.randrange(len(signals))].copy()
+        signal["build_image"] = rng.choice(BUILD_IMAGES)
+        manager.update_signal_in_database(signal["id"], signal)
+    elif choice < 0.85:
+        manager.add_signal_to_database(make_signal(SIGNAL_COUNT + step, rng))
+    else:
+        manager.delete_signal_from_database(signals[rng.randrange(len(signals))]["id"])
+
+
+def build_standard_model(signals):
+    """Build a grouped QStandardItemModel by scanning every signal"""
+    model = QStandardItemModel()
+    model.setHorizontalHeaderLabels(["Signal ID", "Signal Name"])
+    groups = {}
+    for signal in signals:
+        parent = model.invisibleRootItem()
+        path = ()
+        for value in (signal.get("board"), signal.get("soc"), signal.get("build_image")):
+            path += (value,)
+            item = groups.get(path)
+            if item is None:
+                item = groups[path] = [QStandardItem(str(value)), QStandardItem("0")]
+                parent.appendRow(item)
+            item[1].setText(str(int(item[1].text()) + 1))
+            parent = item[0]
+        parent.appendRow([QStandardItem(signal["id"]), QStandardItem(signal["name"])])
+    return model
+
+
+def first_build_image(model):
+    """Get the index of the first build image row"""
+    index = QModelIndex()
+    for _ in range(3):
+        index = model.index(0, 0, index)
+    return index
+
+
+def run_group_model(app):
+    """Time the grouped view on SignalGroupModel"""
+    rng = random.Random(0)
+    manager = SignalManager()
+    manager.set_project_data({"signals": [make_signal(i, rng) for i in range(SIGNAL_COUNT)]})
+    manager.set_signal_grouping(True)
+    view = QTreeView()
+    view.setUniformRowHeights(True)
+    view.show()
+
+    start = time.perf_counter()
+    manager.update_signal_tree(view)
+    app.processEvents()
+    show_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    view.scrollTo(first_build_image(view.model()))
+    view.expand(first_build_image(view.model()))
+    app.processEvents()
+    expand_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for step in range(EDIT_COUNT):
+        apply_edit(manager, rng, step)
+        app.processEvents()
+    edit_ms = (time.perf_counter() - start) * 1000
+    view.close()
+    return show_ms, expand_ms, edit_ms
+
+
+def run_standard_model(app):
+    """Time the grouped view on a QStandardItemModel rebuilt after each edit"""
+    rng = random.Random(0)
+    manager = SignalManager()
+    manager.set_project_data({"signals": [make_signal(i, rng) for i in range(SIGNAL_COUNT)]})
+    view = QTreeView()
+    view.setUniformRowHeights(True)
+    view.show()
+
+    start = time.perf_counter()
+    view.setModel(build_standard_model(manager.project_data["signals"]))
+    app.processEvents()
+    show_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    view.scrollTo(first_build_image(view.model()))
+    view.expand(first_build_image(view.model()))
+    app.processEvents()
+    expand_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for step in range(REBUILD_EDIT_COUNT):
+        apply_edit(manager, rng, step)
+        view.setModel(build_standard_model(manager.project_data["signals"]))
+        view.scrollTo(first_build_image(view.model()))
+        view.expand(first_build_image(view.model()))
+        app.processEvents()
+    edit_ms = (time.perf_counter() - start) * 1000 * EDIT_COUNT / REBUILD_EDIT_COUNT
+    view.close()
+    return show_ms, expand_ms, edit_ms
+
+
+def run():
+    """Run the benchmark and print timings"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{SIGNAL_COUNT} signals in {len(BOARDS) * len(SOCS) * len(BUILD_IMAGES)} build image groups, "
+          f"{EDIT_COUNT} edits")
+    for label, run_model in (("group model", run_group_model), ("rebuilt items", run_standard_model)):
+        show_ms, expand_ms, edit_ms = run_model(app)
+        print(f"{label:>13}: show {show_ms:>9.1f} ms  expand {expand_ms:>7.1f} ms  "
+              f"edits {edit_ms:>10.1f} ms ({edit_ms / EDIT_COUNT:.3f} ms/edit)")
+
+
+if __name__ == "__main__":
+    run()
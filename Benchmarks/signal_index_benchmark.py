@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for SignalManager lookups, updates and deletes
+
+Shows that find/update/delete cost stays flat as the project grows,
+compared with the linear scan the SignalManager used before the index.
+"""
+
+import os
+import sys
+import random
+import timeit
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from Modules.SignalOperations.SignalManager import SignalManager
+
+SIZES = [1000, 10000, 100000]
+LOOKUPS = 10000
+
+
+def make_signals(count):
+    """Create a list of synthetic signals"""
+    return [{"id": f"{i:08x}", "name": f"Signal_{i}", "data_type": "UINT32"}
+            for i in range(count)]
+
+
+def linear_find(signals, signal_id):
+    """The pre-index lookup, kept as a baseline"""
+    for signal in signals:
+        if signal.get("id") == signal_id:
+            return signal
+    return None
+
+
+def run():
+    """Run the benchmark and print per-operation timings"""
+    print(f"{'signals':>8} {'indexed find':>14} {'linear find':>14} {'update':>10} {'delete':>10}")
+    for size in SIZES:
+        manager = SignalManager()
+        manager.set_project_data({"signals": make_signals(size)})
+        signals = manager.project_data["signals"]
+        ids = [signal["id"] for signal in signals]
+        probe = random.Random(size).choices(ids, k=LOOKUPS)
+
+        find_time = timeit.timeit(lambda: [manager.find_signal_by_id(i) for i in probe], number=1)
+        linear_probe = probe[:100]
+        linear_time = timeit.timeit(lambda: [linear_find(signals, i) for i in linear_probe], number=1)
+        update_time = timeit.timeit(
+            lambda: [manager.update_signal_in_database(i, {"name": i, "data_type": "UINT8"}) for i in probe],
+            number=1)
+
+        victims = random.Random(-size).sample(ids, LOOKUPS // 10)
+        delete_time = timeit.timeit(lambda: [manager.delete_signal_from_database(i) for i in victims], number=1)
+
+        print(f"{size:>8} "
+              f"{find_time / len(probe) * 1e6:>11.2f} us "
+              f"{linear_time / len(linear_probe) * 1e6:>11.2f} us "
+              f"{update_time / len(probe) * 1e6:>7.2f} us "
+              f"{delete_time / len(victims) * 1e6:>7.2f} us")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Memory benchmark for the Signal record type
+
+Measures the memory held by 200k signals (10% of them STRUCT signals with
+four fields) stored as plain dicts, as Signal records and as records with
+interned category values, and times the JSON round trip.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from Modules.SignalOperations.SignalRecord import json_default, signals_from_json
+from Modules.SignalOperations.StringPool import StringPool
+
+SIGNAL_COUNT = 200000
+
+
+def make_signal(i):
+    """Create one synthetic signal dictionary"""
+    signal = {
+        "id": f"{i:08x}",
+        "name": f"Signal_{i}",
+        "description": "",
+        "data_type": "UINT32",
+        "init_value_type": "Zero",
+        "asil": "QM",
+        "buffer_count": 1,
+        "notifiers": False,
+        "sm_buff_count": 1,
+        "timeout": 100,
+        "periodicity": 10,
+        "checksum": "None",
+        "board": "DCu1",
+        "soc": "SoC_A",
+        "build_image": "Image_1",
+    }
+    if i % 10 == 0:
+        signal["data_type"] = "STRUCT"
+        signal["struct_fields"] = [{"field_name": f"field_{n}", "data_type": "UINT8", "description": ""}
+                                   for n in range(4)]
+    return signal
+
+
+def measure(label, build):
+    """Print the memory allocated by build() and return its result"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:<24} {(after - before) / 2 ** 20:>8.1f} MiB")
+    return result
+
+
+def timed(label, func):
+    """Run func once and print how long it took"""
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<24} {(time.perf_counter() - start) * 1000:>8.1f} ms")
+    return result
+
+
+def run():
+    """Run the benchmark and print results"""
+    text = json.dumps({"signals": [make_signal(i) for i in range(SIGNAL_COUNT)]})
+
+    print(f"{SIGNAL_COUNT} signals")
+    dicts = measure("dicts", lambda: json.loads(text)["signals"])
+    del dicts
+    records = measure("Signal records", lambda: signals_from_json(json.loads(text)["signals"]))
+    del records
+
+    pool = StringPool()
+
+    def load_interned():
+        signals = json.loads(text)["signals"]
+        pool.intern_signals(signals)
+        return signals_from_json(signals)
+
+    records = measure("records + string pool", load_interned)
+    print(f"{'':<24} {pool.stats()['saved_bytes'] / 2 ** 20:>8.1f} MiB reported saved by the pool")
+
+    timed("json.loads (dicts)", lambda: json.loads(text))
+    timed("json.loads + records", lambda: signals_from_json(json.loads(text)["signals"]))
+    dumped = timed("json.dumps (records)", lambda: json.dumps({"signals": records}, default=json_default))
+    assert dumped == text
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for the signal tree search
+
+Loads 100k synthetic signals (the search index is built on a worker
+thread), searches them through SignalSearchIndex and through a per-row
+regex over the searched fields, then times applying a search to the signal
+tree's filter proxy with all 100k rows fetched, and keeping the index
+current across edits. Searches should take less than TARGET_MS.
+Runs offscreen when no display is set.
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QModelIndex
+from PyQt5.QtWidgets import QApplication, QTreeView
+
+from Modules.SignalOperations.SignalManager import SignalManager
+from Modules.SignalOperations.SignalSearchIndex import SignalSearchIndex
+
+SIGNAL_COUNT = 100000
+EDIT_COUNT = 1000
+TARGET_MS = 20
+
+WORDS = ["Vehicle", "Speed", "Brake", "Pressure", "Door", "Left", "Right", "Front", "Rear",
+         "Temp", "Motor", "Torque", "Camera", "Radar", "Lamp", "Status", "Request", "Level"]
+
+QUERIES = ["speed", "brakepressure", "rp_door", "torque rear", "zzz", "ve", "left front status"]
+
+
+def make_signal(rng, number):
+    """Create a synthetic signal"""
+    name = "".join(rng.sample(WORDS, 3))
+    return {
+        "id": f"{number:08x}",
+        "name": f"{name}_{number}",
+        "variable_port_name": f"Rp_{name}",
+        "description": " ".join(rng.sample(WORDS, 5)).lower(),
+    }
+
+
+def timed(func, repeat=5):
+    """Return the best time of func in milliseconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def regex_scan(signals, text):
+    """Search the fields with one regex per term, row by row"""
+    patterns = [re.compile(re.escape(term), re.IGNORECASE) for term in text.split()]
+    return {signal["id"] for signal in signals
+            if all(any(pattern.search(signal.get(field) or "") for field in SignalSearchIndex.FIELDS)
+                   for pattern in patterns)}
+
+
+def run():
+    """Run the benchmark and print timings"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    rng = random.Random(0)
+    manager = SignalManager()
+    project_signals = [make_signal(rng, i) for i in range(SIGNAL_COUNT)]
+    start = time.perf_counter()
+    manager.set_project_data({"signals": project_signals})
+    load_ms = (time.perf_counter() - start) * 1000
+    signals = manager.project_data["signals"]
+    index = manager.get_search_index()
+
+    start = time.perf_counter()
+    index.search("speed")
+    print(f"{SIGNAL_COUNT} signals, set_project_data {load_ms:.0f} ms, first search waited "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms for the background build")
+
+    slowest = 0
+    for text in QUERIES:
+        indexed = timed(lambda: index.search(text))
+        scanned = timed(lambda: regex_scan(signals, text), repeat=1)
+        slowest = max(slowest, indexed)
+        print(f"{indexed:>8.2f} ms  {scanned:>8.2f} ms regex scan  "
+              f"{len(index.search(text)):>6} hits  {text!r}")
+    print(f"slowest search {slowest:.2f} ms, target {TARGET_MS} ms: "
+          f"{'met' if slowest < TARGET_MS else 'MISSED'}")
+
+    view = QTreeView()
+    # As set in the signal database page
+    view.setUniformRowHeights(True)
+    manager.update_signal_tree(view)
+    view.show()
+    proxy = manager.get_signal_filter_model()
+    # Fetch every row, so the filter goes through the whole project
+    while proxy.canFetchMore(QModelIndex()):
+        proxy.fetchMore(QModelIndex())
+    app.processEvents()
+    print(f"{manager.get_signal_tree_model().rowCount()} rows fetched")
+    for text in ("brakepressure", "speed", ""):
+        start = time.perf_counter()
+        manager.set_signal_search_text(text)
+        app.processEvents()
+        print(f"{(time.perf_counter() - start) * 1000:>8.2f} ms  filter the tree by {text!r} "
+              f"({proxy.rowCount()} rows shown)")
+
+    manager.set_signal_search_text("speed")
+    start = time.perf_counter()
+    for step in range(EDIT_COUNT):
+        signal_id = signals[rng.randrange(len(signals))]["id"]
+        updated = make_signal(rng, step)
+        del updated["id"]
+        manager.update_signal_in_database(signal_id, updated)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{elapsed / EDIT_COUNT:>8.3f} ms per edit with the search applied")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for signal tree updates after edits
+
+Applies 1,000 consecutive edits (updates, additions and deletions) to a
+50k-signal project shown in a QTreeView, once with the row-level
+notifications of SignalTreeModel and once resetting the model after every
+edit as a full tree rebuild does. Runs offscreen when no display is set.
+
+By default the view holds the rows of a freshly opened project; pass
+--fetch-all to hand it every row first, as scrolling to the end would.
+QTreeView lays out all of its rows again after any insertion or removal,
+so that case measures mostly the view.
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QItemSelectionModel, QModelIndex
+from PyQt5.QtWidgets import QApplication, QTreeView
+
+from Modules.SignalOperations.SignalManager import SignalManager
+from Modules.SignalOperations.SignalTreeModel import SignalTreeModel
+
+SIGNAL_COUNT = 50000
+EDIT_COUNT = 1000
+
+
+def make_signals(count):
+    """Create a list of synthetic signals"""
+    return [{"id": f"{i:08x}", "name": f"Signal_{i}", "data_type": "UINT32"} for i in range(count)]
+
+
+def fetch_first(model):
+    """Hand the first batch of rows to the view, as opening the project does"""
+    model.fetchMore(QModelIndex())
+
+
+def fetch_all(model):
+    """Hand every row to the view, as scrolling to the end would"""
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+
+
+def run_edits(app, full_rebuild, fetch_rows, seed=0):
+    """Apply the edits and return (elapsed ms, selected signal ID still selected)"""
+    manager = SignalManager()
+    manager.set_project_data({"signals": make_signals(SIGNAL_COUNT)})
+    view = QTreeView()
+    view.setUniformRowHeights(True)
+    manager.update_signal_tree(view)
+    view.show()
+    model = manager.get_signal_tree_model()
+    fetch_rows(model)
+
+    selected_row = model.rowCount() // 2
+    selected_id = manager.project_data["signals"][selected_row]["id"]
+    # The view shows the search filter over the signal tree model
+    view.selectionModel().select(view.model().mapFromSource(model.index(selected_row, 0)),
+                                 QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
+    app.processEvents()
+
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for step in range(EDIT_COUNT):
+        signals = manager.project_data["signals"]
+        choice = rng.random()
+        if choice < 0.6:
+            signal_id = signals[rng.randrange(len(signals))]["id"]
+            manager.update_signal_in_database(signal_id, {"name": f"Edited_{step}", "data_type": "UINT32"})
+        elif choice < 0.8:
+            manager.add_signal_to_database({"name": f"Added_{step}", "data_type": "UINT32"})
+        else:
+            signal_id = signals[rng.randrange(len(signals))]["id"]
+            if signal_id != selected_id:
+                manager.delete_signal_from_database(signal_id)
+        if full_rebuild:
+            model.beginResetModel()
+            model._fetched = 0
+            model.endResetModel()
+            fetch_rows(model)
+        app.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    rows = view.selectionModel().selectedRows()
+    kept = bool(rows) and rows[0].data(SignalTreeModel.SIGNAL_ID_ROLE) == selected_id
+    view.close()
+    return elapsed, kept
+
+
+def run():
+    """Run the benchmark and print timings"""
+    fetch_rows = fetch_all if "--fetch-all" in sys.argv else fetch_first
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{SIGNAL_COUNT} signals, {EDIT_COUNT} edits, "
+          f"{'every row' if fetch_rows is fetch_all else 'first rows'} fetched by the view")
+    for label, full_rebuild in (("row updates", False), ("full rebuild", True)):
+        elapsed, kept = run_edits(app, full_rebuild, fetch_rows)
+        print(f"{label:>13}: {elapsed:>9.1f} ms total  {elapsed / EDIT_COUNT:>7.3f} ms/edit  "
+              f"selection kept: {kept}")
+
+
+if __name__ == "__main__":
+    run()
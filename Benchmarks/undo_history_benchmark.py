@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for the signal undo history
+
+Applies 2,000 single-signal edits to a 100k-signal store, recording each
+one in a SignalHistory, and compares the time and the memory kept alive
+with the previous approach of pushing a copy of the signals list before
+every edit (200 edits, the rest is extrapolated). Then undoes and redoes
+every recorded edit.
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from Modules.SignalOperations.SignalStore import SignalStore
+from Modules.SignalOperations.SignalHistory import SignalHistory
+
+SIGNAL_COUNT = 100000
+EDIT_COUNT = 2000
+SNAPSHOT_EDIT_COUNT = 200
+
+
+def make_signals(count):
+    """Create a list of synthetic signals"""
+    return [{"id": f"{i:08x}", "name": f"Signal_{i}", "data_type": "UINT32", "timeout": 100,
+             "description": f"Synthetic signal number {i}"} for i in range(count)]
+
+
+def edit(store, rng, step):
+    """Rename a random signal, returning (previous, new)"""
+    signal = store.signals[rng.randrange(len(store.signals))]
+    updated = dict(signal)
+    updated["name"] = f"Edited_{step}"
+    return store.replace(signal["id"], updated), updated
+
+
+def run_history():
+    """Time and measure the delta history"""
+    rng = random.Random(0)
+    store = SignalStore(make_signals(SIGNAL_COUNT))
+    history = SignalHistory(store)
+
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    for step in range(EDIT_COUNT):
+        previous, updated = edit(store, rng, step)
+        history.record_updated("Edit signal", [(previous, updated)])
+    edit_ms = (time.perf_counter() - start) * 1000
+    kept = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    while history.can_undo():
+        history.undo()
+    undo_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    while history.can_redo():
+        history.redo()
+    redo_ms = (time.perf_counter() - start) * 1000
+    return edit_ms, kept, history.size, undo_ms, redo_ms
+
+
+def run_snapshots():
+    """Time and measure a stack of signals list copies"""
+    rng = random.Random(0)
+    store = SignalStore(make_signals(SIGNAL_COUNT))
+    stack = []
+
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    for step in range(SNAPSHOT_EDIT_COUNT):
+        stack.append(store.signals.copy())
+        edit(store, rng, step)
+    edit_ms = (time.perf_counter() - start) * 1000
+    kept = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    tracemalloc.stop()
+    scale = EDIT_COUNT / SNAPSHOT_EDIT_COUNT
+    return edit_ms * scale, kept * scale
+
+
+def run():
+    """Run the benchmark and print timings"""
+    print(f"{SIGNAL_COUNT} signals, {EDIT_COUNT} edits")
+    edit_ms, kept, estimate, undo_ms, redo_ms = run_history()
+    print(f"{'delta history':>15}: edits {edit_ms:>9.1f} ms ({edit_ms * 1000 / EDIT_COUNT:.1f} us/edit)  "
+          f"kept {kept / 1024 / 1024:>8.2f} MiB (estimated {estimate / 1024 / 1024:.2f} MiB)")
+    print(f"{'':>15}  undo all {undo_ms:.1f} ms, redo all {redo_ms:.1f} ms")
+    edit_ms, kept = run_snapshots()
+    print(f"{'list copies':>15}: edits {edit_ms:>9.1f} ms ({edit_ms * 1000 / EDIT_COUNT:.1f} us/edit)  "
+          f"kept {kept / 1024 / 1024:>8.2f} MiB")
+
+
+if __name__ == "__main__":
+    run()
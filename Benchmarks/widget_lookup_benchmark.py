@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark for widget lookups in the main window's handlers
+
+Loads the main window's UI files as SignalManagerApp.setup_ui does, then
+runs the widget lookups of the hot handlers through a WidgetRegistry and
+prints the registry's per-handler report: the findChild/findChildren time
+each handler no longer spends against the time taken from the registry.
+Runs offscreen when no display is set.
+"""
+
+import importlib
+import os
+import sys
+
+# Add the project root to the Python path so we can import Modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import uic
+from PyQt5.QtWidgets import (QApplication, QCheckBox, QComboBox, QDateTimeEdit, QFrame, QLabel,
+                             QLineEdit, QMainWindow, QPlainTextEdit, QPushButton, QSpinBox,
+                             QStackedWidget, QTreeView, QWidget)
+
+# Register the compiled resources used by the UI files (imported for its side effect)
+importlib.import_module("Cfg.Resources.resources_rc")
+
+from Utils.widget_registry import WidgetRegistry
+
+CALL_COUNT = 1000
+
+VERSION_FIELDS = {
+    "version_number_field": QLineEdit,
+    "version_date_field": QDateTimeEdit,
+    "updated_by_field": QLineEdit,
+    "change_desc_field": QPlainTextEdit,
+    "CoreInfoTreeObj": QTreeView,
+}
+
+COMBO_BOXES = {name: QComboBox for name in ("buildImageComboBox", "socComboBox", "boardComboBox",
+                                            "coreImageTypeCombo", "coreSocCombo", "coreBoardCombo")}
+
+SIGNAL_FORM = {
+    "varPortNameInput": QLineEdit,
+    "descriptionInput": QLineEdit,
+    "dataTypeCombo": QComboBox,
+    "initValueCombo": QComboBox,
+    "asilCombo": QComboBox,
+    "bufferCountSpinBox": QSpinBox,
+    "notifiersCombo": QComboBox,
+    "smBuffCountSpinBox": QSpinBox,
+    "timeoutSpinBox": QSpinBox,
+    "periodicitySpinBox": QSpinBox,
+    "checksumCombo": QComboBox,
+}
+
+DETAILS_CARD = {
+    "signal_details_card": QFrame,
+    "dynamicAttrsFrame": QFrame,
+    "dynamicAttrsPlaceholder": QLabel,
+}
+
+# Handler -> names its widgets are fetched by, as in SignalManagerApp
+HANDLERS = {
+    "update_data_from_ui": list(VERSION_FIELDS),
+    "update_ui_from_data": list(VERSION_FIELDS),
+    "save_project": ["change_desc_field"],
+    "sync_combo_boxes_with_core_config": list(COMBO_BOXES),
+    "collect_signal_form_data": list(SIGNAL_FORM),
+    "set_signal_details_enabled": ["signal_details_card", "signal_details_inputs",
+                                   "dynamicAttrsFrame", "dynamicAttrsPlaceholder"],
+    "get_selected_signal_id": ["signalTree"],
+}
+
+
+def load_window():
+    """Load the main window and its pages as SignalManagerApp.setup_ui does"""
+    layout_dir = os.path.join(parent_dir, "Cfg", "LayoutFiles")
+    window = QMainWindow()
+    uic.loadUi(os.path.join(layout_dir, "signal_manager_app.ui"), window)
+    content_stack = window.findChild(QStackedWidget, "content_stack")
+    for index, ui_file in ((1, "project_config.ui"), (2, "signal_database.ui")):
+        page = QWidget()
+        uic.loadUi(os.path.join(layout_dir, ui_file), page)
+        old_page = content_stack.widget(index)
+        if old_page:
+            content_stack.removeWidget(old_page)
+            content_stack.insertWidget(index, page)
+    return window
+
+
+def run():
+    """Run the benchmark and print the per-handler report"""
+    # Kept referenced until the end so Qt keeps the application alive
+    _ = QApplication.instance() or QApplication(sys.argv)
+    window = load_window()
+    widgets = dict(VERSION_FIELDS, **COMBO_BOXES, **SIGNAL_FORM, **DETAILS_CARD, signalTree=QTreeView)
+    groups = {"signal_details_inputs": ("signal_details_card",
+                                        [QLineEdit, QComboBox, QSpinBox, QCheckBox, QPushButton])}
+    registry = WidgetRegistry(window, widgets, groups)
+    registry.resolve()
+
+    for _ in range(CALL_COUNT):
+        for handler, names in HANDLERS.items():
+            registry.fetch(handler, *names)
+
+    print(f"{len(window.findChildren(QWidget))} widgets in the main window, {CALL_COUNT} calls per handler")
+    print(registry.format_stats())
+
+
+if __name__ == "__main__":
+    run()
@@ -10,16 +10,43 @@ import json
 import os
 from PyQt5.QtCore import QObject
 
+from Modules.DataBaseOperation.facet_index import FacetIndex
+from Modules.DataBaseOperation.query_engine import And, SignalQueryIndex, predicate_from_kwargs
+from Modules.SignalOperations.SignalStore import SignalStore
+
 class DatabaseOperations(QObject):
     """Handles database operations for the Signal Manager application"""
     
-    def __init__(self, parent=None):
-        """Initialize DatabaseOperations"""
+    # Walk the list instead of sorting candidates once they exceed 1/SCAN_RATIO of it
+    SCAN_RATIO = 2
+    
+    def __init__(self, parent=None, store=None):
+        """
+        Initialize DatabaseOperations
+        
+        Args:
+            parent (QObject, optional): Parent object
+            store (SignalStore, optional): Signal store to share, e.g. with SignalManager
+        """
         super(DatabaseOperations, self).__init__(parent)
-        self.signals = []
+        self.store = store if store is not None else SignalStore()
+        self.facet_index = FacetIndex()
+        self.query_index = SignalQueryIndex(self.store.index)
+        self.store.attach(self.facet_index)
+        self.store.attach(self.query_index)
         self.current_board = ""
         self.current_soc = ""
     
+    @property
+    def signals(self):
+        """The signals list of the store"""
+        return self.store.signals
+    
+    @property
+    def signal_index(self):
+        """The ID/name index of the store"""
+        return self.store.index
+    
     def load_signals(self, data):
         """
         Load signals from data
@@ -32,7 +59,7 @@ class DatabaseOperations(QObject):
         """
         try:
             if "signals" in data and isinstance(data["signals"], list):
-                self.signals = data["signals"]
+                self.store.load(data["signals"])
                 return True
             return False
         except Exception as e:
@@ -67,15 +94,10 @@ class DatabaseOperations(QObject):
             bool: True if signal added successfully, False otherwise
         """
         try:
-            # Check if signal with this ID already exists
-            if "id" in signal_data:
-                for signal in self.signals:
-                    if signal.get("id") == signal_data["id"]:
-                        return False  # Signal with this ID already exists
+            self.ensure_indexes()
             
-            # Add signal to the list
-            self.signals.append(signal_data)
-            return True
+            # The store refuses a signal whose ID already exists
+            return self.store.add(signal_data) is not None
         except Exception as e:
             print(f"Error adding signal: {str(e)}")
             return False
@@ -92,12 +114,10 @@ class DatabaseOperations(QObject):
             bool: True if signal updated successfully, False otherwise
         """
         try:
-            for i, signal in enumerate(self.signals):
-                if signal.get("id") == signal_id:
-                    # Update the signal data
-                    self.signals[i] = updated_data
-                    return True
-            return False  # Signal not found
+            self.ensure_indexes()
+            
+            # Update the signal data, keeping it findable by its ID
+            return self.store.replace(signal_id, updated_data) is not None
         except Exception as e:
             print(f"Error updating signal: {str(e)}")
             return False
@@ -113,12 +133,9 @@ class DatabaseOperations(QObject):
             bool: True if signal deleted successfully, False otherwise
         """
         try:
-            for i, signal in enumerate(self.signals):
-                if signal.get("id") == signal_id:
-                    # Remove the signal
-                    del self.signals[i]
-                    return True
-            return False  # Signal not found
+            self.ensure_indexes()
+            
+            return self.store.remove(signal_id) is not None
         except Exception as e:
             print(f"Error deleting signal: {str(e)}")
             return False
@@ -133,10 +150,8 @@ class DatabaseOperations(QObject):
         Returns:
             dict: Signal data if found, None otherwise
         """
-        for signal in self.signals:
-            if signal.get("id") == signal_id:
-                return signal
-        return None
+        self.ensure_indexes()
+        return self.signal_index.get(signal_id)
     
     def get_all_signals(self):
         """
@@ -152,23 +167,58 @@ class DatabaseOperations(QObject):
         Filter signals based on provided criteria
         
         Args:
-            **kwargs: Filter criteria as key-value pairs
+            **kwargs: Filter criteria as key-value pairs. Plain keys compare for
+                equality; "__in", "__gt", "__gte", "__lt", "__lte", "__startswith"
+                and "__regex" suffixes select other comparisons,
+                e.g. filter_signals(board="DCu1", timeout__lte=100)
             
         Returns:
             list: List of filtered signals
         """
-        filtered_signals = []
+        return self.query(predicate_from_kwargs(**kwargs))
+    
+    def query(self, predicate):
+        """
+        Get the signals matching a compound query
         
-        for signal in self.signals:
-            match = True
-            for key, value in kwargs.items():
-                if key not in signal or signal[key] != value:
-                    match = False
-                    break
-            if match:
-                filtered_signals.append(signal)
+        The most selective indexes available for the query supply the
+        candidates, which are then checked against the conditions those
+        indexes could not answer.
+        Queries that no index can narrow down fall back to a full scan.
         
-        return filtered_signals
+        Args:
+            predicate (Predicate): Query built from the query_engine predicates,
+                e.g. Eq("board", "DCu1") & (Range("timeout", 10, 100) | Prefix("name", "Brake"))
+            
+        Returns:
+            list: Matching signals, in signal list order
+        """
+        self.ensure_indexes()
+        
+        candidate_ids, residual = self.query_index.candidates(predicate)
+        if candidate_ids is None:
+            if isinstance(predicate, And) and not predicate.predicates:
+                return list(self.signals)
+            return [signal for signal in self.signals if predicate.matches(signal)]
+        
+        if len(candidate_ids) > len(self.signals) // self.SCAN_RATIO:
+            # Cheaper to keep list order by one membership pass than by sorting positions
+            candidates = [signal for signal in self.signals if signal.get("id") in candidate_ids]
+        else:
+            candidates = self.signal_index.in_list_order(candidate_ids)
+        
+        if residual is None:
+            return candidates
+        # Only the conditions no index answered are checked per signal
+        return [signal for signal in candidates if residual.matches(signal)]
+    
+    def rebuild_indexes(self):
+        """Rebuild every signal index from the current signals list"""
+        self.store.load(self.signals)
+    
+    def ensure_indexes(self):
+        """Rebuild the indexes if the signals list was resized behind them"""
+        self.store.sync()
     
     def set_current_board(self, board):
         """
@@ -195,11 +245,8 @@ class DatabaseOperations(QObject):
         Returns:
             list: List of board names
         """
-        boards = set()
-        for signal in self.signals:
-            if "board" in signal and signal["board"]:
-                boards.add(signal["board"])
-        return sorted(list(boards))
+        self.ensure_indexes()
+        return self.facet_index.boards()
     
     def get_socs(self, board=None):
         """
@@ -211,12 +258,8 @@ class DatabaseOperations(QObject):
         Returns:
             list: List of SOC names
         """
-        socs = set()
-        for signal in self.signals:
-            if "soc" in signal and signal["soc"]:
-                if board is None or signal.get("board") == board:
-                    socs.add(signal["soc"])
-        return sorted(list(socs))
+        self.ensure_indexes()
+        return self.facet_index.socs(board)
     
     def get_build_images(self, board=None, soc=None):
         """
@@ -229,14 +272,20 @@ class DatabaseOperations(QObject):
         Returns:
             list: List of build image names
         """
-        build_images = set()
-        for signal in self.signals:
-            if "build_image" in signal and signal["build_image"]:
-                match = True
-                if board is not None and signal.get("board") != board:
-                    match = False
-                if soc is not None and signal.get("soc") != soc:
-                    match = False
-                if match:
-                    build_images.add(signal["build_image"])
-        return sorted(list(build_images))
\ No newline at end of file
+        self.ensure_indexes()
+        return self.facet_index.build_images(board, soc)
+    
+    def get_signal_count(self, board=None, soc=None, build_image=None):
+        """
+        Get the number of signals for a board / SOC / build image combination
+        
+        Args:
+            board (str, optional): Count only signals for this board
+            soc (str, optional): Count only signals for this SOC
+            build_image (str, optional): Count only signals for this build image
+            
+        Returns:
+            int: Number of matching signals
+        """
+        self.ensure_indexes()
+        return self.facet_index.count(board, soc, build_image)
\ No newline at end of file
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Facet Index Module for Signal Manager
+Keeps reference-counted board -> SoC -> build image facets for signal data
+"""
+
+
+class FacetIndex:
+    """Hierarchical facet index (board -> soc -> build_image) with reference counts
+
+    Each leaf counts the signals carrying that board/SoC/build image
+    combination. Adding, updating or removing a signal only touches its own
+    path, so the facet lists are answered from the (small) facet tree instead
+    of a scan over every signal. Sorted answers are cached until a facet value
+    appears or disappears.
+
+    With track_members, each leaf also keeps the IDs of its signals, so the
+    signals of one board/SoC/build image can be listed without a scan (used
+    by the grouped signal view).
+    """
+
+    FACET_KEYS = ("board", "soc", "build_image")
+
+    def __init__(self, signals=None, track_members=False):
+        """
+        Initialize FacetIndex
+
+        Args:
+            signals (list, optional): Signals to index
+            track_members (bool, optional): Keep the signal IDs of each facet path
+        """
+        self.track_members = track_members
+        # Incremented on every change of a count, so views can tell whether
+        # anything moved since they last looked
+        self.revision = 0
+        self._tree = {}
+        self._cache = {}
+        self._members = {}
+        self.rebuild(signals or [])
+
+    def rebuild(self, signals):
+        """
+        Rebuild the index from a list of signals
+
+        Args:
+            signals (list): Signals to index
+        """
+        self._tree = {}
+        self._cache = {}
+        self._members = {}
+        self.revision += 1
+        for signal in signals:
+            self.add(signal)
+
+    def facets_of(self, signal):
+        """
+        Get the (board, soc, build_image) path of a signal
+
+        Args:
+            signal (dict): Signal data
+
+        Returns:
+            tuple: The signal's board, SoC and build image values
+        """
+        return (signal.get("board"), signal.get("soc"), signal.get("build_image"))
+
+    def add(self, signal):
+        """
+        Count a signal in the index
+
+        Args:
+            signal (dict): Signal data
+        """
+        board, soc, build_image = self.facets_of(signal)
+        socs = self._tree.setdefault(board, {})
+        images = socs.setdefault(soc, {})
+        count = images.get(build_image, 0)
+        images[build_image] = count + 1
+        self.revision += 1
+        if self.track_members:
+            # A dict keeps the IDs in the order they were added
+            self._members.setdefault((board, soc, build_image), {})[signal.get("id")] = None
+        if count == 0:
+            # A new facet path appeared, cached lists may be stale
+            self._cache = {}
+
+    def remove(self, signal):
+        """
+        Stop counting a signal in the index
+
+        Args:
+            signal (dict): Signal data
+        """
+        board, soc, build_image = self.facets_of(signal)
+        socs = self._tree.get(board)
+        images = socs.get(soc) if socs is not None else None
+        if not images or build_image not in images:
+            return
+
+        images[build_image] -= 1
+        self.revision += 1
+        if self.track_members:
+            members = self._members.get((board, soc, build_image))
+            if members is not None:
+                members.pop(signal.get("id"), None)
+                if not members:
+                    del self._members[(board, soc, build_image)]
+        if images[build_image] == 0:
+            del images[build_image]
+            if not images:
+                del socs[soc]
+                if not socs:
+                    del self._tree[board]
+            self._cache = {}
+
+    def update(self, old_signal, new_signal):
+        """
+        Move a signal from its old facet path to its new one
+
+        Args:
+            old_signal (dict): Signal data before the update
+            new_signal (dict): Signal data after the update
+        """
+        if self.facets_of(old_signal) == self.facets_of(new_signal):
+            return
+        self.remove(old_signal)
+        self.add(new_signal)
+
+    def _matching_socs(self, board=None):
+        """Yield (soc, images) pairs under one board, or under all boards"""
+        if board is None:
+            for socs in self._tree.values():
+                yield from socs.items()
+        else:
+            yield from self._tree.get(board, {}).items()
+
+    def boards(self):
+        """
+        Get the sorted list of boards used by signals
+
+        Returns:
+            list: List of board names
+        """
+        key = ("boards",)
+        if key not in self._cache:
+            self._cache[key] = sorted(board for board in self._tree if board)
+        return list(self._cache[key])
+
+    def socs(self, board=None):
+        """
+        Get the sorted list of SoCs used by signals
+
+        Args:
+            board (str, optional): Only return SoCs used with this board
+
+        Returns:
+            list: List of SoC names
+        """
+        key = ("socs", board)
+        if key not in self._cache:
+            self._cache[key] = sorted({soc for soc, _ in self._matching_socs(board) if soc})
+        return list(self._cache[key])
+
+    def build_images(self, board=None, soc=None):
+        """
+        Get the sorted list of build images used by signals
+
+        Args:
+            board (str, optional): Only return build images used with this board
+            soc (str, optional): Only return build images used with this SoC
+
+        Returns:
+            list: List of build image names
+        """
+        key = ("build_images", board, soc)
+        if key not in self._cache:
+            build_images = set()
+            for soc_name, images in self._matching_socs(board):
+                if soc is None or soc_name == soc:
+                    build_images.update(image for image in images if image)
+            self._cache[key] = sorted(build_images)
+        return list(self._cache[key])
+
+    def count(self, board=None, soc=None, build_image=None):
+        """
+        Count the signals on a facet path
+
+        Args:
+            board (str, optional): Board to count, or None for all boards
+            soc (str, optional): SoC to count, or None for all SoCs
+            build_image (str, optional): Build image to count, or None for all images
+
+        Returns:
+            int: Number of signals matching every given facet
+        """
+        total = 0
+        for soc_name, images in self._matching_socs(board):
+            if soc is not None and soc_name != soc:
+                continue
+            if build_image is None:
+                total += sum(images.values())
+            else:
+                total += images.get(build_image, 0)
+        return total
+
+    def children(self, *path):
+        """
+        Get the facet values directly below a facet path
+
+        Unlike boards(), socs() and build_images(), the path is matched
+        exactly (None is the value of signals without that facet) and empty
+        values are listed too.
+
+        Args:
+            path: Leading facet values, e.g. () for the boards or
+                (board, soc) for the build images of one board and SoC
+
+        Returns:
+            list: The values, non-empty values sorted first
+        """
+        if len(path) >= len(self.FACET_KEYS):
+            return []
+        level = self._tree
+        for value in path:
+            level = level.get(value)
+            if level is None:
+                return []
+        return sorted(level, key=lambda value: (not value, str(value)))
+
+    def path_count(self, *path):
+        """
+        Count the signals below an exact facet path
+
+        Args:
+            path: Leading facet values, matched exactly as in children()
+
+        Returns:
+            int: Number of signals whose facets start with path
+        """
+        level = self._tree
+        for value in path:
+            level = level.get(value)
+            if level is None:
+                return 0
+        # Walk the levels below the path down to the leaf counts
+        total = 0
+        pending = [(level, len(path))]
+        while pending:
+            level, depth = pending.pop()
+            if depth == len(self.FACET_KEYS):
+                total += level
+            else:
+                pending.extend((child, depth + 1) for child in level.values())
+        return total
+
+    def members(self, board, soc, build_image):
+        """
+        Get the IDs of the signals on a full facet path
+
+        Requires track_members.
+
+        Args:
+            board: Board value, matched exactly
+            soc: SoC value, matched exactly
+            build_image: Build image value, matched exactly
+
+        Returns:
+            list: The signal IDs, in the order they were indexed
+        """
+        return list(self._members.get((board, soc, build_image), ()))
@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Query Engine Module for Signal Manager
+Compound signal queries answered through secondary indexes
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+
+
+def _is_number(value):
+    """Check whether a value can go into a numeric index"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class Predicate:
+    """Base class for query predicates
+
+    Predicates combine with & (AND) and | (OR), e.g.
+    Eq("board", "DCu1") & Range("timeout", high=100) | Prefix("name", "Brake")
+    """
+
+    def matches(self, signal):
+        """
+        Check whether a signal satisfies the predicate
+
+        Args:
+            signal (dict): Signal data
+
+        Returns:
+            bool: True if the signal matches
+        """
+        raise NotImplementedError
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __or__(self, other):
+        return Or(self, other)
+
+
+class Eq(Predicate):
+    """field == value (the field must be present)"""
+
+    def __init__(self, field, value):
+        self.field = field
+        self.value = value
+
+    def matches(self, signal):
+        return self.field in signal and signal[self.field] == self.value
+
+    def __repr__(self):
+        return f"Eq({self.field!r}, {self.value!r})"
+
+
+class In(Predicate):
+    """field is one of a set of values"""
+
+    def __init__(self, field, values):
+        self.field = field
+        self.values = frozenset(values)
+
+    def matches(self, signal):
+        return self.field in signal and signal[self.field] in self.values
+
+    def __repr__(self):
+        return f"In({self.field!r}, {sorted(self.values, key=repr)!r})"
+
+
+class Range(Predicate):
+    """low <= field <= high on a numeric field; either bound may be omitted"""
+
+    def __init__(self, field, low=None, high=None, include_low=True, include_high=True):
+        self.field = field
+        self.low = low
+        self.high = high
+        self.include_low = include_low
+        self.include_high = include_high
+
+    def matches(self, signal):
+        value = signal.get(self.field)
+        if not _is_number(value):
+            return False
+        if self.low is not None:
+            if value < self.low or (value == self.low and not self.include_low):
+                return False
+        if self.high is not None:
+            if value > self.high or (value == self.high and not self.include_high):
+                return False
+        return True
+
+    def __repr__(self):
+        return f"Range({self.field!r}, {self.low!r}, {self.high!r})"
+
+
+class Prefix(Predicate):
+    """String field starts with a prefix"""
+
+    def __init__(self, field, prefix):
+        self.field = field
+        self.prefix = prefix
+
+    def matches(self, signal):
+        value = signal.get(self.field)
+        return isinstance(value, str) and value.startswith(self.prefix)
+
+    def __repr__(self):
+        return f"Prefix({self.field!r}, {self.prefix!r})"
+
+
+class Regex(Predicate):
+    """String field contains a match for a regular expression"""
+
+    METACHARACTERS = set(".^$*+?{}[]\\|()")
+
+    def __init__(self, field, pattern, flags=0):
+        self.field = field
+        self.pattern = re.compile(pattern, flags)
+
+    def literal_prefix(self):
+        """
+        Get the literal text every match must start with, if the pattern is anchored
+
+        Returns:
+            str: The literal prefix of a "^..." pattern, or "" if there is none
+        """
+        source = self.pattern.pattern
+        if not isinstance(source, str) or not source.startswith("^"):
+            return ""
+        # With MULTILINE "^" also matches after a newline, and VERBOSE drops whitespace
+        if self.pattern.flags & (re.IGNORECASE | re.MULTILINE | re.VERBOSE):
+            return ""
+        if self._has_top_level_alternation(source):
+            # "^Brake|Throttle" also matches "xThrottle"
+            return ""
+        prefix = []
+        for char in source[1:]:
+            if char in self.METACHARACTERS:
+                # A quantifier applies to the previous character, which is then optional
+                if char in "*?{" and prefix:
+                    prefix.pop()
+                break
+            prefix.append(char)
+        return "".join(prefix)
+
+    @staticmethod
+    def _has_top_level_alternation(source):
+        """Check whether a pattern has a "|" outside any group or character class"""
+        depth = 0
+        in_class = False
+        escaped = False
+        for char in source:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif in_class:
+                in_class = char != "]"
+            elif char == "[":
+                in_class = True
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char == "|" and depth == 0:
+                return True
+        return False
+
+    def matches(self, signal):
+        value = signal.get(self.field)
+        return isinstance(value, str) and self.pattern.search(value) is not None
+
+    def __repr__(self):
+        return f"Regex({self.field!r}, {self.pattern.pattern!r})"
+
+
+class And(Predicate):
+    """All child predicates match"""
+
+    def __init__(self, *predicates):
+        # Flatten nested ANDs so the planner sees every condition at once
+        flattened = []
+        for predicate in predicates:
+            flattened.extend(predicate.predicates if isinstance(predicate, And) else (predicate,))
+        self.predicates = tuple(flattened)
+
+    def matches(self, signal):
+        return all(predicate.matches(signal) for predicate in self.predicates)
+
+    def __repr__(self):
+        return f"And{self.predicates!r}"
+
+
+class Or(Predicate):
+    """At least one child predicate matches"""
+
+    def __init__(self, *predicates):
+        self.predicates = predicates
+
+    def matches(self, signal):
+        return any(predicate.matches(signal) for predicate in self.predicates)
+
+    def __repr__(self):
+        return f"Or{self.predicates!r}"
+
+
+# filter_signals keyword suffixes -> predicate builders
+LOOKUPS = {
+    "in": lambda field, value: In(field, value),
+    "gt": lambda field, value: Range(field, low=value, include_low=False),
+    "gte": lambda field, value: Range(field, low=value),
+    "lt": lambda field, value: Range(field, high=value, include_high=False),
+    "lte": lambda field, value: Range(field, high=value),
+    "startswith": lambda field, value: Prefix(field, value),
+    "regex": lambda field, value: Regex(field, value),
+}
+
+
+def predicate_from_kwargs(**kwargs):
+    """
+    Build a predicate from filter_signals style keyword arguments
+
+    Plain keywords compare for equality; a "__<lookup>" suffix selects
+    another comparison, e.g. timeout__lte=100, name__startswith="Brake",
+    asil__in=["C", "D"] or name__regex="_Req$".
+
+    Returns:
+        Predicate: AND of one predicate per keyword
+    """
+    predicates = []
+    for key, value in kwargs.items():
+        field, _, lookup = key.partition("__")
+        if lookup:
+            if lookup not in LOOKUPS:
+                raise ValueError(f"Unknown filter lookup '{lookup}' in '{key}'")
+            predicates.append(LOOKUPS[lookup](field, value))
+        else:
+            predicates.append(Eq(field, value))
+    return And(*predicates)
+
+
+class SortedIndex:
+    """Secondary index of (value, id) pairs kept in sorted order"""
+
+    def __init__(self, entries=()):
+        self._entries = sorted(entries)
+        self._values = [value for value, _ in self._entries]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, value, signal_id):
+        position = bisect_left(self._entries, (value, signal_id))
+        self._entries.insert(position, (value, signal_id))
+        self._values.insert(position, value)
+
+    def remove(self, value, signal_id):
+        position = bisect_left(self._entries, (value, signal_id))
+        if position < len(self._entries) and self._entries[position] == (value, signal_id):
+            del self._entries[position]
+            del self._values[position]
+
+    def bounds(self, low=None, high=None, include_low=True, include_high=True):
+        """Return the [start, stop) slice of entries between low and high"""
+        if low is None:
+            start = 0
+        elif include_low:
+            start = bisect_left(self._values, low)
+        else:
+            start = bisect_right(self._values, low)
+
+        if high is None:
+            stop = len(self._values)
+        elif include_high:
+            stop = bisect_right(self._values, high)
+        else:
+            stop = bisect_left(self._values, high)
+
+        return start, max(start, stop)
+
+    def prefix_bounds(self, prefix):
+        """Return the [start, stop) slice of string entries starting with prefix"""
+        start = bisect_left(self._values, prefix)
+        if not prefix:
+            return start, len(self._values)
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return start, bisect_left(self._values, upper)
+
+    def ids(self, start, stop):
+        """Return the IDs of the entries in a slice"""
+        return {signal_id for _, signal_id in self._entries[start:stop]}
+
+    def search(self, pattern, start, stop):
+        """Return the IDs of the string entries in a slice that match a compiled regex"""
+        search = pattern.search
+        return {signal_id for value, signal_id in self._entries[start:stop] if search(value)}
+
+
+class SignalQueryIndex:
+    """Secondary indexes and a small planner for signal queries
+
+    Lookups by ID and name use the ID/name index of the signal list,
+    equality/in-set lookups on categorical fields use hash postings, ranges on
+    numeric fields and prefixes on names use sorted indexes. For each query the
+    planner estimates how many signals every usable index would return and
+    materializes only the most selective one; the remaining conditions are
+    checked on those candidates. Queries no index can help with fall back to
+    a full scan.
+    """
+
+    HASH_FIELDS = ("board", "soc", "build_image", "data_type", "asil",
+                   "memory_region", "impl_approach", "checksum", "source_core")
+    NUMERIC_FIELDS = ("timeout", "periodicity", "buffer_count", "sm_buff_count", "array_size")
+    PREFIX_FIELDS = ("name",)
+
+    # Stop intersecting child indexes of an AND once this few candidates remain,
+    # or once the next index is INTERSECT_RATIO times larger than the candidates
+    INTERSECT_LIMIT = 256
+    INTERSECT_RATIO = 4
+
+    def __init__(self, signal_index, signals=None):
+        """
+        Initialize SignalQueryIndex
+
+        Args:
+            signal_index (SignalIndex): ID/name index of the same signals
+            signals (list, optional): Signals to index
+        """
+        self.signal_index = signal_index
+        self.rebuild(signals or [])
+
+    def rebuild(self, signals):
+        """
+        Rebuild every index from a list of signals
+
+        Args:
+            signals (list): Signals to index
+        """
+        postings = {field: {} for field in self.HASH_FIELDS}
+        numeric = {field: [] for field in self.NUMERIC_FIELDS}
+        prefix = {field: [] for field in self.PREFIX_FIELDS}
+
+        for signal in signals:
+            signal_id = signal.get("id")
+            if signal_id is None:
+                continue
+            for field, field_postings in postings.items():
+                if field in signal:
+                    try:
+                        field_postings.setdefault(signal[field], set()).add(signal_id)
+                    except TypeError:
+                        pass  # Unhashable values are only found by scanning
+            for field, entries in numeric.items():
+                if _is_number(signal.get(field)):
+                    entries.append((signal[field], signal_id))
+            for field, entries in prefix.items():
+                if isinstance(signal.get(field), str):
+                    entries.append((signal[field], signal_id))
+
+        # Sort each index once rather than inserting entry by entry
+        self._postings = postings
+        self._numeric = {field: SortedIndex(entries) for field, entries in numeric.items()}
+        self._prefix = {field: SortedIndex(entries) for field, entries in prefix.items()}
+
+    def add(self, signal):
+        """Index a signal"""
+        signal_id = signal.get("id")
+        if signal_id is None:
+            return
+        for field, postings in self._postings.items():
+            if field in signal:
+                try:
+                    postings.setdefault(signal[field], set()).add(signal_id)
+                except TypeError:
+                    pass  # Unhashable values are only found by scanning
+        for field, index in self._numeric.items():
+            if _is_number(signal.get(field)):
+                index.add(signal[field], signal_id)
+        for field, index in self._prefix.items():
+            if isinstance(signal.get(field), str):
+                index.add(signal[field], signal_id)
+
+    def remove(self, signal):
+        """Remove a signal from the indexes"""
+        signal_id = signal.get("id")
+        if signal_id is None:
+            return
+        for field, postings in self._postings.items():
+            if field in signal:
+                try:
+                    ids = postings.get(signal[field])
+                except TypeError:
+                    continue
+                if ids is not None:
+                    ids.discard(signal_id)
+                    if not ids:
+                        del postings[signal[field]]
+        for field, index in self._numeric.items():
+            if _is_number(signal.get(field)):
+                index.remove(signal[field], signal_id)
+        for field, index in self._prefix.items():
+            if isinstance(signal.get(field), str):
+                index.remove(signal[field], signal_id)
+
+    def update(self, old_signal, new_signal):
+        """Re-index a signal after it was replaced"""
+        self.remove(old_signal)
+        self.add(new_signal)
+
+    def _key_lookup(self, predicate):
+        """Return the IDs for an Eq/In predicate on "id" or "name", or None
+
+        The ID and name indexes only hold strings; other values (integer IDs,
+        a None name) are left to the postings or a scan.
+        """
+        if not isinstance(predicate, (Eq, In)) or predicate.field not in ("id", "name"):
+            return None
+        values = (predicate.value,) if isinstance(predicate, Eq) else predicate.values
+        if not all(isinstance(value, str) for value in values):
+            return None
+        result = set()
+        for value in values:
+            if predicate.field == "id":
+                if value in self.signal_index:
+                    result.add(value)
+            else:
+                result |= self.signal_index.names.owners(value)
+        return result
+
+    def estimate(self, predicate):
+        """
+        Estimate how many signals an index would return for a predicate
+
+        Args:
+            predicate (Predicate): The predicate to estimate
+
+        Returns:
+            int: Estimated candidate count, or None if no index applies
+        """
+        key_ids = self._key_lookup(predicate)
+        if key_ids is not None:
+            return len(key_ids)
+        if isinstance(predicate, Eq) and predicate.field in self._postings:
+            try:
+                return len(self._postings[predicate.field].get(predicate.value, ()))
+            except TypeError:
+                return None
+        if isinstance(predicate, In) and predicate.field in self._postings:
+            postings = self._postings[predicate.field]
+            return sum(len(postings.get(value, ())) for value in predicate.values)
+        if isinstance(predicate, Range) and predicate.field in self._numeric:
+            start, stop = self._numeric[predicate.field].bounds(
+                predicate.low, predicate.high, predicate.include_low, predicate.include_high)
+            return stop - start
+        if isinstance(predicate, Prefix) and predicate.field in self._prefix:
+            start, stop = self._prefix[predicate.field].prefix_bounds(predicate.prefix)
+            return stop - start
+        if isinstance(predicate, Regex) and predicate.field in self._prefix:
+            start, stop = self._prefix[predicate.field].prefix_bounds(predicate.literal_prefix())
+            return stop - start
+        if isinstance(predicate, And):
+            estimates = [e for e in map(self.estimate, predicate.predicates) if e is not None]
+            return min(estimates) if estimates else None
+        if isinstance(predicate, Or):
+            estimates = [self.estimate(child) for child in predicate.predicates]
+            return None if None in estimates else sum(estimates)
+        return None
+
+    def candidates(self, predicate):
+        """
+        Get the IDs that may match a predicate, using the best indexes
+
+        Args:
+            predicate (Predicate): The predicate to plan
+
+        Returns:
+            tuple: (set, Predicate) - the candidate signal IDs, or None if a full
+                scan is needed, and the residual predicate the candidates still
+                have to be checked against (None when every candidate matches)
+        """
+        key_ids = self._key_lookup(predicate)
+        if key_ids is not None:
+            exact = predicate.field == "id" or self.signal_index.names.case_sensitive
+            return key_ids, None if exact else predicate
+        if isinstance(predicate, Eq) and predicate.field in self._postings:
+            try:
+                return set(self._postings[predicate.field].get(predicate.value, ())), None
+            except TypeError:
+                return None, predicate  # Unhashable values are only found by scanning
+        if isinstance(predicate, In) and predicate.field in self._postings:
+            postings = self._postings[predicate.field]
+            result = set()
+            for value in predicate.values:
+                result.update(postings.get(value, ()))
+            return result, None
+        if isinstance(predicate, Range) and predicate.field in self._numeric:
+            index = self._numeric[predicate.field]
+            return index.ids(*index.bounds(predicate.low, predicate.high,
+                                           predicate.include_low, predicate.include_high)), None
+        if isinstance(predicate, Prefix) and predicate.field in self._prefix:
+            index = self._prefix[predicate.field]
+            return index.ids(*index.prefix_bounds(predicate.prefix)), None
+        if isinstance(predicate, Regex) and predicate.field in self._prefix:
+            # Match against the indexed strings only, narrowed by any literal prefix
+            index = self._prefix[predicate.field]
+            return index.search(predicate.pattern, *index.prefix_bounds(predicate.literal_prefix())), None
+        if isinstance(predicate, And):
+            return self._and_candidates(predicate)
+        if isinstance(predicate, Or):
+            result = set()
+            exact = True
+            for child in predicate.predicates:
+                child_ids, child_residual = self.candidates(child)
+                if child_ids is None:
+                    return None, predicate
+                result |= child_ids
+                exact = exact and child_residual is None
+            return result, None if exact else predicate
+        return None, predicate
+
+    def _and_candidates(self, predicate):
+        """Start from the most selective child index and intersect the next ones while the set is large"""
+        estimated = []
+        residual = []
+        for child in predicate.predicates:
+            estimate = self.estimate(child)
+            if estimate is None:
+                residual.append(child)
+            else:
+                estimated.append((estimate, len(estimated), child))
+        if not estimated:
+            return None, predicate
+
+        estimated.sort(key=lambda item: item[:2])
+        result = None
+        for estimate, _, child in estimated:
+            if result is not None and (len(result) <= self.INTERSECT_LIMIT or
+                                       estimate > len(result) * self.INTERSECT_RATIO):
+                # Checking the remaining candidates is cheaper than reading another index
+                residual.append(child)
+                continue
+            child_ids, child_residual = self.candidates(child)
+            result = child_ids if result is None else result & child_ids
+            if child_residual is not None:
+                residual.append(child_residual)
+
+        return result, And(*residual) if residual else None
+
+    def explain(self, predicate):
+        """
+        Describe how a predicate would be answered
+
+        Args:
+            predicate (Predicate): The predicate to plan
+
+        Returns:
+            str: "full scan" or the estimated number of indexed candidates
+        """
+        estimate = self.estimate(predicate)
+        if estimate is None:
+            return "full scan"
+        return f"index lookup, ~{estimate} candidates"
@@ -0,0 +1,335 @@
+from PyQt5.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PyQt5.QtGui import QBrush, QColor
+
+
+class CoreInfoNode:
+    """One row of the core info tree"""
+
+    __slots__ = ("parent", "row", "key", "kind", "label", "value", "data", "children")
+
+    def __init__(self, parent, row, key, kind, label, value, data):
+        self.parent = parent
+        self.row = row
+        self.key = key
+        self.kind = kind
+        self.label = label
+        self.value = value
+        self.data = data
+        # None until the rows below this one are first asked for
+        self.children = None
+
+
+class CoreInfoTreeModel(QAbstractItemModel):
+    """Model showing a project's core configuration in a QTreeView
+
+    With core_properties, the tree is Core Properties > SoC > core > property
+    rows; any other core info dictionary is shown key by key. Rows are only
+    created when the view asks for the children of a row, i.e. when it is
+    expanded, so a configuration with hundreds of cores costs the rows that
+    are opened.
+
+    set_core_info() compares the new configuration with the previous one
+    level by level in the rows already created: equal subtrees are left
+    alone, changed values become dataChanged notifications and added or
+    removed keys become row inserts and removals, so the view keeps its
+    expansion state and scroll position.
+    """
+
+    COLUMNS = ("Property", "Value")
+
+    KIND_ROOT = 0
+    KIND_GROUP = 1
+    KIND_SOC = 2
+    KIND_CORE = 3
+    KIND_PROPERTY = 4
+    KIND_ENTRY = 5
+
+    # Rows the view shows expanded when they first appear
+    EXPANDED_KINDS = (KIND_GROUP, KIND_SOC)
+
+    # Background of each kind of row, per column
+    BACKGROUNDS = {
+        KIND_GROUP: (QBrush(QColor("#e0e0e0")), QBrush(QColor("#e0e0e0"))),
+        KIND_SOC: (QBrush(QColor("#f0f0f0")), None),
+        KIND_CORE: (QBrush(QColor("#f8f8f8")), None),
+    }
+
+    def __init__(self, parent=None):
+        """Initialize the CoreInfoTreeModel
+
+        Args:
+            parent: Optional parent QObject
+        """
+        super(CoreInfoTreeModel, self).__init__(parent)
+        self._root = CoreInfoNode(None, 0, None, self.KIND_ROOT, "", "", {})
+
+    def set_core_info(self, core_info):
+        """Show a core configuration, updating only the rows that changed
+
+        Args:
+            core_info: The core_info dictionary of the project
+
+        Returns:
+            list: Indexes of the Core Properties and SoC rows that were not
+                shown before, for the view to expand
+        """
+        # Keep a private copy: the project's dictionaries may be edited in
+        # place, and the next update is compared against what is shown
+        core_info = self._snapshot(core_info) if isinstance(core_info, dict) else {}
+        added = []
+        if self._root.children is None:
+            # Nothing shown yet (the view may have been told there are no rows)
+            self.beginResetModel()
+            self._root.data = core_info
+            added.extend(self._children(self._root))
+            self.endResetModel()
+        else:
+            self._update_children(self._root, core_info, added)
+
+        # New expanded rows show their children straight away
+        expanded = []
+        while added:
+            node = added.pop()
+            if node.kind in self.EXPANDED_KINDS:
+                expanded.append(node)
+                added.extend(self._children(node))
+        return [self.createIndex(node.row, 0, node) for node in expanded]
+
+    # Building rows
+
+    def _entries(self, kind, data):
+        """Get the child rows of a row's data
+
+        Returns:
+            list: (key, kind, label, value, data) of each child row
+        """
+        if not isinstance(data, dict):
+            return []
+        if kind == self.KIND_ROOT:
+            if "core_properties" in data:
+                return [("core_properties", self.KIND_GROUP, "Core Properties", "", data["core_properties"])]
+            return [(key, self.KIND_ENTRY, str(key), self._value_text(value), value)
+                    for key, value in data.items()]
+        if kind == self.KIND_GROUP:
+            return [(soc_name, self.KIND_SOC, str(soc_name), "", cores) for soc_name, cores in data.items()]
+        if kind == self.KIND_SOC:
+            return [(core_name, self.KIND_CORE, str(core_name), "", properties)
+                    for core_name, properties in data.items()]
+        if kind == self.KIND_CORE:
+            # The name is already shown as the core row
+            return [(prop_name, self.KIND_PROPERTY, prop_name.replace('_', ' ').title(), str(prop_value), None)
+                    for prop_name, prop_value in data.items() if prop_name != 'name']
+        if kind == self.KIND_ENTRY:
+            return [(key, self.KIND_ENTRY, str(key), self._value_text(value), value)
+                    for key, value in data.items()]
+        return []
+
+    @staticmethod
+    def _value_text(value):
+        """Get the value column text of a key/value row"""
+        return "" if isinstance(value, dict) else str(value)
+
+    def _has_children(self, kind, data):
+        """Check whether a row has children without creating them"""
+        if not isinstance(data, dict) or not data:
+            return False
+        if kind == self.KIND_CORE:
+            return any(prop_name != 'name' for prop_name in data)
+        return kind != self.KIND_PROPERTY
+
+    def _new_node(self, parent, row, entry):
+        """Create the row of an entry returned by _entries"""
+        key, kind, label, value, data = entry
+        return CoreInfoNode(parent, row, key, kind, label, value, data)
+
+    def _children(self, node):
+        """Get the child rows of a row, creating them on first use"""
+        if node.children is None:
+            node.children = [self._new_node(node, row, entry)
+                             for row, entry in enumerate(self._entries(node.kind, node.data))]
+        return node.children
+
+    # Updating rows
+
+    def _identity(self, key, kind, data):
+        """Get what a row must keep to be updated in place rather than replaced
+
+        A row that gains or loses its children is replaced, so the view
+        picks up its new expand indicator.
+        """
+        return key, kind, self._has_children(kind, data)
+
+    def _update_children(self, node, data, added):
+        """Bring the created child rows of a row in line with its new data
+
+        Args:
+            node: The row, whose children have been created
+            data: Its new data
+            added: List collecting the rows inserted
+        """
+        if self._same(node.data, data):
+            # Nothing below this row changed
+            return
+        node.data = data
+
+        parent = self._index(node)
+        old = node.children
+        entries = self._entries(node.kind, data)
+        new_ids = [self._identity(key, kind, entry_data) for key, kind, _, _, entry_data in entries]
+        new_set = set(new_ids)
+        old_ids = [self._identity(child.key, child.kind, child.data) for child in old]
+        old_set = set(old_ids)
+
+        kept_old = [identity for identity in old_ids if identity in new_set]
+        kept_new = [identity for identity in new_ids if identity in old_set]
+        if kept_old != kept_new:
+            # Reordered keys: replace the rows of this level
+            if old:
+                self.beginRemoveRows(parent, 0, len(old) - 1)
+                node.children = []
+                self.endRemoveRows()
+            old, old_ids, old_set = [], [], set()
+
+        # Remove the rows whose key is gone, bottom-up by contiguous runs
+        row = len(old) - 1
+        while row >= 0:
+            if old_ids[row] in new_set:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and old_ids[row] not in new_set:
+                row -= 1
+            self.beginRemoveRows(parent, row + 1, last)
+            del node.children[row + 1:last + 1]
+            self._renumber(node)
+            self.endRemoveRows()
+
+        # Insert the rows of new keys at their positions, by contiguous runs
+        row = 0
+        while row < len(entries):
+            if new_ids[row] in old_set:
+                row += 1
+                continue
+            first = row
+            while row < len(entries) and new_ids[row] not in old_set:
+                row += 1
+            self.beginInsertRows(parent, first, row - 1)
+            nodes = [self._new_node(node, position, entries[position]) for position in range(first, row)]
+            node.children[first:first] = nodes
+            self._renumber(node)
+            self.endInsertRows()
+            added.extend(nodes)
+
+        # Update the rows that were kept
+        for child, entry, identity in zip(node.children, entries, new_ids):
+            if identity not in old_set:
+                continue
+            _, _, label, value, entry_data = entry
+            if child.label != label or child.value != value:
+                child.label = label
+                child.value = value
+                self.dataChanged.emit(self.createIndex(child.row, 0, child),
+                                      self.createIndex(child.row, len(self.COLUMNS) - 1, child))
+            if child.children is None:
+                child.data = entry_data
+            else:
+                self._update_children(child, entry_data, added)
+
+    @classmethod
+    def _snapshot(cls, value):
+        """Copy the dictionaries and lists of a configuration"""
+        # Cheaper than copy.deepcopy, which tracks every object it copies
+        if isinstance(value, dict):
+            return {key: cls._snapshot(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls._snapshot(item) for item in value]
+        return value
+
+    @staticmethod
+    def _same(old, new):
+        """Check whether two row data are equal, keys in the same order"""
+        if old != new:
+            return False
+        # Dictionary equality ignores the order of the keys, which is the row order
+        pending = [(old, new)] if isinstance(old, dict) else []
+        while pending:
+            old, new = pending.pop()
+            if list(old) != list(new):
+                return False
+            pending.extend((value, new[key]) for key, value in old.items() if isinstance(value, dict))
+        return True
+
+    @staticmethod
+    def _renumber(node):
+        """Store each child row's position after rows were inserted or removed"""
+        for row, child in enumerate(node.children):
+            child.row = row
+
+    # Qt model interface
+
+    def _index(self, node):
+        """Get the model index of a row"""
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def _node(self, index):
+        """Get the row of a model index"""
+        return index.internalPointer() if index.isValid() else self._root
+
+    def index(self, row, column, parent=QModelIndex()):
+        if column < 0 or column >= len(self.COLUMNS) or (parent.isValid() and parent.column() != 0):
+            return QModelIndex()
+        children = self._children(self._node(parent))
+        if row < 0 or row >= len(children):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self._index(index.internalPointer().parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        node = self._node(parent)
+        if node.children is None and not self._has_children(node.kind, node.data):
+            return 0
+        return len(self._children(node))
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() != 0:
+            return False
+        node = self._node(parent)
+        if node.children is not None:
+            return bool(node.children)
+        # Answered from the data, so drawing the expand indicators creates no rows
+        return self._has_children(node.kind, node.data)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.label if index.column() == 0 else node.value
+        if role == Qt.BackgroundRole:
+            backgrounds = self.BACKGROUNDS.get(node.kind)
+            return backgrounds[index.column()] if backgrounds else None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.COLUMNS):
+            return self.COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.internalPointer().kind == self.KIND_PROPERTY:
+            flags |= Qt.ItemNeverHasChildren
+        return flags
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BulkEditDialog module for setting attributes on several signals at once
+"""
+
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QGridLayout, QLabel, QComboBox,
+                             QCheckBox, QSpinBox, QDialogButtonBox, QMessageBox)
+
+
+class BulkEditDialog(QDialog):
+    """Dialog for setting the same attributes on a selection of signals
+
+    Each attribute has a check box; only the checked attributes are set on
+    the signals, the others keep their own values.
+    """
+
+    # Attribute -> (label, choices) for the attributes picked from a list,
+    # with the choices of the signal details dialog
+    CHOICE_ATTRIBUTES = {
+        "memory_region": ("Memory Region", ["DDR", "Cached", "NonCached"]),
+        "type": ("Type", ["Concurrent", "Sequential"]),
+        "asil": ("ASIL", ["QM", "A", "B", "C", "D"]),
+        "impl_approach": ("Implementation Approach", ["SharedMemory", "VRING", "IpcOvEth"]),
+        "checksum": ("Checksum", ["None", "Additive", "CustomChecksum"]),
+    }
+
+    # Attribute -> label for the True/False attributes
+    BOOL_ATTRIBUTES = {
+        "get_obj_ref": "Get Object Reference",
+        "notifiers": "Notifiers",
+    }
+
+    # Attribute -> (label, minimum, maximum) for the numeric attributes
+    NUMBER_ATTRIBUTES = {
+        "buffer_count_ipc": ("Buffer Count IPC", 1, 10),
+        "sm_buff_count": ("SM Buffer Count", 1, 10),
+        "timeout": ("Timeout", 10, 200),
+        "periodicity": ("Periodicity", 10, 200),
+    }
+
+    def __init__(self, parent=None, signal_count=0):
+        """Initialize the dialog
+
+        Args:
+            parent: The parent widget
+            signal_count: Number of signals the attributes will be set on
+        """
+        super(BulkEditDialog, self).__init__(parent)
+
+        self.signal_count = signal_count
+        self.result_attributes = None
+        # Attribute -> (check box, editor)
+        self.fields = {}
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Set up the user interface"""
+        self.setWindowTitle("Edit Selected Signals")
+
+        main_layout = QVBoxLayout(self)
+        main_layout.addWidget(QLabel(f"Set the checked attributes on {self.signal_count} selected signals:"))
+
+        grid = QGridLayout()
+        main_layout.addLayout(grid)
+
+        for name, (label, choices) in self.CHOICE_ATTRIBUTES.items():
+            editor = QComboBox()
+            editor.addItems(choices)
+            self.add_field(grid, name, label, editor)
+
+        for name, label in self.BOOL_ATTRIBUTES.items():
+            editor = QComboBox()
+            editor.addItems(["False", "True"])
+            self.add_field(grid, name, label, editor)
+
+        for name, (label, minimum, maximum) in self.NUMBER_ATTRIBUTES.items():
+            editor = QSpinBox()
+            editor.setRange(minimum, maximum)
+            self.add_field(grid, name, label, editor)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.on_ok)
+        button_box.rejected.connect(self.reject)
+        main_layout.addWidget(button_box)
+
+    def add_field(self, grid, name, label, editor):
+        """Add a check box and its editor as a row of the grid
+
+        Args:
+            grid: The grid layout of the attributes
+            name: The attribute name
+            label: The check box text
+            editor: The widget editing the value, enabled while checked
+        """
+        row = grid.rowCount()
+        check_box = QCheckBox(label)
+        editor.setEnabled(False)
+        check_box.toggled.connect(editor.setEnabled)
+        grid.addWidget(check_box, row, 0)
+        grid.addWidget(editor, row, 1)
+        self.fields[name] = (check_box, editor)
+
+    def collect_form_data(self):
+        """Collect the checked attributes
+
+        Returns:
+            dict: Attribute name -> value for each checked attribute
+        """
+        result = {}
+        for name, (check_box, editor) in self.fields.items():
+            if not check_box.isChecked():
+                continue
+            if name in self.BOOL_ATTRIBUTES:
+                result[name] = editor.currentText() == "True"
+            elif name in self.NUMBER_ATTRIBUTES:
+                result[name] = editor.value()
+            else:
+                result[name] = editor.currentText()
+        return result
+
+    def on_ok(self):
+        """Handle OK button click"""
+        attributes = self.collect_form_data()
+        if not attributes:
+            QMessageBox.warning(self, "Validation Error", "Check at least one attribute to set.")
+            return
+        self.result_attributes = attributes
+        self.accept()
+
+    @staticmethod
+    def get_attributes(parent=None, signal_count=0):
+        """Static method to show the dialog and return the attributes to set
+
+        Args:
+            parent: The parent widget
+            signal_count: Number of signals the attributes will be set on
+
+        Returns:
+            dict: Attribute name -> value for each checked attribute, or None if canceled
+        """
+        dialog = BulkEditDialog(parent, signal_count)
+        result = dialog.exec_()
+
+        if result == QDialog.Accepted:
+            return dialog.result_attributes
+
+        return None
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+AutoSaver module - debounced background autosave of the project to a recovery location
+"""
+
+import copy
+import os
+import threading
+import zlib
+
+from PyQt5.QtCore import QObject, QStandardPaths, QTimer, pyqtSignal
+
+
+def snapshot_project_data(project_data):
+    """Take a copy of the project data that later edits do not change
+
+    Copying the signals list (references only) freezes the signals as they
+    are, as the store never changes a signal in place (see SignalStore). The
+    rest of the project (version details, core configuration) is small and
+    edited in place, so it is deep-copied.
+
+    Args:
+        project_data: The project data dictionary
+
+    Returns:
+        dict: The snapshot
+    """
+    snapshot = {key: copy.deepcopy(value) for key, value in project_data.items() if key != "signals"}
+    if "signals" in project_data:
+        snapshot["signals"] = list(project_data["signals"])
+    return snapshot
+
+
+class AutoSaver(QObject):
+    """Saves a snapshot of the project to a recovery file once edits pause
+
+    schedule() (re)starts a DELAY_MS timer on every edit. When it fires, a
+    snapshot of the project data is taken on the GUI thread and written by
+    a worker thread through FileOperations.write_config_file, so the JSON
+    encoding never runs in a GUI event handler. Only one write runs at a time; edits
+    made during a write schedule another one after it.
+
+    The recovery file is named after the project and lives in the
+    application's data directory (Recovery/), never next to the user's file.
+    discard() never waits for a running write: it cancels it through an
+    event, and the worker deletes the file it wrote once it finishes.
+    """
+
+    # Pause in editing after which the project is autosaved
+    DELAY_MS = 5000
+
+    # Emitted on the GUI thread after each write not cancelled: (recovery path, error
+    # message or empty string)
+    saved = pyqtSignal(str, str)
+
+    # Emitted on the GUI thread after each write, cancelled ones included
+    _finished = pyqtSignal()
+
+    def __init__(self, file_operations, get_project_data, parent=None):
+        """Initialize the AutoSaver
+
+        Args:
+            file_operations: The FileOperations writing the file
+            get_project_data: Callable returning (project data, project file
+                path or "") when a snapshot is taken
+            parent: Optional parent QObject
+        """
+        super(AutoSaver, self).__init__(parent)
+        self.file_operations = file_operations
+        self.get_project_data = get_project_data
+        self.enabled = True
+        self._worker = None
+        # Set by discard to cancel the running write
+        self._cancelled = threading.Event()
+        self._pending = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DELAY_MS)
+        self._timer.timeout.connect(self.save_now)
+        self._finished.connect(self._on_finished)
+
+    def set_delay(self, delay_ms):
+        """Change the pause in editing after which the project is autosaved"""
+        self._timer.setInterval(delay_ms)
+
+    @staticmethod
+    def recovery_path(project_path):
+        """Get the recovery file of a project
+
+        Args:
+            project_path: Path of the project file, or "" for an unsaved project
+
+        Returns:
+            str: Path of the recovery file
+        """
+        directory = os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation), "Recovery")
+        if not project_path:
+            return os.path.join(directory, "Untitled.smgr")
+        # Projects of the same name in different folders get different files
+        name = os.path.splitext(os.path.basename(project_path))[0]
+        key = zlib.crc32(os.path.abspath(project_path).encode("utf-8"))
+        return os.path.join(directory, f"{name}-{key:08x}.smgr")
+
+    def schedule(self):
+        """Autosave once edits pause for the delay"""
+        if self.enabled:
+            self._timer.start()
+
+    def save_now(self):
+        """Take a snapshot of the project and write it on the worker thread"""
+        if self._worker is not None and self._worker.is_alive():
+            # Written again once the running write finishes
+            self._pending = True
+            return
+        self._pending = False
+
+        project_data, project_path = self.get_project_data()
+        if not project_data:
+            return
+        snapshot = snapshot_project_data(project_data)
+        path = self.recovery_path(project_path)
+        self._cancelled = threading.Event()
+        self._worker = threading.Thread(target=self._write, args=(path, snapshot, self._cancelled),
+                                        name="SignalManagerAutoSave", daemon=True)
+        self._worker.start()
+
+    def _write(self, path, snapshot, cancelled):
+        """Write a snapshot to the recovery file (worker thread)"""
+        error = ""
+        try:
+            if not cancelled.is_set():
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Replaced atomically, so a crash mid-write keeps the previous one
+                self.file_operations.write_config_file(path, snapshot)
+        except Exception as e:
+            error = str(e)
+        # Checked after the file is in place, so a discard during the write
+        # cannot leave it behind
+        if cancelled.is_set():
+            _remove_file(path)
+        else:
+            self.saved.emit(path, error)
+        self._finished.emit()
+
+    def _on_finished(self):
+        """Start the write that was asked for during the last one"""
+        if self._pending:
+            self.save_now()
+
+    def discard(self, project_path):
+        """Stop a scheduled autosave and delete the project's recovery file
+
+        Args:
+            project_path: Path of the project file, or "" for an unsaved project
+        """
+        self._timer.stop()
+        self._pending = False
+        # A running write deletes its file itself once it finishes
+        self._cancelled.set()
+        _remove_file(self.recovery_path(project_path))
+
+    def find_recovery(self, project_path):
+        """Get the recovery file of a project if it is newer than the project file
+
+        Args:
+            project_path: Path of the project file
+
+        Returns:
+            str: Path of the recovery file, or None if there is none worth restoring
+        """
+        path = self.recovery_path(project_path)
+        try:
+            if os.path.getmtime(path) > os.path.getmtime(project_path):
+                return path
+        except OSError:
+            pass
+        return None
+
+
+def _remove_file(path):
+    """Delete a file if it exists"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+EditJournal module - crash-safe, append-only journal of signal edits next to a project file
+"""
+
+import json
+import os
+import struct
+import time
+import zlib
+
+from Modules.SignalOperations.SignalRecord import json_default
+
+
+class EditJournal:
+    """Write-ahead journal of the signal edits made since a project was last saved
+
+    The journal lives next to the project file (project.smgr.journal). It
+    starts with a header naming the size and modification time of the
+    project file it applies to, followed by one record per signal store
+    change: a 4-byte length, a 4-byte CRC32 and the change as compact JSON
+    (["add", signals], ["insert", [[position, signal], ...]],
+    ["update", signals], ["remove", ids] or ["reset", signals]). "insert"
+    records signals put back inside the list (undo of a delete), in
+    ascending position order. Recording an edit serializes only the signals
+    it touched.
+
+    Records are written to the file as they come, so they survive a crash
+    of the application; os.fsync, which makes them survive a power loss,
+    is batched to every FSYNC_RECORDS records or FSYNC_INTERVAL seconds
+    (and sync() can be called from a timer for the tail).
+
+    On open, replay() applies the records to the signals read from the
+    project file, stopping at the first torn or corrupt record. A journal
+    whose header does not match the project file (it was saved since, or
+    by another tool) is ignored. Saving the project compacts the journal
+    back to its header.
+    """
+
+    MAGIC = b"SMGRJNL1"
+    SUFFIX = ".journal"
+
+    # Record prefix: payload length and CRC32, little endian
+    RECORD_HEADER = struct.Struct("<II")
+
+    # Records and seconds between two fsync calls
+    FSYNC_RECORDS = 64
+    FSYNC_INTERVAL = 1.0
+
+    def __init__(self, base_path):
+        """Initialize the EditJournal
+
+        Args:
+            base_path: Path of the project file the journal belongs to
+        """
+        self.base_path = base_path
+        self.path = base_path + self.SUFFIX
+        self.store = None
+        self._file = None
+        # Offsets of the end of the header and of the last valid record,
+        # as found by replay() or written since
+        self._header_end = None
+        self._valid_end = None
+        self._unsynced = 0
+        self._last_sync = 0.0
+
+    # Reading
+
+    def _fingerprint(self):
+        """Get the size and modification time identifying the project file's contents"""
+        try:
+            stat = os.stat(self.base_path)
+        except OSError:
+            return None
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _read_records(self):
+        """Read the journal's records
+
+        Returns:
+            tuple: (list of decoded records, offset after the last valid
+                one), or (None, None) if there is no journal for the current
+                project file
+        """
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None, None
+        if not data.startswith(self.MAGIC):
+            return None, None
+
+        records = []
+        header_end = None
+        offset = len(self.MAGIC)
+        header_size = self.RECORD_HEADER.size
+        while offset + header_size <= len(data):
+            length, checksum = self.RECORD_HEADER.unpack_from(data, offset)
+            start = offset + header_size
+            payload = data[start:start + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                # Torn or corrupt tail, everything after it is lost
+                break
+            records.append(json.loads(payload.decode("utf-8")))
+            offset = start + length
+            if header_end is None:
+                header_end = offset
+
+        # The first record is the header naming the project file
+        if not records or records[0] != ["base", self._fingerprint()]:
+            return None, None
+        self._header_end = header_end
+        return records[1:], offset
+
+    def replay(self, signals):
+        """Apply the journal's records to the signals read from the project file
+
+        Args:
+            signals: The project's signals list, as decoded from JSON; changed in place
+
+        Returns:
+            int: The number of records applied (0 if there is no journal)
+        """
+        records, self._valid_end = self._read_records()
+        if not records:
+            return 0
+
+        positions = {signal.get("id"): position for position, signal in enumerate(signals)}
+        removed = False
+        for operation, payload in records:
+            if operation == "add":
+                for signal in payload:
+                    positions[signal.get("id")] = len(signals)
+                    signals.append(signal)
+            elif operation == "insert":
+                if removed:
+                    signals[:] = [signal for signal in signals if signal is not None]
+                    removed = False
+                for position, signal in payload:
+                    signals.insert(position, signal)
+                positions = {signal.get("id"): position for position, signal in enumerate(signals)}
+            elif operation == "update":
+                for signal in payload:
+                    position = positions.get(signal.get("id"))
+                    if position is not None:
+                        signals[position] = signal
+            elif operation == "remove":
+                for signal_id in payload:
+                    position = positions.pop(signal_id, None)
+                    if position is not None:
+                        signals[position] = None
+                        removed = True
+            elif operation == "reset":
+                signals[:] = payload
+                positions = {signal.get("id"): position for position, signal in enumerate(signals)}
+                removed = False
+
+        if removed:
+            signals[:] = [signal for signal in signals if signal is not None]
+        return len(records)
+
+    # Writing
+
+    def start(self, store):
+        """Start recording the changes of a signal store
+
+        Records found by replay() are kept (after cutting off a torn tail);
+        any other journal is replaced by an empty one.
+
+        Args:
+            store: The SignalStore to record
+        """
+        if self._file is None:
+            if self._valid_end is not None:
+                self._file = open(self.path, "r+b", buffering=0)
+                self._file.truncate(self._valid_end)
+                self._file.seek(self._valid_end)
+            else:
+                self._file = open(self.path, "w+b", buffering=0)
+                self._write_header()
+        if store is not self.store:
+            if self.store is not None:
+                self.store.unsubscribe(self._on_signals_changed)
+            self.store = store
+            store.subscribe(self._on_signals_changed)
+
+    def _write_header(self):
+        """Write the magic and the project file's fingerprint, and make them durable"""
+        self._file.write(self.MAGIC)
+        self._append(["base", self._fingerprint()])
+        self._header_end = self._file.tell()
+        self._unsynced = 1
+        self.sync()
+
+    def _on_signals_changed(self, event, signal_ids):
+        """Record a store change"""
+        if event == "added":
+            self._record_added(signal_ids)
+        elif event == "updated":
+            signals = [self.store.get(signal_id) for signal_id in signal_ids]
+            self.record(["update", [signal for signal in signals if signal is not None]])
+        elif event == "removed":
+            self.record(["remove", list(signal_ids)])
+        elif event == "reset":
+            self.record(["reset", self.store.signals])
+
+    def _record_added(self, signal_ids):
+        """Record added signals as appended, or with their positions if they went inside the list"""
+        position = self.store.index.position
+        entries = sorted((position(signal_id), signal_id) for signal_id in signal_ids
+                         if signal_id in self.store)
+        first = len(self.store.signals) - len(entries)
+        if all(row == first + offset for offset, (row, signal_id) in enumerate(entries)):
+            self.record(["add", [self.store.get(signal_id) for row, signal_id in entries]])
+        else:
+            self.record(["insert", [[row, self.store.get(signal_id)] for row, signal_id in entries]])
+
+    def record(self, change):
+        """Append a change to the journal
+
+        Args:
+            change: [operation, payload] as described in the class docstring
+        """
+        if self._file is None:
+            return
+        self._append(change)
+        self._unsynced += 1
+        if self._unsynced >= self.FSYNC_RECORDS or time.monotonic() - self._last_sync >= self.FSYNC_INTERVAL:
+            self.sync()
+
+    def _append(self, change):
+        """Write one length-prefixed, checksummed record"""
+        payload = json.dumps(change, separators=(",", ":"), default=json_default).encode("utf-8")
+        # One write call, so a crash leaves at most one torn record
+        self._file.write(self.RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+
+    def sync(self):
+        """Make the records written so far durable"""
+        if self._file is None or not self._unsynced:
+            return
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def compact(self):
+        """Empty the journal after the project file was saved with every change in it"""
+        if self._file is None:
+            self._valid_end = None
+            return
+        self._file.seek(0)
+        self._file.truncate()
+        self._write_header()
+
+    def rebase(self):
+        """Make the journal apply to the project file again after it was rewritten
+
+        For a project file rewritten without the journaled edits (e.g. a
+        configuration change written over the saved signals): the records
+        are kept, under a header naming the file's new fingerprint.
+        """
+        if self._file is None:
+            return
+        self._file.seek(self._header_end)
+        records = self._file.read()
+        self._file.seek(0)
+        self._file.truncate()
+        self._write_header()
+        self._file.write(records)
+        self._unsynced += 1
+        self.sync()
+
+    def close(self, discard=False):
+        """Stop recording
+
+        Args:
+            discard: True to delete the journal, e.g. when the changes were
+                thrown away; otherwise it is kept if it holds any record
+        """
+        if self.store is not None:
+            self.store.unsubscribe(self._on_signals_changed)
+            self.store = None
+        end = self._valid_end
+        if self._file is not None:
+            self.sync()
+            end = self._file.tell()
+            self._file.close()
+            self._file = None
+        if discard or end is None or end <= self._header_end:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+        self._header_end = None
+        self._valid_end = None
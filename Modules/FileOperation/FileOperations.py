@@ -1,11 +1,24 @@
 import json
 from PyQt5 import QtWidgets
 
+from Modules.SignalOperations.SignalRecord import signals_from_json
+from Modules.SignalOperations.StringPool import StringPool
+from Modules.FileOperation.EditJournal import EditJournal
+from Modules.FileOperation.ProjectWriter import write_project_file
+
 class FileOperations:
     def __init__(self, main_window):
         self.main_window = main_window
         self.current_file = None
         self.modified = False
+        self.string_pool = None
+        # Journal of the signal edits made since the current file was saved
+        self.journal = None
+        # Number of journal records replayed by the last load_config_file,
+        # 0 if they left the signals as the file has them
+        self.recovered_records = 0
+        # Whether project files are written without indentation (smaller, faster)
+        self.compact_json = False
 
     def new_file(self):
         """Handle File -> New action"""
@@ -68,18 +81,41 @@ class FileOperations:
             
             current_config['core_config'] = config_data
             
-            with open(self.current_file, 'w') as f:
-                json.dump(current_config, f, indent=4)
+            self.write_config_file(self.current_file, current_config)
+            
+            # The journal must name the rewritten file, or the next load
+            # would take it for another file's journal and drop its edits
+            if self.journal is not None and self.journal.base_path == self.current_file:
+                self.journal.rebase()
                 
             self.modified = False
         except Exception as e:
             QtWidgets.QMessageBox.critical(self.main_window, "Error", f"Failed to update file: {str(e)}")
             
+    def write_config_file(self, file_path, project_data):
+        """Write project data to a file, raising on failure
+        
+        The file is replaced atomically: a failed or interrupted write
+        leaves the previous file as it was. Safe to call from a worker
+        thread (e.g. by the AutoSaver): it shows no dialog and leaves the
+        file state alone.
+        """
+        write_project_file(file_path, project_data, self.compact_json)
+            
     def save_config_file(self, file_path, project_data):
         """Save project data to the specified file path"""
         try:
-            with open(file_path, 'w') as f:
-                json.dump(project_data, f, indent=4)
+            self.write_config_file(file_path, project_data)
+            
+            # The file now holds every journaled edit
+            if self.journal is not None and self.journal.base_path == file_path:
+                self.journal.compact()
+            else:
+                store = self.journal.store if self.journal is not None else None
+                self.close_journal(discard=True)
+                self.journal = EditJournal(file_path)
+                if store is not None:
+                    self.journal.start(store)
             
             self.current_file = file_path
             self.modified = False
@@ -94,12 +130,87 @@ class FileOperations:
             with open(file_path, 'r') as f:
                 self.current_data = json.load(f)
             
+            # Apply the edits journaled since the file was last saved, e.g.
+            # before a crash
+            self.close_journal()
+            self.journal = EditJournal(file_path)
+            self.recovered_records = 0
+            signals = self.current_data.get("signals") if isinstance(self.current_data, dict) else None
+            if isinstance(signals, list):
+                # Replay replaces signals rather than changing them
+                saved = list(signals)
+                self.recovered_records = self.journal.replay(signals)
+                if self.recovered_records and signals == saved:
+                    # Edits undone back to the saved state: nothing to recover
+                    self.recovered_records = 0
+                    self.journal.close(discard=True)
+                    self.journal = EditJournal(file_path)
+            
+            # Share repeated category strings and keep signals as compact records
+            self.string_pool = StringPool()
+            if isinstance(signals, list):
+                self.string_pool.intern_signals(signals)
+                self.current_data["signals"] = signals_from_json(signals)
+            
             self.current_file = file_path
             self.modified = False
             return True
         except Exception as e:
             QtWidgets.QMessageBox.critical(self.main_window, "Error", f"Failed to load file: {str(e)}")
             return False
+
+    def load_recovery_file(self, recovery_path):
+        """Load the autosaved recovery copy of the current file
+
+        The copy replaces the loaded data; the current file and its journal
+        stay, so saving writes the recovered project over the user's file.
+        """
+        try:
+            with open(recovery_path, 'r') as f:
+                data = json.load(f)
+
+            self.string_pool = StringPool()
+            signals = data.get("signals") if isinstance(data, dict) else None
+            if isinstance(signals, list):
+                self.string_pool.intern_signals(signals)
+                data["signals"] = signals_from_json(signals)
+
+            self.current_data = data
+            self.modified = True
+            return True
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self.main_window, "Error", f"Failed to restore recovery file: {str(e)}")
+            return False
+
+    def start_journal(self, store):
+        """Journal the edits of a signal store next to the current file
+        
+        Args:
+            store: The SignalStore holding the file's signals
+        """
+        if self.journal is not None:
+            self.journal.start(store)
+            
+    def sync_journal(self):
+        """Make the journaled edits durable, e.g. from a timer"""
+        if self.journal is not None:
+            self.journal.sync()
+            
+    def compact_journal(self):
+        """Empty the journal, e.g. once the signals are back to the saved state"""
+        if self.journal is not None:
+            self.journal.compact()
+            
+    def close_journal(self, discard=False):
+        """Stop journaling the current file
+        
+        Args:
+            discard: True if the unsaved edits were thrown away, so they are
+                not replayed on the next load
+        """
+        if self.journal is not None:
+            self.journal.close(discard)
+            self.journal = None
             
     def get_current_data(self):
         """Return the currently loaded data"""
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ProjectWriter module - atomic, streaming JSON writer for project files
+"""
+
+import json
+import os
+import shutil
+
+from Modules.SignalOperations.SignalRecord import SlotRecord, json_default
+
+# Signals encoded per encoder call
+SIGNAL_BATCH = 256
+
+# Characters written to the file per write call
+WRITE_CHUNK_SIZE = 1 << 18
+
+
+def iter_project_json(project_data, compact=False):
+    """Encode project data as JSON, a batch of signals at a time
+
+    The output is the same as json.dump(project_data, f, indent=4) (or
+    with separators=(",", ":") when compact), but the signals list is
+    encoded SIGNAL_BATCH signals at a time, so the whole document never
+    exists as one string. json only uses its C encoder without indent, so
+    compact output is faster to write as well as smaller.
+
+    Args:
+        project_data: The project data dictionary
+        compact: True for JSON without indentation or spaces
+
+    Yields:
+        str: Consecutive pieces of the document
+    """
+    if compact:
+        encoder = json.JSONEncoder(separators=(",", ":"), default=json_default)
+        item_separator, key_separator = ",", ":"
+        open_object, close_object = "{", "}"
+        open_list, close_list = "[", "]"
+    else:
+        encoder = json.JSONEncoder(indent=4, default=json_default)
+        item_separator, key_separator = ",\n    ", ": "
+        open_object, close_object = "{\n    ", "\n}"
+        open_list, close_list = "[\n        ", "\n    ]"
+
+    def nested(value):
+        """Encode a value of the top-level object"""
+        text = encoder.encode(value)
+        return text if compact else text.replace("\n", "\n    ")
+
+    if not project_data:
+        yield "{}"
+        return
+
+    yield open_object
+    for position, (key, value) in enumerate(project_data.items()):
+        if position:
+            yield item_separator
+        yield encoder.encode(key) + key_separator
+        if key == "signals" and isinstance(value, list) and value:
+            yield open_list
+            for start in range(0, len(value), SIGNAL_BATCH):
+                if start:
+                    yield item_separator + ("" if compact else "    ")
+                # Records are converted here rather than through json_default,
+                # which the encoder calls far more slowly
+                batch = [signal.to_json() if isinstance(signal, SlotRecord) else signal
+                         for signal in value[start:start + SIGNAL_BATCH]]
+                yield nested(batch)[len(open_list):-len(close_list)]
+            yield close_list
+        else:
+            yield nested(value)
+    yield close_object
+
+
+def write_project_file(file_path, project_data, compact=False):
+    """Write project data to a file atomically, raising on failure
+
+    The document is streamed into a temporary file next to file_path,
+    flushed to disk with os.fsync and renamed over file_path, so a crash,
+    power loss or encoding error at any point leaves either the old file
+    or the complete new one. The new file keeps the permissions of the one
+    it replaces.
+
+    Args:
+        file_path: Path of the project file
+        project_data: The project data dictionary
+        compact: True for JSON without indentation or spaces
+    """
+    temp_path = file_path + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            pending = []
+            size = 0
+            for piece in iter_project_json(project_data, compact):
+                pending.append(piece)
+                size += len(piece)
+                if size >= WRITE_CHUNK_SIZE:
+                    f.write("".join(pending))
+                    pending.clear()
+                    size = 0
+            f.write("".join(pending))
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    _sync_directory(os.path.dirname(os.path.abspath(file_path)))
+
+
+def _sync_directory(directory):
+    """Make a rename in a directory durable (POSIX only)"""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PersistentMap module - immutable hash array mapped trie with structural sharing
+"""
+
+# Bits of the key hash used per trie level, and the levels a 32-bit hash allows
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_MASK = 0xFFFFFFFF
+_MAX_SHIFT = 30
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(value):
+        return bin(value).count("1")
+
+
+class _Leaf:
+    """One key and its value"""
+
+    __slots__ = ("hash", "key", "value")
+
+    def __init__(self, key_hash, key, value):
+        self.hash = key_hash
+        self.key = key
+        self.value = value
+
+
+class _Collision:
+    """Keys whose 32-bit hashes are all equal, below the last trie level"""
+
+    __slots__ = ("hash", "leaves")
+
+    def __init__(self, key_hash, leaves):
+        self.hash = key_hash
+        self.leaves = leaves
+
+
+class _Node:
+    """Trie level: a bitmap of the used 5-bit slots and their entries, in slot order"""
+
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap, entries):
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+def _hash(key):
+    return hash(key) & _HASH_MASK
+
+
+def _iter_leaves(entry):
+    """Yield every leaf below a trie entry"""
+    if isinstance(entry, _Leaf):
+        yield entry
+    elif isinstance(entry, _Collision):
+        yield from entry.leaves
+    else:
+        pending = [entry]
+        while pending:
+            node = pending.pop()
+            for child in node.entries:
+                if isinstance(child, _Leaf):
+                    yield child
+                elif isinstance(child, _Collision):
+                    yield from child.leaves
+                else:
+                    pending.append(child)
+
+
+def _join(leaf_a, leaf_b, shift):
+    """Make the smallest subtree holding two leaves with different keys"""
+    if shift > _MAX_SHIFT:
+        return _Collision(leaf_a.hash, (leaf_a, leaf_b))
+    slot_a = (leaf_a.hash >> shift) & _MASK
+    slot_b = (leaf_b.hash >> shift) & _MASK
+    if slot_a == slot_b:
+        return _Node(1 << slot_a, (_join(leaf_a, leaf_b, shift + _BITS),))
+    entries = (leaf_a, leaf_b) if slot_a < slot_b else (leaf_b, leaf_a)
+    return _Node((1 << slot_a) | (1 << slot_b), entries)
+
+
+def _set(entry, shift, leaf):
+    """Get a copy of a trie entry with a leaf stored, or entry itself if nothing changes
+
+    Returns:
+        tuple: (new entry, True if the key was new)
+    """
+    if isinstance(entry, _Collision):
+        for position, old in enumerate(entry.leaves):
+            if old.key == leaf.key:
+                if old.value is leaf.value:
+                    return entry, False
+                leaves = entry.leaves[:position] + (leaf,) + entry.leaves[position + 1:]
+                return _Collision(entry.hash, leaves), False
+        return _Collision(entry.hash, entry.leaves + (leaf,)), True
+
+    bit = 1 << ((leaf.hash >> shift) & _MASK)
+    position = _popcount(entry.bitmap & (bit - 1))
+    entries = entry.entries
+    if not entry.bitmap & bit:
+        return _Node(entry.bitmap | bit, entries[:position] + (leaf,) + entries[position:]), True
+
+    child = entries[position]
+    if isinstance(child, _Leaf):
+        if child.key == leaf.key:
+            if child.value is leaf.value:
+                return entry, False
+            new_child, added = leaf, False
+        else:
+            new_child, added = _join(child, leaf, shift + _BITS), True
+    else:
+        new_child, added = _set(child, shift + _BITS, leaf)
+        if new_child is child:
+            return entry, False
+    return _Node(entry.bitmap, entries[:position] + (new_child,) + entries[position + 1:]), added
+
+
+def _delete(entry, shift, key_hash, key):
+    """Get a copy of a trie entry without a key
+
+    Returns:
+        The new entry (None if it became empty, a lone _Leaf to be pulled
+        up into the parent), or entry itself if the key is not there
+    """
+    if isinstance(entry, _Collision):
+        leaves = tuple(leaf for leaf in entry.leaves if leaf.key != key)
+        if len(leaves) == len(entry.leaves):
+            return entry
+        return leaves[0] if len(leaves) == 1 else _Collision(entry.hash, leaves)
+
+    bit = 1 << ((key_hash >> shift) & _MASK)
+    if not entry.bitmap & bit:
+        return entry
+    position = _popcount(entry.bitmap & (bit - 1))
+    entries = entry.entries
+    child = entries[position]
+    if isinstance(child, _Leaf):
+        if child.key != key:
+            return entry
+        new_child = None
+    else:
+        new_child = _delete(child, shift + _BITS, key_hash, key)
+        if new_child is child:
+            return entry
+
+    if new_child is None:
+        entries = entries[:position] + entries[position + 1:]
+        bitmap = entry.bitmap & ~bit
+        if not entries:
+            return None
+    else:
+        entries = entries[:position] + (new_child,) + entries[position + 1:]
+        bitmap = entry.bitmap
+    # A level left with a single leaf is folded into its parent
+    if len(entries) == 1 and isinstance(entries[0], _Leaf) and shift:
+        return entries[0]
+    return _Node(bitmap, entries)
+
+
+def _build(leaves, shift):
+    """Build the trie entry holding a list of leaves with distinct keys"""
+    if len(leaves) == 1:
+        return leaves[0]
+    if shift > _MAX_SHIFT:
+        return _Collision(leaves[0].hash, tuple(leaves))
+    slots = {}
+    for leaf in leaves:
+        slots.setdefault((leaf.hash >> shift) & _MASK, []).append(leaf)
+    bitmap = 0
+    entries = []
+    for slot in sorted(slots):
+        bitmap |= 1 << slot
+        entries.append(_build(slots[slot], shift + _BITS))
+    return _Node(bitmap, tuple(entries))
+
+
+def _entry_items(entry):
+    """Get the key -> value dict of a trie entry (None for a missing entry)"""
+    if entry is None:
+        return {}
+    return {leaf.key: leaf.value for leaf in _iter_leaves(entry)}
+
+
+def _diff(entry_a, entry_b, added, removed, changed):
+    """Collect the differences between two trie entries, skipping shared subtrees"""
+    if entry_a is entry_b:
+        return
+    if isinstance(entry_a, _Node) and isinstance(entry_b, _Node):
+        bitmap = entry_a.bitmap | entry_b.bitmap
+        while bitmap:
+            bit = bitmap & -bitmap
+            bitmap ^= bit
+            child_a = entry_a.entries[_popcount(entry_a.bitmap & (bit - 1))] if entry_a.bitmap & bit else None
+            child_b = entry_b.entries[_popcount(entry_b.bitmap & (bit - 1))] if entry_b.bitmap & bit else None
+            _diff(child_a, child_b, added, removed, changed)
+        return
+
+    # Different shapes (or leaves) only occur for a few keys: compare them directly
+    items_a = _entry_items(entry_a)
+    items_b = _entry_items(entry_b)
+    for key, value in items_b.items():
+        if key not in items_a:
+            added.append(key)
+        elif items_a[key] is not value:
+            changed.append(key)
+    removed.extend(key for key in items_a if key not in items_b)
+
+
+class PersistentMap:
+    """Immutable mapping whose updated copies share every unchanged part
+
+    A hash array mapped trie: keys are placed by 5-bit chunks of their hash
+    in nodes of up to 32 entries. set() and delete() copy only the nodes on
+    the path to the key (O(log32 n)) and return a new map; the old one is
+    unchanged and shares every other node with it. Taking a snapshot is
+    therefore just keeping a reference, and diff() skips every subtree the
+    two maps share, so it costs in proportion to what changed between them.
+
+    Values are compared by identity, which suits values that are replaced
+    rather than changed in place (such as the signals of a SignalStore).
+    """
+
+    __slots__ = ("_root", "_count")
+
+    def __init__(self, items=None):
+        """Initialize the PersistentMap
+
+        Args:
+            items: Optional mapping or iterable of (key, value) pairs
+        """
+        self._root = _EMPTY_NODE
+        self._count = 0
+        if items is not None:
+            pairs = items.items() if hasattr(items, "items") else items
+            latest = {}
+            for key, value in pairs:
+                latest[key] = value
+            if latest:
+                self._root = _build([_Leaf(_hash(key), key, value) for key, value in latest.items()], 0)
+                if not isinstance(self._root, _Node):
+                    # A single key still lives in a node at the top level
+                    self._root = _Node(1 << (self._root.hash & _MASK), (self._root,))
+                self._count = len(latest)
+
+    @classmethod
+    def _make(cls, root, count):
+        result = cls.__new__(cls)
+        result._root = root
+        result._count = count
+        return result
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return (leaf.key for leaf in _iter_leaves(self._root))
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        """Get the value of a key
+
+        Args:
+            key: The key
+            default: Value returned if the key is missing
+
+        Returns:
+            The value, or default
+        """
+        key_hash = _hash(key)
+        entry = self._root
+        shift = 0
+        while isinstance(entry, _Node):
+            bit = 1 << ((key_hash >> shift) & _MASK)
+            if not entry.bitmap & bit:
+                return default
+            entry = entry.entries[_popcount(entry.bitmap & (bit - 1))]
+            shift += _BITS
+        if isinstance(entry, _Leaf):
+            return entry.value if entry.key == key else default
+        for leaf in entry.leaves:
+            if leaf.key == key:
+                return leaf.value
+        return default
+
+    def items(self):
+        """Iterate over the (key, value) pairs, in no particular order"""
+        return ((leaf.key, leaf.value) for leaf in _iter_leaves(self._root))
+
+    def values(self):
+        """Iterate over the values, in no particular order"""
+        return (leaf.value for leaf in _iter_leaves(self._root))
+
+    def set(self, key, value):
+        """Get a copy of the map with a key set
+
+        Args:
+            key: The key
+            value: Its value
+
+        Returns:
+            PersistentMap: The new map, or this one if the key already holds value
+        """
+        root, added = _set(self._root, 0, _Leaf(_hash(key), key, value))
+        if root is self._root:
+            return self
+        return self._make(root, self._count + added)
+
+    def delete(self, key):
+        """Get a copy of the map without a key
+
+        Args:
+            key: The key
+
+        Returns:
+            PersistentMap: The new map, or this one if the key is missing
+        """
+        root = _delete(self._root, 0, _hash(key), key)
+        if root is self._root:
+            return self
+        if root is None:
+            root = _EMPTY_NODE
+        return self._make(root, self._count - 1)
+
+    def diff(self, other):
+        """Get the changes that turn this map into another
+
+        Args:
+            other: A PersistentMap, ideally derived from this one (or this
+                one from it) so that they share their unchanged nodes
+
+        Returns:
+            tuple: (added keys, removed keys, keys whose value changed)
+        """
+        added, removed, changed = [], [], []
+        _diff(self._root, other._root, added, removed, changed)
+        return added, removed, changed
+
+
+_MISSING = object()
+
+PersistentMap.EMPTY = PersistentMap()
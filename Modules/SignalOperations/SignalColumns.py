@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalColumns module - columnar mirror of the numeric signal attributes for vectorized analytics
+"""
+
+from array import array
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SignalColumnStore:
+    """Columnar copy of the numeric signal attributes, one row per signal
+
+    Each numeric field is held in a contiguous buffer (a NumPy array when
+    NumPy is installed, a typed array.array otherwise) with a parallel
+    presence mask, and each grouping field is dictionary-encoded into an
+    integer code column. Range filters, sums and histograms then run over the
+    buffers instead of over the signal dictionaries.
+
+    Rows are not kept in signal list order: removing a signal moves the last
+    row into the freed one, so every edit is O(1) per column. The store can
+    be attached to a SignalStore to follow its edits.
+    """
+
+    NUMERIC_FIELDS = ("buffer_count", "sm_buff_count", "timeout", "periodicity", "array_size")
+    GROUP_FIELDS = ("memory_region", "board", "soc", "build_image", "data_type", "asil")
+
+    def __init__(self, signals=None, use_numpy=True):
+        """Initialize the SignalColumnStore
+
+        Args:
+            signals: Optional list of signal dictionaries to load
+            use_numpy: Use NumPy buffers if NumPy is installed
+        """
+        self.use_numpy = use_numpy and np is not None
+        self.rebuild(signals if signals is not None else [])
+
+    @staticmethod
+    def to_number(value):
+        """Convert a stored attribute to an integer
+
+        Args:
+            value: The attribute value (int, integral float or numeric string)
+
+        Returns:
+            int: The value, or None if it is missing or not an integer
+        """
+        if value is None or isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float):
+            return int(value) if value.is_integer() else None
+        if isinstance(value, str):
+            try:
+                return int(value.strip())
+            except ValueError:
+                return None
+        return None
+
+    def rebuild(self, signals):
+        """Reload every column from a signals list
+
+        Args:
+            signals: The list of signal dictionaries
+        """
+        self._row_ids = []
+        self._rows = {}
+        rows = []
+        for signal in signals:
+            signal_id = signal.get("id")
+            # Keep the first occurrence, as the signal index does
+            if signal_id is not None and signal_id not in self._rows:
+                self._rows[signal_id] = len(self._row_ids)
+                self._row_ids.append(signal_id)
+                rows.append(signal)
+
+        self._labels = {field: [None] for field in self.GROUP_FIELDS}
+        self._codes_by_label = {field: {None: 0} for field in self.GROUP_FIELDS}
+
+        self._values = {}
+        self._present = {}
+        for field in self.NUMERIC_FIELDS:
+            numbers = [self.to_number(signal.get(field)) for signal in rows]
+            self._values[field] = self._new_buffer("q", [0 if number is None else number for number in numbers])
+            self._present[field] = self._new_buffer("b", [number is not None for number in numbers])
+
+        self._codes = {}
+        for field in self.GROUP_FIELDS:
+            self._codes[field] = self._new_buffer("l", [self._code(field, signal.get(field)) for signal in rows])
+
+    def _new_buffer(self, typecode, values):
+        """Create a column buffer holding values"""
+        if self.use_numpy:
+            dtype = {"q": np.int64, "b": np.bool_, "l": np.int32}[typecode]
+            # Leave room to append without reallocating on every add
+            buffer = np.zeros(max(16, len(values) * 2), dtype=dtype)
+            buffer[:len(values)] = values
+            return buffer
+        return array(typecode, values)
+
+    def _code(self, field, label):
+        """Get the integer code of a grouping value, assigning one if needed"""
+        codes = self._codes_by_label[field]
+        code = codes.get(label)
+        if code is None:
+            code = len(self._labels[field])
+            codes[label] = code
+            self._labels[field].append(label)
+        return code
+
+    def __len__(self):
+        return len(self._row_ids)
+
+    def __contains__(self, signal_id):
+        return signal_id in self._rows
+
+    def _write_row(self, row, signal):
+        """Write a signal's attributes into an existing row"""
+        for field in self.NUMERIC_FIELDS:
+            number = self.to_number(signal.get(field))
+            self._values[field][row] = 0 if number is None else number
+            self._present[field][row] = number is not None
+        for field in self.GROUP_FIELDS:
+            self._codes[field][row] = self._code(field, signal.get(field))
+
+    def _append_row(self):
+        """Add an empty row at the end of every column and return its number"""
+        row = len(self._row_ids)
+        columns = list(self._values.values()) + list(self._present.values()) + list(self._codes.values())
+        if self.use_numpy:
+            if row >= len(columns[0]):
+                for buffers in (self._values, self._present, self._codes):
+                    for field, buffer in buffers.items():
+                        grown = np.zeros(len(buffer) * 2, dtype=buffer.dtype)
+                        grown[:row] = buffer[:row]
+                        buffers[field] = grown
+        else:
+            for buffer in columns:
+                buffer.append(0)
+        return row
+
+    def add(self, signal):
+        """Add a signal, or refresh its row if it is already stored
+
+        Args:
+            signal: The signal data dictionary (must carry its "id")
+        """
+        signal_id = signal.get("id")
+        if signal_id is None:
+            return
+        row = self._rows.get(signal_id)
+        if row is None:
+            row = self._append_row()
+            self._rows[signal_id] = row
+            self._row_ids.append(signal_id)
+        self._write_row(row, signal)
+
+    def update(self, old_signal, new_signal):
+        """Refresh the row of a signal after it was edited
+
+        Args:
+            old_signal: The signal data before the update
+            new_signal: The updated signal data dictionary
+        """
+        if old_signal.get("id") != new_signal.get("id"):
+            self.remove(old_signal)
+        self.add(new_signal)
+
+    def remove(self, signal):
+        """Remove a signal's row
+
+        Args:
+            signal: The signal data dictionary
+
+        Returns:
+            bool: True if the signal was stored
+        """
+        row = self._rows.pop(signal.get("id"), None)
+        if row is None:
+            return False
+
+        last = len(self._row_ids) - 1
+        if row != last:
+            # Move the last row into the hole
+            moved_id = self._row_ids[last]
+            for buffers in (self._values, self._present, self._codes):
+                for buffer in buffers.values():
+                    buffer[row] = buffer[last]
+            self._row_ids[row] = moved_id
+            self._rows[moved_id] = row
+        self._row_ids.pop()
+        if not self.use_numpy:
+            for buffers in (self._values, self._present, self._codes):
+                for buffer in buffers.values():
+                    buffer.pop()
+        return True
+
+    def column(self, field):
+        """Get the values of a numeric field
+
+        Args:
+            field: One of NUMERIC_FIELDS
+
+        Returns:
+            The values of every row (a NumPy view or an array copy); missing
+            values read as 0, see present()
+        """
+        return self._values[field][:len(self._row_ids)]
+
+    def present(self, field):
+        """Get the presence mask of a numeric field
+
+        Args:
+            field: One of NUMERIC_FIELDS
+
+        Returns:
+            The per-row flags telling whether the signal has the field
+        """
+        return self._present[field][:len(self._row_ids)]
+
+    def row_ids(self):
+        """Get the signal IDs in row order"""
+        return list(self._row_ids)
+
+    def ids_in_range(self, field, low=None, high=None):
+        """Get the IDs of the signals whose field lies within [low, high]
+
+        Args:
+            field: One of NUMERIC_FIELDS
+            low: Optional inclusive lower bound
+            high: Optional inclusive upper bound
+
+        Returns:
+            set: Matching signal IDs
+        """
+        size = len(self._row_ids)
+        values = self._values[field][:size]
+        if self.use_numpy:
+            mask = self._present[field][:size].copy()
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+            row_ids = self._row_ids
+            return {row_ids[row] for row in np.flatnonzero(mask).tolist()}
+
+        present = self._present[field]
+        return {signal_id for signal_id, value, has_value in zip(self._row_ids, values, present)
+                if has_value and (low is None or value >= low) and (high is None or value <= high)}
+
+    def sum(self, field):
+        """Sum a numeric field over every signal that has it
+
+        Args:
+            field: One of NUMERIC_FIELDS
+
+        Returns:
+            int: The total
+        """
+        size = len(self._row_ids)
+        if self.use_numpy:
+            return int(self._values[field][:size].sum())
+        # Missing values are stored as 0
+        return sum(self._values[field])
+
+    def sum_by(self, field, group_field):
+        """Sum a numeric field per value of a grouping field
+
+        For example sum_by("sm_buff_count", "memory_region") gives the total
+        SM buffers per memory region.
+
+        Args:
+            field: One of NUMERIC_FIELDS
+            group_field: One of GROUP_FIELDS
+
+        Returns:
+            dict: Group value -> total (signals without the group field are
+                counted under None)
+        """
+        size = len(self._row_ids)
+        labels = self._labels[group_field]
+        if self.use_numpy:
+            codes = self._codes[group_field][:size]
+            totals = np.bincount(codes, weights=self._values[field][:size], minlength=len(labels))
+            used = np.bincount(codes, minlength=len(labels))
+            return {labels[code]: int(totals[code]) for code in np.flatnonzero(used).tolist()}
+
+        totals = {}
+        for code, value in zip(self._codes[group_field], self._values[field]):
+            totals[code] = totals.get(code, 0) + value
+        return {labels[code]: total for code, total in totals.items()}
+
+    def histogram(self, field, bins):
+        """Count the values of a numeric field per bin
+
+        Args:
+            field: One of NUMERIC_FIELDS
+            bins: Increasing bin edges; bin i covers [bins[i], bins[i + 1]),
+                the last bin also includes its upper edge
+
+        Returns:
+            list: The count of each of the len(bins) - 1 bins
+        """
+        size = len(self._row_ids)
+        if self.use_numpy:
+            present = self._present[field][:size]
+            counts, _ = np.histogram(self._values[field][:size][present], bins=bins)
+            return counts.tolist()
+
+        edges = list(bins)
+        counts = [0] * (len(edges) - 1)
+        last = len(edges) - 1
+        for value, has_value in zip(self._values[field], self._present[field]):
+            if not has_value or value < edges[0] or value > edges[-1]:
+                continue
+            index = bisect_right(edges, value) - 1
+            counts[min(index, last - 1)] += 1
+        return counts
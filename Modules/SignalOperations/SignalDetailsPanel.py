@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalDetailsPanel module - read-only signal details form that reuses its row widgets
+"""
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+from PyQt5.QtWidgets import QLabel, QListView
+
+
+class StructFieldListModel(QAbstractListModel):
+    """List model with one row per struct field of a signal
+
+    The rows are read from the signal's struct_fields list when the view
+    paints them, so a STRUCT with hundreds of fields only costs the rows
+    that are visible.
+    """
+
+    def __init__(self, parent=None):
+        """Initialize the StructFieldListModel
+
+        Args:
+            parent: Optional parent QObject
+        """
+        super(StructFieldListModel, self).__init__(parent)
+        self._fields = []
+
+    def set_fields(self, fields):
+        """Show another list of struct fields
+
+        Args:
+            fields: List of struct field dictionaries
+        """
+        self.beginResetModel()
+        self._fields = fields if isinstance(fields, list) else []
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._fields)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid() or index.row() >= len(self._fields):
+            return None
+        field = self._fields[index.row()]
+        if not hasattr(field, "items"):
+            return str(field)
+        return "   ".join(f"{SignalDetailsPanel.label_text(key)} {value}" for key, value in field.items())
+
+
+class SignalDetailsPanel:
+    """Read-only view of a signal's attributes in a QFormLayout
+
+    The panel keeps a pool of (label, value) row widgets in the layout. Showing
+    a signal rewrites the text of as many rows as the signal has attributes,
+    hides the rows left over and only creates widgets when a signal has more
+    attributes than any signal shown before. Struct fields are listed in a
+    QListView over a StructFieldListModel instead of one sub-form per field.
+    """
+
+    # Keys not shown as attribute rows
+    HIDDEN_KEYS = ("id", "struct_fields")
+
+    # Height of the struct field list, in rows
+    STRUCT_VISIBLE_ROWS = 8
+
+    def __init__(self, form_layout):
+        """Initialize the SignalDetailsPanel
+
+        Args:
+            form_layout: The QFormLayout the panel owns; anything already in it
+                is removed
+        """
+        self.layout = form_layout
+        while self.layout.count() > 0:
+            item = self.layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+
+        self._rows = []
+        self._shown = 0
+
+        self.struct_model = StructFieldListModel()
+        self.struct_view = QListView()
+        self.struct_view.setModel(self.struct_model)
+        self.struct_view.setUniformItemSizes(True)
+        self.struct_view.setEditTriggers(QListView.NoEditTriggers)
+        # Long field lists scroll instead of growing the form
+        row_height = self.struct_view.fontMetrics().lineSpacing() + 4
+        self.struct_view.setMaximumHeight(row_height * self.STRUCT_VISIBLE_ROWS)
+        self.struct_label = QLabel("<b>Struct Fields:</b>")
+        self.layout.addRow(self.struct_label, self.struct_view)
+        self._struct_shown = True
+        self._set_struct_visible(False)
+
+    @staticmethod
+    def label_text(key):
+        """Get the row label of an attribute key"""
+        return f"{key.replace('_', ' ').title()}:"
+
+    @staticmethod
+    def value_text(value):
+        """Get the text shown for an attribute value"""
+        if isinstance(value, bool):
+            return "Yes" if value else "No"
+        return str(value)
+
+    def show_signal(self, signal_data):
+        """Show the attributes of a signal
+
+        Args:
+            signal_data: The signal data dictionary
+        """
+        rows = [(self.label_text(key), self.value_text(value))
+                for key, value in signal_data.items() if key not in self.HIDDEN_KEYS]
+
+        # Grow the pool above the struct field row
+        while len(self._rows) < len(rows):
+            label = QLabel()
+            value_label = QLabel()
+            self.layout.insertRow(len(self._rows), label, value_label)
+            self._rows.append((label, value_label))
+
+        for (label, value_label), (label_text, value_text) in zip(self._rows, rows):
+            # Setting an unchanged text would still relayout the label
+            if label.text() != label_text:
+                label.setText(label_text)
+            if value_label.text() != value_text:
+                value_label.setText(value_text)
+
+        # Only the rows whose visibility changes are touched
+        for row in range(len(rows), self._shown):
+            label, value_label = self._rows[row]
+            label.hide()
+            value_label.hide()
+        for row in range(self._shown, len(rows)):
+            label, value_label = self._rows[row]
+            label.show()
+            value_label.show()
+        self._shown = len(rows)
+
+        is_struct = "struct_fields" in signal_data and signal_data.get("data_type") == "STRUCT"
+        self.struct_model.set_fields(signal_data.get("struct_fields") if is_struct else [])
+        self._set_struct_visible(is_struct)
+
+    def clear(self):
+        """Hide every row"""
+        self.show_signal({})
+
+    def _set_struct_visible(self, visible):
+        """Show or hide the struct field row"""
+        if visible != self._struct_shown:
+            self._struct_shown = visible
+            self.struct_label.setVisible(visible)
+            self.struct_view.setVisible(visible)
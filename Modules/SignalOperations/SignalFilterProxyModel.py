@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalFilterProxyModel module - proxy model filtering the signal tree by a search text
+"""
+
+from PyQt5.QtCore import QModelIndex, QSortFilterProxyModel
+
+
+class SignalFilterProxyModel(QSortFilterProxyModel):
+    """Proxy showing only the signals that match a search text
+
+    The matching IDs come from a SignalSearchIndex, so accepting a row is a
+    set lookup instead of evaluating the text against every row. The result
+    set is followed by the index and kept current as signals change, and
+    the proxy re-filters the rows its source model reports as inserted or
+    changed, so the filtered view stays right across edits.
+
+    The property rows of a shown signal are always accepted.
+    """
+
+    def __init__(self, search_index, parent=None):
+        """Initialize the SignalFilterProxyModel
+
+        Args:
+            search_index: The SignalSearchIndex of the source model's signals
+            parent: Optional parent QObject
+        """
+        super(SignalFilterProxyModel, self).__init__(parent)
+        self.search_index = search_index
+        self.search_text = ""
+        self._matches = None
+
+    def set_search_text(self, text):
+        """Filter the rows by a search text
+
+        Args:
+            text: Whitespace-separated terms a signal must all match in its
+                name, variable port name or description; an empty text shows
+                every signal
+        """
+        if text == self.search_text:
+            return
+        matches = self.search_index.follow(text)
+        if self._matches is not None:
+            self.search_index.unfollow(self._matches)
+        self._matches = matches
+        self.search_text = text
+        self.invalidateFilter()
+
+    def match_count(self):
+        """Get the number of signals matching the search text
+
+        Returns:
+            int: The count, or None if no search text is set
+        """
+        return None if self._matches is None else len(self._matches)
+
+    def filterAcceptsRow(self, source_row, source_parent=QModelIndex()):
+        if self._matches is None or source_parent.isValid():
+            return True
+        return self.sourceModel().signal_id_at(source_row) in self._matches
@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalGroupModel module - item model showing the signals of a SignalStore grouped by board, SoC and build image
+"""
+
+from PyQt5.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+from Modules.SignalOperations.SignalTreeModel import SignalTreeModel
+
+
+class SignalGroupNode:
+    """A board, SoC or build image row of the grouped signal view"""
+
+    __slots__ = ("parent", "row", "path", "count", "children", "members")
+
+    def __init__(self, parent, row, path, count):
+        self.parent = parent
+        self.row = row
+        # Facet values from the board down to this row
+        self.path = path
+        self.count = count
+        # Group rows below this one, None until first asked for
+        self.children = None
+        # SignalGroupMembers of a build image row, None until it is expanded
+        self.members = None
+
+
+class SignalGroupMembers:
+    """The signal rows below a build image row"""
+
+    __slots__ = ("leaf", "ids", "fetched")
+
+    def __init__(self, leaf, ids):
+        self.leaf = leaf
+        self.ids = ids
+        # Rows handed to the view so far
+        self.fetched = 0
+
+
+class SignalGroupModel(QAbstractItemModel):
+    """Model showing the signals of a SignalStore under board > SoC > build image rows
+
+    The group rows and their signal counts come from a FacetIndex attached
+    to the store with track_members, which keeps the counts up to date as
+    signals change; no signal is scanned to build or refresh them. The
+    signals of a build image are only listed when its row is expanded, read
+    from the index's member IDs and handed to the view in batches of
+    FETCH_SIZE like the flat SignalTreeModel.
+
+    Store events update the groups shown (new or emptied groups, changed
+    counts) and the signal rows of the build images already expanded. A
+    signal moved into an expanded build image is listed at its end.
+    """
+
+    COLUMNS = SignalTreeModel.COLUMNS
+    COLUMN_KEYS = SignalTreeModel.COLUMN_KEYS
+
+    # Role returning the signal ID of a signal row; None for group rows
+    SIGNAL_ID_ROLE = SignalTreeModel.SIGNAL_ID_ROLE
+
+    FETCH_SIZE = SignalTreeModel.FETCH_SIZE
+    BATCH_THRESHOLD = SignalTreeModel.BATCH_THRESHOLD
+
+    # Label of each grouping level, board first
+    GROUP_LEVELS = ("Board", "SoC", "Build Image")
+
+    ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    SIGNAL_FLAGS = ITEM_FLAGS | Qt.ItemNeverHasChildren
+
+    def __init__(self, store, facet_index, parent=None):
+        """Initialize the SignalGroupModel
+
+        Args:
+            store: The SignalStore to show
+            facet_index: A FacetIndex with track_members, attached to the store
+            parent: Optional parent QObject
+        """
+        super(SignalGroupModel, self).__init__(parent)
+        self.store = store
+        self.facet_index = facet_index
+        self._root = SignalGroupNode(None, 0, (), 0)
+        # Build image rows by facet path, and the build image row listing
+        # each signal of the expanded ones
+        self._leaves = {}
+        self._leaf_of = {}
+        self._revision = None
+        self._reset_pending = False
+        self.store.subscribe(self._on_signals_changed)
+
+    # Building rows
+
+    def _children(self, node):
+        """Get the group rows below a group row, creating them on first use"""
+        if node.children is None:
+            node.children = [self._new_group(node, row, value)
+                             for row, value in enumerate(self.facet_index.children(*node.path))]
+            if node is self._root:
+                self._revision = self.facet_index.revision
+        return node.children
+
+    def _new_group(self, parent, row, value):
+        """Create the group row of a facet value below a group row"""
+        path = parent.path + (value,)
+        node = SignalGroupNode(parent, row, path, self.facet_index.path_count(*path))
+        if len(path) == len(self.GROUP_LEVELS):
+            self._leaves[path] = node
+        return node
+
+    def _members(self, leaf):
+        """Get the signal rows of a build image row, listing them on first use"""
+        if leaf.members is None:
+            signal_ids = self.facet_index.members(*leaf.path)
+            # In the order of the signals list, as the flat view shows them
+            signal_ids = [signal.get("id") for signal in self.store.index.in_list_order(signal_ids)]
+            leaf.members = SignalGroupMembers(leaf, signal_ids)
+            for signal_id in signal_ids:
+                self._leaf_of[signal_id] = leaf
+        return leaf.members
+
+    def _is_leaf(self, node):
+        """Check whether a group row is a build image row"""
+        return len(node.path) == len(self.GROUP_LEVELS)
+
+    def _forget(self, node):
+        """Drop the bookkeeping of a group row and everything below it"""
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            if self._is_leaf(node):
+                self._leaves.pop(node.path, None)
+                if node.members is not None:
+                    for signal_id in node.members.ids:
+                        self._leaf_of.pop(signal_id, None)
+            elif node.children is not None:
+                pending.extend(node.children)
+
+    # Updating rows
+
+    def _on_signals_changed(self, event, signal_ids):
+        """Turn a store change event into row notifications"""
+        if event == "added":
+            self._signals_added(signal_ids)
+        elif event == "updated":
+            self._signals_updated(signal_ids)
+        elif event == "removing":
+            # A reset is finished by the "removed" event, once the store has caught up
+            self._reset_pending = self._remove_members(signal_ids)
+        elif event == "removed":
+            if self._reset_pending:
+                self._reset_pending = False
+                self.endResetModel()
+            else:
+                self._sync_groups()
+        elif event == "reset":
+            self.beginResetModel()
+            self._clear()
+            self.endResetModel()
+
+    def _clear(self):
+        """Forget every row, to be recreated when the view asks for them"""
+        self._root.children = None
+        self._leaves = {}
+        self._leaf_of = {}
+        self._revision = None
+
+    def _signals_added(self, signal_ids):
+        """Append added signals to the build image rows already expanded"""
+        additions = {}
+        for signal_id in signal_ids:
+            signal = self.store.get(signal_id)
+            leaf = self._leaves.get(self.facet_index.facets_of(signal)) if signal is not None else None
+            if leaf is not None and leaf.members is not None and signal_id not in self._leaf_of:
+                additions.setdefault(leaf, []).append(signal_id)
+        for leaf, added_ids in additions.items():
+            self._append_members(leaf, added_ids)
+        self._sync_groups()
+
+    def _signals_updated(self, signal_ids):
+        """Repaint updated signals and move those whose facets changed"""
+        changed = {}
+        moved = []
+        additions = {}
+        for signal_id in signal_ids:
+            signal = self.store.get(signal_id)
+            if signal is None:
+                continue
+            old_leaf = self._leaf_of.get(signal_id)
+            new_leaf = self._leaves.get(self.facet_index.facets_of(signal))
+            if new_leaf is not None and new_leaf.members is None:
+                new_leaf = None
+            if old_leaf is not None and old_leaf is new_leaf:
+                changed.setdefault(old_leaf, []).append(signal_id)
+                continue
+            if old_leaf is not None:
+                moved.append(signal_id)
+            if new_leaf is not None:
+                additions.setdefault(new_leaf, []).append(signal_id)
+
+        last_column = len(self.COLUMNS) - 1
+        for leaf, leaf_ids in changed.items():
+            members = leaf.members
+            rows = self._member_rows(members, leaf_ids)
+            for first, last in SignalTreeModel._row_runs([row for row in rows if row < members.fetched]):
+                self.dataChanged.emit(self.createIndex(first, 0, members),
+                                      self.createIndex(last, last_column, members))
+        if moved and self._remove_members(moved):
+            self.endResetModel()
+            return
+        for leaf, added_ids in additions.items():
+            self._append_members(leaf, added_ids)
+        self._sync_groups()
+
+    @staticmethod
+    def _member_rows(members, signal_ids):
+        """Get the sorted rows of some signals in a build image row's list"""
+        wanted = set(signal_ids)
+        return [row for row, signal_id in enumerate(members.ids) if signal_id in wanted]
+
+    def _append_members(self, leaf, signal_ids):
+        """Add signals at the end of an expanded build image row"""
+        members = leaf.members
+        for signal_id in signal_ids:
+            self._leaf_of[signal_id] = leaf
+        if members.fetched < len(members.ids):
+            # The view has not reached the end yet, fetchMore will hand them out
+            members.ids.extend(signal_ids)
+            return
+        first = len(members.ids)
+        self.beginInsertRows(self.createIndex(leaf.row, 0, leaf), first, first + len(signal_ids) - 1)
+        members.ids.extend(signal_ids)
+        members.fetched = len(members.ids)
+        self.endInsertRows()
+
+    def _remove_members(self, signal_ids):
+        """Remove signals from the expanded build image rows listing them
+
+        Returns:
+            bool: True if a model reset was begun instead, for the caller to end
+        """
+        removals = {}
+        for signal_id in signal_ids:
+            leaf = self._leaf_of.pop(signal_id, None)
+            if leaf is not None:
+                removals.setdefault(leaf, []).append(signal_id)
+        if not removals:
+            return False
+
+        runs_by_leaf = {leaf: SignalTreeModel._row_runs(self._member_rows(leaf.members, leaf_ids))
+                        for leaf, leaf_ids in removals.items()}
+        if sum(len(runs) for runs in runs_by_leaf.values()) > self.BATCH_THRESHOLD:
+            # Cheaper for the view to start over than to follow each run
+            self.beginResetModel()
+            self._clear()
+            return True
+
+        for leaf, runs in runs_by_leaf.items():
+            members = leaf.members
+            parent = self.createIndex(leaf.row, 0, leaf)
+            # Bottom-up so the earlier row numbers stay valid
+            for first, last in reversed(runs):
+                shown_last = min(last, members.fetched - 1)
+                if first > shown_last:
+                    # Not handed to the view yet
+                    del members.ids[first:last + 1]
+                    continue
+                self.beginRemoveRows(parent, first, shown_last)
+                del members.ids[first:last + 1]
+                members.fetched -= shown_last - first + 1
+                self.endRemoveRows()
+        return False
+
+    def _sync_groups(self):
+        """Bring the group rows created so far in line with the facet index"""
+        if self._root.children is None or self._revision == self.facet_index.revision:
+            return
+        self._revision = self.facet_index.revision
+
+        last_column = len(self.COLUMNS) - 1
+        pending = [self._root]
+        while pending:
+            node = pending.pop()
+            self._sync_children(node)
+            for child in node.children:
+                count = self.facet_index.path_count(*child.path)
+                if count != child.count:
+                    child.count = count
+                    self.dataChanged.emit(self.createIndex(child.row, 0, child),
+                                          self.createIndex(child.row, last_column, child))
+                if child.children is not None:
+                    pending.append(child)
+
+    def _sync_children(self, node):
+        """Insert and remove the group rows below a row as facet values come and go"""
+        values = self.facet_index.children(*node.path)
+        value_set = set(values)
+        parent = self._index(node)
+
+        # Remove the groups that emptied, bottom-up by contiguous runs
+        row = len(node.children) - 1
+        while row >= 0:
+            if node.children[row].path[-1] in value_set:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and node.children[row].path[-1] not in value_set:
+                row -= 1
+            self.beginRemoveRows(parent, row + 1, last)
+            for child in node.children[row + 1:last + 1]:
+                self._forget(child)
+            del node.children[row + 1:last + 1]
+            self._renumber(node)
+            self.endRemoveRows()
+
+        # Insert the new groups at their sorted positions
+        old_values = {child.path[-1] for child in node.children}
+        row = 0
+        while row < len(values):
+            if values[row] in old_values:
+                row += 1
+                continue
+            first = row
+            while row < len(values) and values[row] not in old_values:
+                row += 1
+            self.beginInsertRows(parent, first, row - 1)
+            node.children[first:first] = [self._new_group(node, position, values[position])
+                                          for position in range(first, row)]
+            self._renumber(node)
+            self.endInsertRows()
+
+    @staticmethod
+    def _renumber(node):
+        """Store each group row's position after rows were inserted or removed"""
+        for row, child in enumerate(node.children):
+            child.row = row
+
+    # Qt model interface
+
+    def _index(self, node):
+        """Get the model index of a group row"""
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def _node(self, index):
+        """Get the group row or member list of a model index"""
+        return index.internalPointer() if index.isValid() else self._root
+
+    def signal_id_at(self, index):
+        """Get the ID of the signal shown at a model index
+
+        Args:
+            index: A QModelIndex of this model
+
+        Returns:
+            str: The signal ID, or None for a group row or an invalid index
+        """
+        if not index.isValid():
+            return None
+        members = index.internalPointer()
+        if not isinstance(members, SignalGroupMembers) or not 0 <= index.row() < members.fetched:
+            return None
+        return members.ids[index.row()]
+
+    def index_of(self, signal_id):
+        """Get the index of a signal's row, listing its groups' rows if needed
+
+        Args:
+            signal_id: The ID of the signal
+
+        Returns:
+            QModelIndex: The index of the signal's first column, or an invalid
+                index if the signal is unknown
+        """
+        signal = self.store.get(signal_id)
+        if signal is None:
+            return QModelIndex()
+        node = self._root
+        for value in self.facet_index.facets_of(signal):
+            node = next((child for child in self._children(node) if child.path[-1] == value), None)
+            if node is None:
+                return QModelIndex()
+        members = self._members(node)
+        try:
+            row = members.ids.index(signal_id)
+        except ValueError:
+            return QModelIndex()
+        while members.fetched <= row:
+            self.fetchMore(self._index(node))
+        return self.createIndex(row, 0, members)
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not 0 <= column < len(self.COLUMNS) or (parent.isValid() and parent.column() != 0):
+            return QModelIndex()
+        node = self._node(parent)
+        if isinstance(node, SignalGroupMembers):
+            return QModelIndex()
+        if self._is_leaf(node):
+            members = self._members(node)
+            if not 0 <= row < members.fetched:
+                return QModelIndex()
+            return self.createIndex(row, column, members)
+        children = self._children(node)
+        if not 0 <= row < len(children):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if isinstance(node, SignalGroupMembers):
+            return self.createIndex(node.leaf.row, 0, node.leaf)
+        return self._index(node.parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        node = self._node(parent)
+        if isinstance(node, SignalGroupMembers):
+            return 0
+        if self._is_leaf(node):
+            return 0 if node.members is None else node.members.fetched
+        return len(self._children(node))
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() != 0:
+            return False
+        node = self._node(parent)
+        if isinstance(node, SignalGroupMembers):
+            return False
+        # Group rows only exist while they hold signals
+        return node is not self._root or self.rowCount() > 0
+
+    def canFetchMore(self, parent=QModelIndex()):
+        node = self._node(parent)
+        if isinstance(node, SignalGroupMembers) or not self._is_leaf(node):
+            return False
+        return node.members is None or node.members.fetched < len(node.members.ids)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        members = self._members(self._node(parent))
+        count = min(self.FETCH_SIZE, len(members.ids) - members.fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, members.fetched, members.fetched + count - 1)
+        members.fetched += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if isinstance(node, SignalGroupMembers):
+            signal_id = self.signal_id_at(index)
+            if role == self.SIGNAL_ID_ROLE:
+                return signal_id
+            if role == Qt.DisplayRole:
+                signal = self.store.get(signal_id)
+                value = signal.get(self.COLUMN_KEYS[index.column()]) if signal is not None else None
+                return "" if value is None else str(value)
+            return None
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                value = node.path[-1]
+                return f"{self.GROUP_LEVELS[len(node.path) - 1]}: {value if value else '(none)'}"
+            return f"{node.count} signals"
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.COLUMNS):
+            return self.COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if isinstance(index.internalPointer(), SignalGroupMembers):
+            return self.SIGNAL_FLAGS
+        return self.ITEM_FLAGS
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalHistory module - undo/redo of signal edits recorded as per-signal deltas
+"""
+
+import sys
+from collections import deque
+
+
+class SignalDelta:
+    """The change made to one signal by an edit
+
+    before is None for an added signal and after is None for a deleted one.
+    Both hold the signal objects themselves, which the store never changes
+    (see SignalStore). position is the signal's place in the signals list
+    for an added or deleted signal, so undo and redo can put it back there.
+    """
+
+    __slots__ = ("signal_id", "before", "after", "position")
+
+    def __init__(self, signal_id, before, after, position=None):
+        self.signal_id = signal_id
+        self.before = before
+        self.after = after
+        self.position = position
+
+
+class SignalHistoryEntry:
+    """One undoable edit: the deltas of a single SignalManager operation"""
+
+    __slots__ = ("label", "deltas", "fields", "size")
+
+    def __init__(self, label, deltas, fields, size):
+        self.label = label
+        self.deltas = deltas
+        # Keys changed by a single-signal update, None otherwise (used to
+        # merge consecutive edits of the same field)
+        self.fields = fields
+        # Estimated bytes kept alive by the entry
+        self.size = size
+
+
+class SignalHistory:
+    """Undo and redo stacks of the edits made to a SignalStore
+
+    Each edit is recorded as the before/after signal of every signal it
+    touched, so recording costs O(signals edited) instead of a copy of the
+    whole signals list. Undoing an entry applies its deltas backwards with
+    the store's batch operations, one change event per kind of change.
+
+    The undo stack is bounded by an estimated memory budget: once the
+    entries exceed it, the oldest ones are dropped (the newest entry is
+    always kept). With merge_edits, an update of a single signal that
+    changes the same fields as the entry before it is folded into that
+    entry, so typing into one field leaves one undo step.
+
+    Added and deleted signals also record their position in the signals
+    list (a deleted signal's is taken from the store's "removing" event),
+    and are put back there with the store's positional insert, in
+    ascending order, so undoing a delete restores the list order as well.
+    """
+
+    # Default memory budget of the undo stack, in bytes
+    DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+    def __init__(self, store, memory_budget=DEFAULT_MEMORY_BUDGET, merge_edits=False):
+        """Initialize the SignalHistory
+
+        Args:
+            store: The SignalStore whose edits are recorded
+            memory_budget: Estimated bytes the undo stack may keep alive
+            merge_edits: Whether consecutive edits of the same fields of a
+                signal are merged into one undo step
+        """
+        self.store = store
+        self.memory_budget = memory_budget
+        self.merge_edits = merge_edits
+        self._undo = deque()
+        self._redo = []
+        self._size = 0
+        # Set while an undo or redo is applied, so it is not recorded again
+        self._applying = False
+        # Positions of the signals of the latest removal, for record_removed
+        self._removed_positions = {}
+        # A reset replaces the whole list, the recorded deltas no longer apply
+        self.store.subscribe(self._on_signals_changed)
+
+    def _on_signals_changed(self, event, signal_ids):
+        """Note where removed signals were and forget the history when the signals list is replaced"""
+        if event == "removing":
+            position = self.store.index.position
+            self._removed_positions = {signal_id: position(signal_id) for signal_id in signal_ids}
+        elif event == "reset":
+            self.clear()
+
+    def clear(self):
+        """Drop every undo and redo entry"""
+        self._undo.clear()
+        self._redo = []
+        self._size = 0
+
+    @property
+    def size(self):
+        """Estimated bytes kept alive by the undo stack"""
+        return self._size
+
+    def set_memory_budget(self, memory_budget):
+        """Change the memory budget, dropping the oldest entries beyond it
+
+        Args:
+            memory_budget: Estimated bytes the undo stack may keep alive
+        """
+        self.memory_budget = memory_budget
+        self._evict()
+
+    def can_undo(self):
+        """Check whether there is an edit to undo"""
+        return bool(self._undo)
+
+    def can_redo(self):
+        """Check whether there is an undone edit to redo"""
+        return bool(self._redo)
+
+    def undo_label(self):
+        """Get the label of the edit undo would revert, or None"""
+        return self._undo[-1].label if self._undo else None
+
+    def redo_label(self):
+        """Get the label of the edit redo would apply again, or None"""
+        return self._redo[-1].label if self._redo else None
+
+    # Recording
+
+    def record_added(self, label, signals):
+        """Record signals added to the store
+
+        Args:
+            label: Description of the edit, e.g. "Add signal"
+            signals: The added signals, as stored
+        """
+        position = self.store.index.position
+        self._record(label, [SignalDelta(signal.get("id"), None, signal, position(signal.get("id")))
+                             for signal in signals])
+
+    def record_updated(self, label, changes):
+        """Record signals replaced in the store
+
+        Args:
+            label: Description of the edit
+            changes: List of (previous signal, new signal) pairs
+        """
+        deltas = [SignalDelta(after.get("id"), before, after) for before, after in changes if before is not after]
+        self._record(label, deltas)
+
+    def record_removed(self, label, signals):
+        """Record signals removed from the store
+
+        Args:
+            label: Description of the edit
+            signals: The removed signals, just removed from the store
+        """
+        positions = self._removed_positions
+        self._removed_positions = {}
+        self._record(label, [SignalDelta(signal.get("id"), signal, None, positions.get(signal.get("id")))
+                             for signal in signals])
+
+    def _record(self, label, deltas):
+        """Push an entry for some deltas onto the undo stack"""
+        if self._applying or not deltas:
+            return
+        self._redo = []
+
+        fields = None
+        if len(deltas) == 1 and deltas[0].before is not None and deltas[0].after is not None:
+            fields = self._changed_fields(deltas[0].before, deltas[0].after)
+            if self.merge_edits and self._merge(deltas[0], fields):
+                return
+
+        size = sum(self._delta_size(delta) for delta in deltas)
+        self._undo.append(SignalHistoryEntry(label, deltas, fields, size))
+        self._size += size
+        self._evict()
+
+    def _merge(self, delta, fields):
+        """Fold a single-signal update into the newest entry if it edits the same fields
+
+        Returns:
+            bool: True if the update was merged
+        """
+        if not self._undo:
+            return False
+        last = self._undo[-1]
+        if last.fields != fields or last.deltas[0].signal_id != delta.signal_id:
+            return False
+
+        # Keep the oldest before and the newest after
+        merged = SignalDelta(delta.signal_id, last.deltas[0].before, delta.after)
+        size = self._delta_size(merged)
+        self._size += size - last.size
+        last.deltas = [merged]
+        last.size = size
+        return True
+
+    def _evict(self):
+        """Drop the oldest entries until the undo stack fits its budget"""
+        while len(self._undo) > 1 and self._size > self.memory_budget:
+            self._size -= self._undo.popleft().size
+
+    @staticmethod
+    def _changed_fields(before, after):
+        """Get the keys whose values differ between two versions of a signal"""
+        keys = set(before.keys()) | set(after.keys())
+        return frozenset(key for key in keys if before.get(key) != after.get(key))
+
+    @staticmethod
+    def _signal_size(signal):
+        """Estimate the bytes held by a signal (values shared through the string pool included)"""
+        if signal is None:
+            return 0
+        return sys.getsizeof(signal) + sum(sys.getsizeof(value) for value in signal.values())
+
+    def _delta_size(self, delta):
+        """Estimate the bytes kept alive by a delta"""
+        return sys.getsizeof(delta) + self._signal_size(delta.before) + self._signal_size(delta.after)
+
+    # Applying
+
+    def undo(self):
+        """Revert the newest edit
+
+        Returns:
+            str: The label of the reverted edit, or None if there was none
+        """
+        if not self._undo:
+            return None
+        entry = self._undo.pop()
+        self._size -= entry.size
+        self._apply([(delta.signal_id, delta.after, delta.before, delta.position)
+                     for delta in reversed(entry.deltas)])
+        self._redo.append(entry)
+        return entry.label
+
+    def redo(self):
+        """Apply the newest reverted edit again
+
+        Returns:
+            str: The label of the edit, or None if there was none
+        """
+        if not self._redo:
+            return None
+        entry = self._redo.pop()
+        self._apply([(delta.signal_id, delta.before, delta.after, delta.position) for delta in entry.deltas])
+        self._undo.append(entry)
+        self._size += entry.size
+        self._evict()
+        return entry.label
+
+    def _apply(self, changes):
+        """Bring signals from one version to another through the store's batch operations
+
+        Args:
+            changes: List of (signal ID, current signal, target signal,
+                position); a None current adds the target, at its recorded
+                position if any, and a None target removes the signal
+        """
+        removals = [signal_id for signal_id, current, target, position in changes if target is None]
+        updates = {signal_id: target for signal_id, current, target, position in changes
+                   if current is not None and target is not None}
+        # A signal may have been added again behind the history's back
+        additions = [(position, target) for signal_id, current, target, position in changes
+                     if current is None and target is not None and signal_id not in self.store]
+        # Ascending positions rebuild the list as it was around the signals
+        insertions = sorted((entry for entry in additions if entry[0] is not None), key=lambda entry: entry[0])
+        appended = [target for position, target in additions if position is None]
+
+        self._applying = True
+        try:
+            if removals:
+                self.store.remove_many(removals)
+            if updates:
+                self.store.replace_many(updates)
+            if insertions:
+                self.store.insert_many(insertions)
+            if appended:
+                self.store.add_many(appended)
+        finally:
+            self._applying = False
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalIndex module - keeps id -> position and name -> id indexes in sync with a signals list
+"""
+
+from bisect import bisect_left, insort
+
+
+class SignalNameIndex:
+    """Index of signal names to the IDs that use them
+
+    Names normally map to a single ID, stored as is; only names shared by
+    several signals (projects saved with duplicates still load and can be
+    repaired) switch to a set of IDs.
+    """
+
+    def __init__(self, case_sensitive=True):
+        """Initialize the SignalNameIndex
+
+        Args:
+            case_sensitive: If False, names differing only in case are treated as equal
+        """
+        self.case_sensitive = case_sensitive
+        self._ids_by_name = {}
+
+    def key(self, name):
+        """Return the lookup key for a name"""
+        if name is None:
+            return None
+        return name if self.case_sensitive else name.casefold()
+
+    def clear(self):
+        """Remove every name from the index"""
+        self._ids_by_name = {}
+
+    def add(self, name, signal_id):
+        """Record that a signal uses a name"""
+        if not name:
+            return
+        key = self.key(name)
+        ids = self._ids_by_name.get(key)
+        if ids is None:
+            self._ids_by_name[key] = signal_id
+        elif isinstance(ids, set):
+            ids.add(signal_id)
+        elif ids != signal_id:
+            self._ids_by_name[key] = {ids, signal_id}
+
+    def discard(self, name, signal_id):
+        """Forget that a signal uses a name"""
+        if not name:
+            return
+        key = self.key(name)
+        ids = self._ids_by_name.get(key)
+        if isinstance(ids, set):
+            ids.discard(signal_id)
+            if len(ids) == 1:
+                self._ids_by_name[key] = next(iter(ids))
+        elif ids is not None and ids == signal_id:
+            del self._ids_by_name[key]
+
+    def owners(self, name):
+        """Return the set of IDs using a name"""
+        ids = self._ids_by_name.get(self.key(name))
+        if ids is None:
+            return set()
+        return set(ids) if isinstance(ids, set) else {ids}
+
+    def is_taken(self, name, signal_id=None):
+        """Check whether a name is used by a signal other than signal_id
+
+        Args:
+            name: The name to check
+            signal_id: Optional ID of the signal that is allowed to hold the name
+
+        Returns:
+            bool: True if another signal already uses the name
+        """
+        ids = self._ids_by_name.get(self.key(name))
+        if ids is None:
+            return False
+        if isinstance(ids, set):
+            return len(ids) > 1 or signal_id not in ids
+        return ids != signal_id
+
+    def find_conflicts(self, names, signal_ids=None, current_names=None):
+        """Check a batch of names against the index and against each other
+
+        Only names that change are checked: a signal keeping its name (up to
+        case, when case is ignored) passes even if the name is shared, as in
+        projects saved with duplicates. A name being given up by another
+        signal of the batch counts as free, so a batch may swap names.
+
+        Args:
+            names: Iterable of names to check
+            signal_ids: Optional iterable of IDs parallel to names, for signals
+                that may keep their current name
+            current_names: Optional iterable parallel to names of the names
+                the signals hold now (None for new signals)
+
+        Returns:
+            dict: Conflicting name -> error message
+        """
+        names = list(names)
+        signal_ids = list(signal_ids) if signal_ids is not None else [None] * len(names)
+        current_names = list(current_names) if current_names is not None else [None] * len(names)
+        signal_ids += [None] * (len(names) - len(signal_ids))
+        current_names += [None] * (len(names) - len(current_names))
+
+        changes = []
+        # Key -> IDs of the batch giving the name up
+        released = {}
+        for name, signal_id, current_name in zip(names, signal_ids, current_names):
+            if current_name and self.key(current_name) == self.key(name):
+                continue
+            if current_name and signal_id is not None:
+                released.setdefault(self.key(current_name), set()).add(signal_id)
+            if name:
+                changes.append((name, signal_id))
+
+        conflicts = {}
+        seen = set()
+        for name, signal_id in changes:
+            key = self.key(name)
+            if key in seen:
+                conflicts[name] = f"Signal name '{name}' is used more than once in the batch"
+            elif self.owners(name) - released.get(key, set()) - {signal_id}:
+                conflicts[name] = f"Signal with name '{name}' already exists"
+            seen.add(key)
+
+        return conflicts
+
+
+class SignalIndex:
+    """Index of a signals list by signal ID
+
+    Every signal is given a slot number when it enters the index. Deleting a
+    signal does not renumber the signals after it; its slot is recorded as a
+    tombstone instead, and the list position of any signal is its slot minus
+    the number of tombstones in front of it (a single bisect). Once the
+    tombstones pass a fraction of the list they are folded back into fresh
+    slots, so removal stays amortized O(1) apart from the list's own memmove.
+
+    The signals list itself stays a plain, ordered list so it can be saved
+    and iterated exactly as before.
+    """
+
+    # Compact the tombstones once they exceed 1/COMPACT_RATIO of the list
+    COMPACT_RATIO = 8
+    MIN_COMPACT_SIZE = 64
+
+    def __init__(self, signals=None, case_sensitive_names=True):
+        """Initialize the SignalIndex
+
+        Args:
+            signals: Optional list of signal dictionaries to index
+            case_sensitive_names: Whether the name index treats case as significant
+        """
+        self.names = SignalNameIndex(case_sensitive_names)
+        self.signals = []
+        self._slots = {}
+        self._signals_by_id = {}
+        self._tombstones = []
+        self._next_slot = 0
+        self.rebuild(signals if signals is not None else [])
+
+    def rebuild(self, signals):
+        """Rebuild the index from a signals list
+
+        Args:
+            signals: The list of signal dictionaries to index
+        """
+        slots = {}
+        signals_by_id = {}
+        self.names.clear()
+        for position, signal in enumerate(signals):
+            signal_id = signal.get("id")
+            # Keep the first occurrence, as a linear scan would
+            if signal_id is not None and signal_id not in slots:
+                slots[signal_id] = position
+                signals_by_id[signal_id] = signal
+                self.names.add(signal.get("name"), signal_id)
+
+        self.signals = signals
+        self._slots = slots
+        self._signals_by_id = signals_by_id
+        self._tombstones = []
+        self._next_slot = len(signals)
+
+    def is_synced(self, signals):
+        """Check whether the index still describes the given signals list
+
+        Args:
+            signals: The signals list the caller expects to be indexed
+
+        Returns:
+            bool: False if the list was replaced or resized behind the index
+        """
+        return (signals is self.signals and
+                len(signals) == self._next_slot - len(self._tombstones))
+
+    def __len__(self):
+        return len(self._signals_by_id)
+
+    def __contains__(self, signal_id):
+        return signal_id in self._signals_by_id
+
+    def ids(self):
+        """Return a view of all indexed signal IDs"""
+        return self._signals_by_id.keys()
+
+    def get(self, signal_id):
+        """Get a signal by its ID
+
+        Args:
+            signal_id: The ID of the signal
+
+        Returns:
+            dict: The signal data dictionary, or None if not found
+        """
+        return self._signals_by_id.get(signal_id)
+
+    def position(self, signal_id):
+        """Get the current list position of a signal
+
+        Args:
+            signal_id: The ID of the signal
+
+        Returns:
+            int: The position in the signals list, or None if not found
+        """
+        slot = self._slots.get(signal_id)
+        if slot is None or not self._tombstones:
+            return slot
+        return slot - bisect_left(self._tombstones, slot)
+
+    def in_list_order(self, signal_ids):
+        """Get the signals for a collection of IDs, ordered as in the signals list
+
+        Slots grow with list position, so sorting by slot gives list order
+        without computing any positions.
+
+        Args:
+            signal_ids: Iterable of signal IDs; unknown IDs are skipped
+
+        Returns:
+            list: The signal data dictionaries in list order
+        """
+        slots = self._slots
+        known_ids = [signal_id for signal_id in signal_ids if signal_id in slots]
+        known_ids.sort(key=slots.__getitem__)
+        signals_by_id = self._signals_by_id
+        return [signals_by_id[signal_id] for signal_id in known_ids]
+
+    def append(self, signal):
+        """Append a signal to the list and index it
+
+        Args:
+            signal: The signal data dictionary (must carry its "id")
+        """
+        self.signals.append(signal)
+        signal_id = signal.get("id")
+        if signal_id is not None and signal_id not in self._slots:
+            self._slots[signal_id] = self._next_slot
+            self._signals_by_id[signal_id] = signal
+            self.names.add(signal.get("name"), signal_id)
+        self._next_slot += 1
+
+    def replace(self, signal_id, signal):
+        """Replace the signal stored under an ID, keeping its position
+
+        Args:
+            signal_id: The ID of the signal to replace
+            signal: The new signal data dictionary
+
+        Returns:
+            bool: True if the signal was replaced, False if the ID is unknown
+        """
+        position = self.position(signal_id)
+        if position is None:
+            return False
+
+        previous = self.signals[position]
+        self.signals[position] = signal
+        self._signals_by_id[signal_id] = signal
+        self.names.discard(previous.get("name"), signal_id)
+        self.names.add(signal.get("name"), signal_id)
+        return True
+
+    def remove(self, signal_id):
+        """Remove a signal from the list and the index
+
+        Args:
+            signal_id: The ID of the signal to remove
+
+        Returns:
+            dict: The removed signal, or None if the ID is unknown
+        """
+        slot = self._slots.pop(signal_id, None)
+        if slot is None:
+            return None
+
+        position = slot - bisect_left(self._tombstones, slot)
+        signal = self.signals.pop(position)
+        del self._signals_by_id[signal_id]
+        self.names.discard(signal.get("name"), signal_id)
+        insort(self._tombstones, slot)
+
+        if len(self._tombstones) > max(self.MIN_COMPACT_SIZE,
+                                       len(self.signals) // self.COMPACT_RATIO):
+            self.rebuild(self.signals)
+
+        return signal
+
+    def extend(self, signals):
+        """Append several signals to the list and index them
+
+        Args:
+            signals: Iterable of signal data dictionaries (each must carry its "id")
+        """
+        for signal in signals:
+            self.append(signal)
+
+    def insert_many(self, entries):
+        """Insert several signals at given list positions and index them
+
+        Signals landing at the end of the list are appended as usual; any
+        other insertion shifts the slots after it, so the index is rebuilt
+        once the batch is in.
+
+        Args:
+            entries: Iterable of (position, signal) pairs in ascending
+                position order, each position taken in the list as it is once
+                the earlier entries are in (the positions the signals had
+                before being removed together)
+        """
+        shifted = False
+        for position, signal in entries:
+            if not shifted and position >= len(self.signals):
+                self.append(signal)
+            else:
+                self.signals.insert(position, signal)
+                shifted = True
+        if shifted:
+            self.rebuild(self.signals)
+
+    def remove_many(self, signal_ids):
+        """Remove several signals from the list and the index
+
+        Small batches are removed one by one; large batches are filtered out
+        of the list in a single pass followed by one rebuild.
+
+        Args:
+            signal_ids: Iterable of IDs of the signals to remove
+
+        Returns:
+            list: The removed signals, in the order of signal_ids for small
+                batches and in list order for large ones
+        """
+        # A dict keeps the batch de-duplicated and in input order
+        doomed = {signal_id: None for signal_id in signal_ids if signal_id in self._signals_by_id}
+        if len(doomed) <= max(self.MIN_COMPACT_SIZE, len(self.signals) // self.COMPACT_RATIO):
+            return [self.remove(signal_id) for signal_id in doomed]
+
+        removed = []
+        kept = []
+        signals_by_id = self._signals_by_id
+        for signal in self.signals:
+            signal_id = signal.get("id")
+            if signal_id in doomed and signals_by_id.get(signal_id) is signal:
+                removed.append(signal)
+            else:
+                kept.append(signal)
+
+        # Filter in place so that holders of the list see the change
+        self.signals[:] = kept
+        self.rebuild(self.signals)
+        return removed
+
@@ -7,32 +7,126 @@ SignalManager module for handling signal operations
 
 import os
 import json
-import uuid
-from PyQt5.QtWidgets import (QTreeWidget, QTreeWidgetItem, QFormLayout, QLabel, 
-                           QLineEdit, QMessageBox, QVBoxLayout, QWidget, QComboBox)
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QFormLayout, QLineEdit, QMessageBox, QComboBox
+
+from Modules.SignalOperations.SignalIndex import SignalIndex
+from Modules.SignalOperations.SignalStore import SignalStore
+from Modules.SignalOperations.SignalColumns import SignalColumnStore
+from Modules.SignalOperations.SignalTreeModel import SignalTreeModel
+from Modules.SignalOperations.SignalSearchIndex import SignalSearchIndex
+from Modules.SignalOperations.SignalFilterProxyModel import SignalFilterProxyModel
+from Modules.SignalOperations.SignalDetailsPanel import SignalDetailsPanel
+from Modules.SignalOperations.SignalGroupModel import SignalGroupModel
+from Modules.SignalOperations.SignalHistory import SignalHistory
+from Modules.SignalOperations.SignalSnapshots import SignalSnapshots
+from Modules.DataBaseOperation.facet_index import FacetIndex
 
 class SignalManager:
     """Class for managing signal operations"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, case_sensitive_names=True, store=None):
         """Initialize the SignalManager
         
         Args:
             parent: The parent widget (usually the main application)
+            case_sensitive_names: Whether signal names differing only in case are distinct
+            store: Optional SignalStore to share, e.g. with DatabaseOperations
         """
         self.parent = parent
         self.project_data = {}
         self.current_signal = None
         self.current_signal_id = None
+        self.store = store if store is not None else SignalStore(case_sensitive_names=case_sensitive_names)
+        self.column_store = None
+        self.search_index = None
+        self.signal_tree_model = None
+        self.signal_filter_model = None
+        self.signal_group_model = None
+        self.facet_index = None
+        # Whether update_signal_tree shows the signals grouped by board / SoC / build image
+        self.signal_grouping = False
+        self.details_panel = None
+        # Snapshots of the signals, compared with the last saved state
+        self.snapshots = SignalSnapshots()
+        self.store.attach(self.snapshots)
+        # Registered first so the project is marked modified before other listeners run
+        self.store.subscribe(self._on_signals_changed)
+        # Undo/redo of the edits made through this manager
+        self.history = SignalHistory(self.store)
+        
+    @property
+    def signal_index(self):
+        """The ID/name index of the store"""
+        return self.store.index
+        
+    @property
+    def id_allocator(self):
+        """The signal ID allocator of the store"""
+        return self.store.id_allocator
         
-    def set_project_data(self, project_data):
+    def set_project_data(self, project_data, string_pool=None):
         """Set the project data
         
         Args:
             project_data: The project data dictionary
+            string_pool: Optional StringPool the project's signals were interned
+                in by the loader
         """
         self.project_data = project_data
+        signals = self.project_data.get("signals") if self.project_data else None
+        self.store.load(signals if signals is not None else [], string_pool)
+        self.snapshots.mark_saved()
+        # Build the search index off the GUI thread before the first keystroke needs it
+        self.get_search_index().build_in_background()
+        
+    def get_signal_index(self):
+        """Get the signal index, rebuilding it if the signals list changed behind it
+        
+        Returns:
+            SignalIndex: The index of the project's signals, or None if there are no signals
+        """
+        if not self.project_data or "signals" not in self.project_data:
+            return None
+            
+        self.store.sync(self.project_data["signals"])
+        return self.store.index
+    
+    def _ensure_signals_list(self):
+        """Give the project a signals list, sharing the store's own list"""
+        if "signals" not in self.project_data:
+            self.project_data["signals"] = self.store.signals
+        self.get_signal_index()
+    
+    def get_column_store(self):
+        """Get the columnar mirror of the numeric signal attributes
+        
+        The store is created on first use and then kept in step with every
+        change made to the signal store.
+        
+        Returns:
+            SignalColumnStore: The column store of the project's signals
+        """
+        self.get_signal_index()
+        if self.column_store is None:
+            self.column_store = SignalColumnStore()
+            self.store.attach(self.column_store)
+        return self.column_store
+        
+    def get_search_index(self):
+        """Get the free-text search index over the signals' text fields
+        
+        The index is attached to the signal store on first use. Once a
+        project is set it is built on a worker thread, and rebuilt there
+        whenever the store rebuilds it.
+        
+        Returns:
+            SignalSearchIndex: The search index of the project's signals
+        """
+        self.get_signal_index()
+        if self.search_index is None:
+            self.search_index = SignalSearchIndex()
+            self.store.attach(self.search_index)
+        return self.search_index
         
     def find_signal_by_id(self, signal_id):
         """Find a signal by its ID
@@ -43,14 +137,11 @@ class SignalManager:
         Returns:
             dict: The signal data dictionary, or None if not found
         """
-        if not self.project_data or "signals" not in self.project_data:
+        signal_index = self.get_signal_index()
+        if signal_index is None:
             return None
             
-        for signal in self.project_data["signals"]:
-            if signal.get("id") == signal_id:
-                return signal
-                
-        return None
+        return signal_index.get(signal_id)
     
     def generate_signal_id(self):
         """Generate a unique signal ID
@@ -58,16 +149,22 @@ class SignalManager:
         Returns:
             str: A unique signal ID
         """
-        # Start with a simple UUID4-based ID
-        new_id = str(uuid.uuid4())[:8]
+        # Make sure IDs added behind our back are known to the allocator
+        self.get_signal_index()
         
-        # Check if this ID already exists in the project
-        if "signals" in self.project_data:
-            existing_ids = [signal.get("id") for signal in self.project_data["signals"] if "id" in signal]
-            while new_id in existing_ids:
-                new_id = str(uuid.uuid4())[:8]
-                
-        return new_id
+        return self.store.generate_id()
+    
+    def reserve_signal_ids(self, count):
+        """Reserve a block of unique signal IDs, e.g. for an import or paste
+        
+        Args:
+            count: Number of IDs to reserve
+            
+        Returns:
+            list: The reserved signal IDs
+        """
+        self.get_signal_index()
+        return self.store.reserve_ids(count)
     
     def add_signal_to_database(self, signal_data):
         """Add a signal to the database
@@ -78,22 +175,13 @@ class SignalManager:
         Returns:
             str: The ID of the added signal
         """
-        # If signals key doesn't exist, create it
-        if "signals" not in self.project_data:
-            self.project_data["signals"] = []
-            
-        # Generate a unique ID if not provided
-        if "id" not in signal_data or not signal_data["id"]:
-            signal_data["id"] = self.generate_signal_id()
-            
-        # Add to signals list
-        self.project_data["signals"].append(signal_data)
+        self._ensure_signals_list()
         
-        # Mark project as modified
-        if self.parent and hasattr(self.parent, "set_project_modified"):
-            self.parent.set_project_modified(True)
-            
-        return signal_data["id"]
+        # The store generates a unique ID if none is provided
+        signal_id = self.store.add(signal_data)
+        if signal_id is not None:
+            self.history.record_added(f"Add signal '{signal_data.get('name', '')}'", [signal_data])
+        return signal_id
     
     def update_signal_in_database(self, signal_id, updated_data):
         """Update a signal in the database
@@ -105,24 +193,15 @@ class SignalManager:
         Returns:
             bool: True if the signal was updated, False otherwise
         """
-        if not self.project_data or "signals" not in self.project_data:
+        if self.get_signal_index() is None:
             return False
             
-        # Find the signal by ID
-        for i, signal in enumerate(self.project_data["signals"]):
-            if signal.get("id") == signal_id:
-                # Ensure the ID is preserved
-                updated_data["id"] = signal_id
-                # Update the signal
-                self.project_data["signals"][i] = updated_data
-                
-                # Mark project as modified
-                if self.parent and hasattr(self.parent, "set_project_modified"):
-                    self.parent.set_project_modified(True)
-                    
-                return True
-                
-        return False
+        # The store keeps the ID and the position of the signal
+        previous = self.store.replace(signal_id, updated_data)
+        if previous is None:
+            return False
+        self.history.record_updated(f"Edit signal '{updated_data.get('name', '')}'", [(previous, updated_data)])
+        return True
     
     def delete_signal_from_database(self, signal_id):
         """Delete a signal from the database
@@ -133,56 +212,299 @@ class SignalManager:
         Returns:
             bool: True if the signal was deleted, False otherwise
         """
-        if not self.project_data or "signals" not in self.project_data:
+        if self.get_signal_index() is None:
             return False
             
-        # Find the signal by ID
-        for i, signal in enumerate(self.project_data["signals"]):
-            if signal.get("id") == signal_id:
-                # Save the current state for potential undo
-                signal_data = signal.copy()
-                
-                # Remove the signal
-                del self.project_data["signals"][i]
-                
-                # Mark project as modified
-                if self.parent and hasattr(self.parent, "set_project_modified"):
-                    self.parent.set_project_modified(True)
-                    
-                return True
-                
-        return False
+        signal = self.store.remove(signal_id)
+        if signal is None:
+            return False
+        self.history.record_removed(f"Delete signal '{signal.get('name', '')}'", [signal])
+        return True
     
-    def update_signal_tree(self, tree_widget):
-        """Update the signal tree with current data
+    def add_signals(self, signals_data):
+        """Add a batch of signals to the database
+        
+        The whole batch is validated up front and either added completely or
+        not at all. Missing IDs are reserved in one block and a single change
+        notification is sent for the batch.
         
         Args:
-            tree_widget: The QTreeWidget to update
+            signals_data: List of signal data dictionaries
+            
+        Returns:
+            tuple: (list, dict) - (IDs of the added signals, errors by signal name).
+                Nothing is added if the error dictionary is not empty.
         """
-        # Clear the tree
-        tree_widget.clear()
+        errors = self.validate_signals(signals_data)
+
+        # Supplied IDs must be new to the project and to the batch
+        signal_index = self.get_signal_index()
+        seen_ids = set()
+        for signal_data in signals_data:
+            signal_id = signal_data.get("id")
+            if not signal_id:
+                continue
+            if signal_id in seen_ids or (signal_index is not None and signal_id in signal_index):
+                errors.setdefault(signal_data.get("name") or signal_id, f"Signal ID '{signal_id}' already exists")
+            seen_ids.add(signal_id)
+
+        if errors:
+            return [], errors
+
+        self._ensure_signals_list()
+        signal_ids = self.store.add_many(signals_data)
+        self.history.record_added(f"Add {len(signal_ids)} signals", signals_data)
+        return signal_ids, {}
+    
+    def update_signals(self, updates):
+        """Update a batch of signals in the database
         
-        # If no signals, return
-        if not self.project_data or "signals" not in self.project_data:
-            return
+        Args:
+            updates: Dictionary of signal ID -> updated signal data
+            
+        Returns:
+            tuple: (list, dict) - (IDs of the updated signals, errors by signal name or ID).
+                Nothing is updated if the error dictionary is not empty.
+        """
+        signal_index = self.get_signal_index()
+        if signal_index is None:
+            return [], {signal_id: "Signal not found" for signal_id in updates}
             
-        # Add signals to the tree
-        for signal in self.project_data["signals"]:
-            # Create a tree item for the signal
-            item = QTreeWidgetItem(tree_widget)
+        errors = {signal_id: "Signal not found" for signal_id in updates if signal_id not in signal_index}
+        if not errors:
+            for signal_id, updated_data in updates.items():
+                # Ensure the ID is preserved
+                updated_data["id"] = signal_id
+            errors = self.validate_signals(list(updates.values()))
+        if errors:
+            return [], errors
             
-            # Set signal name in first column
-            item.setText(0, signal.get("name", "Unknown"))
+        previous = {signal_id: signal_index.get(signal_id) for signal_id in updates}
+        signal_ids = self.store.replace_many(updates)
+        self.history.record_updated(f"Edit {len(signal_ids)} signals",
+                                    [(previous[signal_id], updates[signal_id]) for signal_id in signal_ids])
+        return signal_ids, {}
+
+    def set_signal_attributes(self, signal_ids, attributes):
+        """Set the same attributes on a batch of signals, e.g. a multi-selection
+
+        Args:
+            signal_ids: Iterable of IDs of the signals to edit
+            attributes: Dictionary of attribute name -> value to set on each signal
+
+        Returns:
+            tuple: (list, dict) - (IDs of the updated signals, errors by signal name or ID).
+                Nothing is updated if the error dictionary is not empty.
+        """
+        signal_index = self.get_signal_index()
+        updates = {}
+        for signal_id in signal_ids:
+            if signal_id in updates:
+                continue
+            signal = signal_index.get(signal_id) if signal_index is not None else None
+            if signal is None:
+                # Reported as not found by update_signals
+                updates[signal_id] = dict(attributes)
+                continue
+            updated_data = signal.copy()
+            updated_data.update(attributes)
+            updates[signal_id] = updated_data
+
+        return self.update_signals(updates)
+
+    def delete_signals(self, signal_ids):
+        """Delete a batch of signals from the database
+        
+        Args:
+            signal_ids: Iterable of IDs of the signals to delete
             
-            # Set additional info in other columns if desired
-            item.setText(1, signal.get("data_type", ""))
+        Returns:
+            list: IDs of the signals that were deleted
+        """
+        if self.get_signal_index() is None:
+            return []
             
-            # Store the signal ID in the item's data
-            item.setData(0, Qt.UserRole, signal.get("id"))
+        removed = self.store.remove_many(signal_ids)
+        self.history.record_removed(f"Delete {len(removed)} signals", removed)
+        return [signal.get("id") for signal in removed]
+    
+    def undo(self):
+        """Revert the newest signal edit
+        
+        Returns:
+            str: Description of the reverted edit, or None if there was none
+        """
+        self.get_signal_index()
+        return self.history.undo()
+    
+    def redo(self):
+        """Apply the newest reverted signal edit again
+        
+        Returns:
+            str: Description of the edit, or None if there was none
+        """
+        self.get_signal_index()
+        return self.history.redo()
+    
+    def set_undo_options(self, memory_budget=None, merge_edits=None):
+        """Configure the undo history
+        
+        Args:
+            memory_budget: Optional estimated bytes the undo history may keep
+                alive; the oldest edits are dropped beyond it
+            merge_edits: Optional flag, True to merge consecutive edits of the
+                same fields of a signal into one undo step
+        """
+        if memory_budget is not None:
+            self.history.set_memory_budget(memory_budget)
+        if merge_edits is not None:
+            self.history.merge_edits = merge_edits
+    
+    def mark_saved(self):
+        """Take the current signals as the saved state of the project"""
+        self.snapshots.mark_saved()
+    
+    def has_unsaved_signal_changes(self):
+        """Check whether the signals differ from the last saved (or loaded) state
+        
+        An edit that was undone again does not count as a change.
+        """
+        self.get_signal_index()
+        return self.snapshots.is_modified()
+    
+    def get_changes_since_saved(self):
+        """Compare the signals with the last saved (or loaded) state
+        
+        Returns:
+            tuple: (added IDs, removed IDs, changed IDs)
+        """
+        self.get_signal_index()
+        return self.snapshots.changes_since_saved()
+    
+    def add_change_listener(self, callback):
+        """Register a callback for signal changes
+        
+        Args:
+            callback: Callable taking (event, signal_ids), where event is one of
+                "added", "updated", "removed", "reset" (the signals list was
+                replaced, reread it) or "removing" (sent before a removal)
+        """
+        self.store.subscribe(callback)
+    
+    def remove_change_listener(self, callback):
+        """Unregister a callback added with add_change_listener"""
+        self.store.unsubscribe(callback)
+    
+    def notify_signals_changed(self, event, signal_ids):
+        """Send a change notification for changes made outside the store
+        
+        Args:
+            event: "added", "updated", "removed" or "reset"
+            signal_ids: List of the IDs affected by the change
+        """
+        self.store.publish(event, signal_ids)
+    
+    def _on_signals_changed(self, event, signal_ids):
+        """Mark the project as modified when signals are edited, or not once undone back to the saved state"""
+        if event in ("added", "updated", "removed") and self.parent and hasattr(self.parent, "set_project_modified"):
+            self.parent.set_project_modified(self.snapshots.is_modified())
+            
+    def get_signal_tree_model(self):
+        """Get the item model showing the project's signals
+        
+        Returns:
+            SignalTreeModel: The model, created on first use
+        """
+        if self.signal_tree_model is None:
+            self.signal_tree_model = SignalTreeModel(self.store)
+        return self.signal_tree_model
+    
+    def get_signal_filter_model(self):
+        """Get the proxy filtering the signal tree model by a search text
+        
+        Returns:
+            SignalFilterProxyModel: The proxy, created on first use
+        """
+        if self.signal_filter_model is None:
+            self.signal_filter_model = SignalFilterProxyModel(self.get_search_index())
+            self.signal_filter_model.setSourceModel(self.get_signal_tree_model())
+        return self.signal_filter_model
+    
+    def get_signal_group_model(self):
+        """Get the item model showing the signals grouped by board, SoC and build image
+        
+        The facet index the groups come from is attached to the signal store
+        on first use.
+        
+        Returns:
+            SignalGroupModel: The model, created on first use
+        """
+        self.get_signal_index()
+        if self.signal_group_model is None:
+            self.facet_index = FacetIndex(track_members=True)
+            self.store.attach(self.facet_index)
+            self.signal_group_model = SignalGroupModel(self.store, self.facet_index)
+        return self.signal_group_model
+    
+    def set_signal_grouping(self, grouped):
+        """Choose whether update_signal_tree shows the signals grouped
+        
+        Args:
+            grouped: True for board > SoC > build image groups, False for the
+                flat, searchable list
+        """
+        self.signal_grouping = grouped
+    
+    def get_signal_tree_index(self, signal_id):
+        """Get the index of a signal's row in the model update_signal_tree shows
+        
+        Args:
+            signal_id: The ID of the signal
+            
+        Returns:
+            QModelIndex: The index, invalid if the signal is unknown or
+                filtered out by the search text
+        """
+        if self.signal_grouping:
+            return self.get_signal_group_model().index_of(signal_id)
+        return self.get_signal_filter_model().mapFromSource(self.get_signal_tree_model().index_of(signal_id))
+    
+    def set_signal_search_text(self, text):
+        """Show only the signals matching a search text in the signal tree
+        
+        Args:
+            text: Whitespace-separated terms to find in the name, variable
+                port name or description; an empty text shows every signal
+        """
+        self.get_signal_filter_model().set_search_text(text)
+    
+    def update_signal_tree(self, tree_view):
+        """Show the current signals in a tree view
+        
+        The view is given the search filter over the signal tree model, or
+        the grouped model if set_signal_grouping chose it; both follow the
+        signal store by themselves, so calling this again only checks for
+        signals changed behind the store.
+        
+        Args:
+            tree_view: The QTreeView to update
+        """
+        self.get_signal_index()
+        
+        if self.signal_grouping:
+            model = self.get_signal_group_model()
+        else:
+            model = self.get_signal_filter_model()
+        if tree_view.model() is not model:
+            tree_view.setModel(model)
     
     def populate_signal_details(self, parent, signal_data, form_layout=None):
         """Populate signal details in a form layout
         
+        The row widgets are kept in a SignalDetailsPanel and reused by the
+        next call with the same form layout, so changing the selection only
+        updates label texts.
+        
         Args:
             parent: The parent widget
             signal_data: The signal data dictionary
@@ -191,62 +513,14 @@ class SignalManager:
         Returns:
             QFormLayout: The populated form layout
         """
-        # If no form layout provided, create one
-        if not form_layout:
+        # If no form layout provided, create one (an empty layout is falsy)
+        if form_layout is None:
             form_layout = QFormLayout()
             
-        # Clear the existing layout
-        while form_layout.count() > 0:
-            item = form_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-                
-        # Add signal details to the form
-        for key, value in signal_data.items():
-            # Skip internal fields like ID
-            if key in ["id", "struct_fields"]:
-                continue
-                
-            # Create a label and value widget
-            label = QLabel(f"{key.replace('_', ' ').title()}:")
-            
-            # For different types of values, create appropriate widgets
-            if isinstance(value, bool):
-                value_widget = QLabel("Yes" if value else "No")
-            elif isinstance(value, (list, dict)):
-                value_widget = QLabel(str(value))
-            else:
-                value_widget = QLabel(str(value))
-                
-            # Add to the form layout
-            form_layout.addRow(label, value_widget)
-            
-        # Handle struct fields separately if present
-        if "struct_fields" in signal_data and signal_data.get("data_type") == "STRUCT":
-            # Create a container for struct fields
-            struct_container = QWidget()
-            struct_layout = QVBoxLayout(struct_container)
-            
-            # Add a header
-            struct_layout.addWidget(QLabel("<b>Struct Fields:</b>"))
-            
-            # Create a sub-form for each field
-            for field in signal_data["struct_fields"]:
-                field_form = QFormLayout()
-                
-                # Add field details
-                for key, value in field.items():
-                    label = QLabel(f"{key.replace('_', ' ').title()}:")
-                    value_widget = QLabel(str(value))
-                    field_form.addRow(label, value_widget)
-                    
-                # Add a separator
-                struct_layout.addLayout(field_form)
-                struct_layout.addWidget(QLabel("----------"))
-                
-            # Add the struct container to the main form
-            form_layout.addRow(QLabel(""), struct_container)
+        if self.details_panel is None or self.details_panel.layout is not form_layout:
+            self.details_panel = SignalDetailsPanel(form_layout)
             
+        self.details_panel.show_signal(signal_data)
         return form_layout
     
     def collect_signal_form_data(self, parent):
@@ -291,12 +565,65 @@ class SignalManager:
             return False, "Data type is required"
             
         # Check for duplicate names
-        if "signals" in self.project_data:
-            for signal in self.project_data["signals"]:
-                if (signal.get("name") == signal_data["name"] and 
-                    (signal.get("id") != signal_data.get("id"))):
-                    return False, f"Signal with name '{signal_data['name']}' already exists"
-                    
+        conflicts = self.validate_signal_names([signal_data["name"]], [signal_data.get("id")])
+        if conflicts:
+            return False, conflicts[signal_data["name"]]
+            
         # Add more validation rules as needed
         
-        return True, "" 
\ No newline at end of file
+        return True, ""
+    
+    def validate_signals(self, signals_data):
+        """Validate a batch of signals in one pass
+        
+        Args:
+            signals_data: List of signal data dictionaries
+            
+        Returns:
+            dict: Signal name (or position for unnamed signals) -> error message
+        """
+        errors = {}
+        for position, signal_data in enumerate(signals_data):
+            if not signal_data.get("name"):
+                errors[f"#{position}"] = "Signal name is required"
+            elif not signal_data.get("data_type"):
+                errors[signal_data["name"]] = "Data type is required"
+                
+        names = [signal_data.get("name") for signal_data in signals_data]
+        signal_ids = [signal_data.get("id") for signal_data in signals_data]
+        for name, message in self.validate_signal_names(names, signal_ids).items():
+            errors.setdefault(name, message)
+            
+        return errors
+    
+    def validate_signal_names(self, names, signal_ids=None):
+        """Validate a batch of signal names against the project in one pass
+        
+        Args:
+            names: List of signal names to check, e.g. the names of an import
+            signal_ids: Optional list of IDs parallel to names, for signals that
+                may keep their current name
+            
+        Returns:
+            dict: Conflicting name -> error message (empty if all names are unique).
+                Names a signal already holds are not checked again, and names
+                other signals of the batch give up count as free.
+        """
+        signal_index = self.get_signal_index()
+        if signal_index is None:
+            # No project signals yet, only check the batch against itself
+            signal_index = SignalIndex(case_sensitive_names=self.signal_index.names.case_sensitive)
+            
+        current_names = None
+        if signal_ids is not None:
+            current = [signal_index.get(signal_id) if signal_id is not None else None for signal_id in signal_ids]
+            current_names = [signal.get("name") if signal is not None else None for signal in current]
+        return signal_index.names.find_conflicts(names, signal_ids, current_names)
+    
+    def set_case_sensitive_names(self, case_sensitive):
+        """Choose whether signal names that differ only in case count as duplicates
+        
+        Args:
+            case_sensitive: True to compare names exactly, False to ignore case
+        """
+        self.store.set_case_sensitive_names(case_sensitive)
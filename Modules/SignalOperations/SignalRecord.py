@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalRecord module - compact __slots__ records for signals and struct fields
+
+The records behave like the dictionaries they replace (signal["name"],
+signal.get("timeout"), "asil" in signal, dict(signal), ...), so code written
+against plain dicts keeps working, while each record only costs one pointer
+per known field instead of a full hash table.
+"""
+
+import gc
+from collections.abc import MutableMapping
+from operator import attrgetter
+
+# Value of a slot whose key is not set
+_MISSING = object()
+
+
+class SlotRecord(MutableMapping):
+    """Dict-compatible record storing its known keys in __slots__
+
+    Subclasses list their known keys in FIELDS. Unset keys hold a sentinel
+    (slots cost the same whether they are used or not) and read as missing,
+    exactly like an absent dict key, so the whole record can be read with a
+    single attrgetter call. Keys outside FIELDS are kept in a small dict that
+    is only created when such a key is first stored.
+    """
+
+    __slots__ = ("_extra",)
+
+    FIELDS = ()
+    _FIELD_SET = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+        if len(cls.FIELDS) > 1:
+            cls._field_values = attrgetter(*cls.FIELDS)
+        else:
+            cls._field_values = staticmethod(lambda record: tuple(getattr(record, name) for name in cls.FIELDS))
+
+    def __init__(self, data=None, **kwargs):
+        """Initialize the record
+
+        Args:
+            data: Optional mapping or iterable of (key, value) pairs
+            **kwargs: Additional keys to set
+        """
+        self._clear_slots()
+        if data is not None:
+            self.update(data)
+        if kwargs:
+            self.update(kwargs)
+
+    def _clear_slots(self):
+        """Mark every key as missing"""
+        self._extra = None
+        for name in self.FIELDS:
+            setattr(self, name, _MISSING)
+
+    @classmethod
+    def from_json(cls, data):
+        """Create a record from a decoded JSON object
+
+        Args:
+            data: Dictionary as returned by json.load
+
+        Returns:
+            SlotRecord: The record
+        """
+        record = cls.__new__(cls)
+        record._clear_slots()
+        fields = cls._FIELD_SET
+        for key, value in data.items():
+            if key in fields:
+                setattr(record, key, value)
+            else:
+                record._set_extra(key, value)
+        return record
+
+    def to_json(self):
+        """Get a plain dictionary of the record, ready for json.dump
+
+        Returns:
+            dict: The record's keys and values
+        """
+        result = {name: value for name, value in zip(self.FIELDS, self._field_values(self))
+                  if value is not _MISSING}
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def _set_extra(self, key, value):
+        """Store a key that has no slot"""
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        else:
+            self._set_extra(key, value)
+
+    def __delitem__(self, key):
+        if key in self._FIELD_SET:
+            if getattr(self, key) is _MISSING:
+                raise KeyError(key)
+            setattr(self, key, _MISSING)
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __contains__(self, key):
+        if key in self._FIELD_SET:
+            return getattr(self, key) is not _MISSING
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for name, value in zip(self.FIELDS, self._field_values(self)):
+            if value is not _MISSING:
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        count = sum(1 for value in self._field_values(self) if value is not _MISSING)
+        return count + (len(self._extra) if self._extra else 0)
+
+    def get(self, key, default=None):
+        if key in self._FIELD_SET:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def copy(self):
+        """Get a shallow copy of the record, like dict.copy()"""
+        return self.from_json(self.to_json())
+
+    def __reduce__(self):
+        # Pickle and deepcopy through the JSON form so the sentinel is never copied
+        return (type(self).from_json, (self.to_json(),))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_json()!r})"
+
+
+class StructField(SlotRecord):
+    """One field of a STRUCT signal"""
+
+    __slots__ = ("field_name", "data_type", "description")
+
+    FIELDS = __slots__
+
+
+class Signal(SlotRecord):
+    """A signal of the project database"""
+
+    __slots__ = ("id", "name", "variable_port_name", "description", "data_type",
+                 "init_value_type", "init_value", "asil", "buffer_count", "notifiers",
+                 "sm_buff_count", "timeout", "periodicity", "checksum", "board", "soc",
+                 "build_image", "memory_region", "impl_approach", "source_core",
+                 "destination_cores", "array_element_type", "array_size", "struct_fields")
+
+    FIELDS = __slots__
+
+    @staticmethod
+    def _struct_fields_from_json(fields):
+        """Convert decoded struct field dictionaries to StructField records"""
+        if not isinstance(fields, list):
+            return fields
+        return [StructField.from_json(field) if type(field) is dict else field for field in fields]
+
+    @classmethod
+    def from_json(cls, data):
+        record = super().from_json(data)
+        if record.struct_fields is not _MISSING:
+            record.struct_fields = cls._struct_fields_from_json(record.struct_fields)
+        return record
+
+    def to_json(self):
+        result = super().to_json()
+        fields = result.get("struct_fields")
+        if fields:
+            result["struct_fields"] = [field.to_json() if isinstance(field, SlotRecord) else field
+                                       for field in fields]
+        return result
+
+    def __setitem__(self, key, value):
+        if key == "struct_fields":
+            value = self._struct_fields_from_json(value)
+        super().__setitem__(key, value)
+
+
+def json_default(value):
+    """json.dump default hook that serializes signal records
+
+    Args:
+        value: An object the json module cannot serialize on its own
+
+    Returns:
+        dict: The record as a plain dictionary
+    """
+    if isinstance(value, SlotRecord):
+        return value.to_json()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def signals_from_json(signals):
+    """Convert a list of decoded signal dictionaries to Signal records
+
+    Args:
+        signals: List of signal dictionaries (other items are kept as they are)
+
+    Returns:
+        list: The signals as Signal records
+    """
+    # Records are tracked by the cyclic GC (flat dicts are not); building many
+    # at once would otherwise trigger repeated collections over the new heap
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return [Signal.from_json(signal) if type(signal) is dict else signal for signal in signals]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalSearchIndex module - trigram and prefix index for free-text signal search
+"""
+
+import threading
+from array import array
+
+from Modules.DataBaseOperation.query_engine import SortedIndex
+
+
+class SignalSearchIndex:
+    """Index answering free-text searches over the signals' text fields
+
+    A search is split into whitespace-separated terms, and a signal matches
+    when every term occurs, ignoring case, in one of its FIELDS. Terms of at
+    least three characters are looked up in trigram postings: the signals in
+    the smallest posting of the term's trigrams are checked for the whole
+    term. Shorter terms have no trigram and match the start of a field
+    through a sorted prefix index. Only the most selective term of a search
+    is looked up; its matches are checked for the other terms directly.
+
+    Postings hold integer signal keys in typed arrays (4 bytes per entry
+    instead of a set slot), appended in increasing key order. Removing a
+    signal retires its key: the key's text is emptied so candidate checks
+    drop it, and the keys are only renumbered and the postings compacted
+    once retired keys outnumber live ones. An edited signal gets a new key.
+
+    The index is attached to a SignalStore to follow its edits. Building it
+    takes seconds for a large project, so build_in_background() builds it
+    on a worker thread (from a copy of the signals list, see SignalStore on
+    why the signals themselves need no copy); edits made meanwhile are
+    queued and applied when the result is installed. The first search
+    installs it, waiting for the worker if it is still running. Without
+    build_in_background() the index is built on the first search. Result
+    sets returned by follow() are kept up to date as signals change,
+    before the store's listeners run.
+    """
+
+    FIELDS = ("name", "variable_port_name", "description")
+    GRAM_SIZE = 3
+
+    # Put before each field in a signal's searchable text, so one substring
+    # test checks every field and a field prefix is found as SEPARATOR + prefix
+    SEPARATOR = "\x00"
+
+    def __init__(self, signals=None):
+        """Initialize the SignalSearchIndex
+
+        Args:
+            signals: Optional list of signal dictionaries to index
+        """
+        self._followers = []
+        self._background = False
+        self._builder = None
+        self._pending = []
+        self.rebuild(signals if signals is not None else [])
+
+    @classmethod
+    def terms(cls, text):
+        """Split a search text into its case-folded terms
+
+        Args:
+            text: The text typed by the user
+
+        Returns:
+            list: The terms, without duplicates
+        """
+        return list(dict.fromkeys((text or "").casefold().split()))
+
+    @classmethod
+    def _grams(cls, value):
+        """Get the set of trigrams of a case-folded string"""
+        size = cls.GRAM_SIZE
+        return {value[i:i + size] for i in range(len(value) - size + 1)}
+
+    def _values(self, signal):
+        """Get the case-folded text fields of a signal"""
+        values = []
+        for field in self.FIELDS:
+            value = signal.get(field)
+            if isinstance(value, str) and value:
+                values.append(value.casefold())
+        return values
+
+    def _ensure_built(self):
+        """Build the index, or install the one built in the background"""
+        if self._built:
+            return
+        builder, self._builder = self._builder, None
+        if builder is None:
+            self._build()
+            return
+        thread, result = builder
+        thread.join()
+        self._keys = result._keys
+        self._ids = result._ids
+        self._texts = result._texts
+        self._postings = result._postings
+        self._prefixes = result._prefixes
+        self._retired = 0
+        self._built = True
+        # The edits made while the worker was building
+        pending, self._pending = self._pending, []
+        for signal, adding in pending:
+            if adding:
+                self.add(signal)
+            else:
+                self.remove(signal)
+
+    def build_in_background(self):
+        """Build the index on a worker thread, now and after every rebuild"""
+        self._background = True
+        if not self._built and self._builder is None:
+            self._start_builder()
+
+    def _start_builder(self):
+        """Start building a copy of the index from the current signals on a worker thread"""
+        result = SignalSearchIndex(list(self._signals))
+        thread = threading.Thread(target=result._build, name="SignalSearchIndexBuild", daemon=True)
+        self._builder = (thread, result)
+        self._pending = []
+        thread.start()
+
+    # Store protocol
+
+    def rebuild(self, signals):
+        """Forget the indexed signals and index a new list on the next search
+
+        Args:
+            signals: The list of signal dictionaries
+        """
+        self._signals = signals
+        self._built = False
+        # A worker still building the previous list is left to finish unused
+        self._builder = None
+        self._pending = []
+        self._keys = {}
+        self._ids = []
+        self._texts = []
+        self._postings = {}
+        self._prefixes = SortedIndex()
+        self._retired = 0
+        if self._followers:
+            self._build()
+            for terms, results in self._followers:
+                results.clear()
+                results.update(self._search_terms(terms))
+        elif self._background:
+            self._start_builder()
+
+    def _build(self):
+        """Index every signal of the list"""
+        self._keys = {}
+        self._ids = []
+        self._texts = []
+        self._postings = {}
+        self._retired = 0
+        prefixes = []
+        for signal in self._signals:
+            signal_id = signal.get("id")
+            # Keep the first occurrence, as the signal index does
+            if signal_id is not None and signal_id not in self._keys:
+                prefixes.extend(self._index(signal_id, signal))
+
+        # Sort the prefix index once rather than inserting entry by entry
+        self._prefixes = SortedIndex(prefixes)
+        self._built = True
+
+    def _index(self, signal_id, signal):
+        """Give a signal a new key and add it to the postings
+
+        Returns:
+            list: The (value, signal ID) entries for the prefix index
+        """
+        key = len(self._ids)
+        values = self._values(signal)
+        separator = self.SEPARATOR
+        text = "".join(separator + value for value in values)
+        self._keys[signal_id] = key
+        self._ids.append(signal_id)
+        self._texts.append(text)
+
+        # The trigrams spanning a separator are never searched, but taking
+        # the trigrams of the whole text at once is faster than per field
+        postings = self._postings
+        for gram in self._grams(text):
+            keys = postings.get(gram)
+            if keys is None:
+                postings[gram] = array("I", (key,))
+            else:
+                keys.append(key)
+        return [(value, signal_id) for value in values]
+
+    def add(self, signal):
+        """Index a signal"""
+        if self._builder is not None:
+            self._pending.append((signal, True))
+            return
+        signal_id = signal.get("id")
+        # Before the first search the list is indexed when it is needed
+        if not self._built or signal_id is None or signal_id in self._keys:
+            return
+        for value, _ in self._index(signal_id, signal):
+            self._prefixes.add(value, signal_id)
+        for terms, results in self._followers:
+            if self._matches(signal_id, terms):
+                results.add(signal_id)
+
+    def remove(self, signal):
+        """Remove a signal from the index"""
+        if self._builder is not None:
+            self._pending.append((signal, False))
+            return
+        signal_id = signal.get("id")
+        for _, results in self._followers:
+            results.discard(signal_id)
+        key = self._keys.pop(signal_id, None)
+        if key is None:
+            return
+        self._ids[key] = None
+        self._texts[key] = ""
+        for value in self._values(signal):
+            self._prefixes.remove(value, signal_id)
+        self._retired += 1
+        if self._retired > len(self._keys):
+            self._compact()
+
+    def update(self, old_signal, new_signal):
+        """Re-index a signal after it was replaced"""
+        self.remove(old_signal)
+        self.add(new_signal)
+
+    def _compact(self):
+        """Renumber the live keys and drop the retired ones from the postings"""
+        # Renumbering keeps the key order, so the postings stay sorted
+        renumbered = {}
+        ids = []
+        texts = []
+        for key, signal_id in enumerate(self._ids):
+            if signal_id is not None:
+                renumbered[key] = len(ids)
+                ids.append(signal_id)
+                texts.append(self._texts[key])
+
+        postings = {}
+        for gram, keys in self._postings.items():
+            live = array("I", [renumbered[key] for key in keys if key in renumbered])
+            if live:
+                postings[gram] = live
+
+        self._keys = {signal_id: key for key, signal_id in enumerate(ids)}
+        self._ids = ids
+        self._texts = texts
+        self._postings = postings
+        self._retired = 0
+
+    # Searching
+
+    def search(self, text):
+        """Find the signals matching a search text
+
+        Args:
+            text: Whitespace-separated terms that must all match
+
+        Returns:
+            set: IDs of the matching signals, or None if text has no terms
+                (nothing to filter on)
+        """
+        terms = self.terms(text)
+        if not terms:
+            return None
+        self._ensure_built()
+        return self._search_terms(terms)
+
+    def follow(self, text):
+        """Search and keep the result up to date as signals change
+
+        Args:
+            text: Whitespace-separated terms that must all match
+
+        Returns:
+            set: IDs of the matching signals, updated in place by every later
+                change, or None if text has no terms. Pass it to unfollow()
+                once it is no longer needed.
+        """
+        terms = self.terms(text)
+        if not terms:
+            return None
+        results = self.search(text)
+        self._followers.append((terms, results))
+        return results
+
+    def unfollow(self, results):
+        """Stop updating a result set returned by follow()"""
+        self._followers = [(terms, followed) for terms, followed in self._followers
+                           if followed is not results]
+
+    def _needle(self, term):
+        """Get the string a signal's searchable text must contain to match a term"""
+        return self.SEPARATOR + term if len(term) < self.GRAM_SIZE else term
+
+    def _search_terms(self, terms):
+        """Get the IDs of the signals matching every term"""
+        # Look up the most selective term only, and check the others on its
+        # candidates: one substring test each is cheaper than another lookup
+        terms = sorted(terms, key=self._estimate)
+        keys = self._term_keys(terms[0])
+        texts = self._texts
+        for term in terms[1:]:
+            needle = self._needle(term)
+            keys = [key for key in keys if needle in texts[key]]
+        ids = self._ids
+        return {ids[key] for key in keys}
+
+    def _estimate(self, term):
+        """Get an upper bound of the signals the lookup of a term goes through"""
+        if len(term) < self.GRAM_SIZE:
+            start, stop = self._prefixes.prefix_bounds(term)
+            return stop - start
+        return min(len(self._postings.get(gram, ())) for gram in self._grams(term))
+
+    def _term_keys(self, term):
+        """Get the keys of the signals matching one term"""
+        if len(term) < self.GRAM_SIZE:
+            keys = self._keys
+            return {keys[signal_id] for signal_id in self._prefixes.ids(*self._prefixes.prefix_bounds(term))}
+
+        smallest = min((self._postings.get(gram, ()) for gram in self._grams(term)), key=len)
+        # Checking every key of the smallest posting for the whole term costs
+        # no more than intersecting it with another posting, and trigrams may
+        # match out of order anyway (retired keys have an empty text and drop
+        # out here too)
+        texts = self._texts
+        return [key for key in smallest if term in texts[key]]
+
+    def _matches(self, signal_id, terms):
+        """Check whether an indexed signal matches every term"""
+        key = self._keys.get(signal_id)
+        if key is None:
+            return False
+        text = self._texts[key]
+        return all(self._needle(term) in text for term in terms)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalSnapshots module - O(1) snapshots of a SignalStore's signals for diffing and history
+"""
+
+from Modules.SignalOperations.PersistentMap import PersistentMap
+
+
+class SignalSnapshots:
+    """Persistent map of signal ID -> signal kept in step with a SignalStore
+
+    Attached to a store like the other secondary indexes, it applies every
+    add, update and remove to a PersistentMap, copying O(log32 n) trie nodes
+    per signal. snapshot() hands out the current map, so a snapshot costs
+    nothing and stays valid forever, and diffing two snapshots only walks
+    the trie nodes that differ between them.
+
+    The snapshot taken when the project was loaded or last saved is kept as
+    the saved state: is_modified() and changes_since_saved() compare
+    against it, so an edit that is undone again no longer counts as a
+    change. The IDs whose signal differs from the saved one are tracked as
+    edits come in (one lookup in the saved map each), so is_modified(),
+    called on every store event, does not diff the maps.
+
+    Snapshots record which signals exist and their contents, not their
+    order in the signals list. That is enough to tell a saved order from an
+    edited one, as the store only appends and the undo history puts
+    deleted signals back at their old positions. A rebuild that replaces
+    most signals (a project load) builds a new trie sharing nothing with
+    earlier snapshots, so a diff across it visits every signal; batches
+    large enough for the store to rebuild its indexes are applied key by
+    key instead.
+    """
+
+    def __init__(self):
+        """Initialize SignalSnapshots"""
+        self.current = PersistentMap.EMPTY
+        self.saved = PersistentMap.EMPTY
+        # IDs whose current signal is not the saved one (missing on either side included)
+        self._unsaved = set()
+
+    def rebuild(self, signals):
+        """Build the map from a signals list
+
+        Args:
+            signals: The list of signal dictionaries
+        """
+        current = self.current
+        changed = [signal for signal in signals if current.get(signal.get("id")) is not signal]
+        if len(changed) * 2 > len(signals):
+            # Mostly new signals (a project load): build a new trie in one
+            # pass and compare it with the saved state once
+            self.current = PersistentMap((signal.get("id"), signal) for signal in signals)
+            added, removed, changed = self.saved.diff(self.current)
+            self._unsaved = set(added) | set(removed) | set(changed)
+            return
+
+        # A large batch: apply it to the trie, which keeps sharing its
+        # unchanged nodes with the earlier snapshots
+        for signal in changed:
+            current = current.set(signal.get("id"), signal)
+        self.current = current
+        for signal in changed:
+            self._track(signal.get("id"))
+        if len(current) != len(signals):
+            signal_ids = {signal.get("id") for signal in signals}
+            for signal_id in [signal_id for signal_id in current if signal_id not in signal_ids]:
+                self.current = self.current.delete(signal_id)
+                self._track(signal_id)
+
+    def _track(self, signal_id):
+        """Note whether a signal now differs from its saved version"""
+        if self.current.get(signal_id) is self.saved.get(signal_id):
+            self._unsaved.discard(signal_id)
+        else:
+            self._unsaved.add(signal_id)
+
+    def add(self, signal):
+        """Add a signal to the current map"""
+        self.current = self.current.set(signal.get("id"), signal)
+        self._track(signal.get("id"))
+
+    def update(self, old_signal, new_signal):
+        """Replace a signal in the current map"""
+        self.current = self.current.set(new_signal.get("id"), new_signal)
+        self._track(new_signal.get("id"))
+
+    def remove(self, signal):
+        """Remove a signal from the current map"""
+        self.current = self.current.delete(signal.get("id"))
+        self._track(signal.get("id"))
+
+    def snapshot(self):
+        """Get an immutable snapshot of the signals
+
+        Returns:
+            PersistentMap: Signal ID -> signal, as of now
+        """
+        return self.current
+
+    def mark_saved(self):
+        """Take the current signals as the saved state"""
+        self.saved = self.current
+        self._unsaved = set()
+
+    def is_modified(self):
+        """Check whether the signals differ from the saved state"""
+        return bool(self._unsaved)
+
+    def changes_since_saved(self):
+        """Get the signals added, removed and changed since the saved state
+
+        Returns:
+            tuple: (added IDs, removed IDs, changed IDs)
+        """
+        added, removed, changed = [], [], []
+        for signal_id in self._unsaved:
+            if self.saved.get(signal_id) is None:
+                added.append(signal_id)
+            elif self.current.get(signal_id) is None:
+                removed.append(signal_id)
+            else:
+                changed.append(signal_id)
+        return added, removed, changed
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalStore module - the single authoritative signals list with its indexes and change events
+"""
+
+from Modules.SignalOperations.SignalIndex import SignalIndex
+from Modules.SignalOperations.SignalIdAllocator import SignalIdAllocator
+from Modules.SignalOperations.StringPool import StringPool
+
+
+class SignalStore:
+    """Owner of the project's signals list
+
+    SignalManager and DatabaseOperations both delegate to a store, so there is
+    one list, one ID index, one ID allocator and one string pool no matter
+    which facade edits the signals. The list itself is the project's
+    "signals" list and is never copied. Every signal entering the store has
+    its categorical values interned in the project's string pool.
+
+    The store never changes a signal in place: an edit replaces it with a
+    new object (replace/replace_many). A signal object therefore never
+    changes once it is in the list, and a copy of the list (or any other
+    collection of signal references) is a consistent snapshot without
+    copying the signals themselves. The undo history, the autosave, the
+    snapshots and the search index's background build all rely on this.
+
+    Two kinds of consumers follow the store:
+
+    - Attached indexes (facet, query, column stores, ...) are kept up to date
+      before anyone is notified. They implement rebuild(signals), add(signal),
+      update(old_signal, new_signal) and remove(signal).
+    - Listeners are called after every change with (event, signal_ids), where
+      event is "added", "updated", "removed" or "reset". A "reset" means the
+      whole list was replaced or changed behind the store; its signal_ids is
+      empty and listeners should reread store.signals. Removals are also
+      announced beforehand with a "removing" event, while the signals are
+      still in the list (views use it to find the rows that will go).
+      Added signals are usually appended, but insert_many puts them back
+      at earlier positions, so listeners look their rows up in the index.
+    """
+
+    # Batches larger than 1/REBUILD_RATIO of the list rebuild the attached indexes
+    REBUILD_RATIO = 8
+
+    def __init__(self, signals=None, case_sensitive_names=True):
+        """Initialize the SignalStore
+
+        Args:
+            signals: Optional list of signal dictionaries to adopt
+            case_sensitive_names: Whether signal names differing only in case are distinct
+        """
+        self.index = SignalIndex(case_sensitive_names=case_sensitive_names)
+        self.id_allocator = SignalIdAllocator()
+        self.string_pool = StringPool()
+        self.indexes = []
+        self.listeners = []
+        self.load(signals if signals is not None else [])
+
+    @property
+    def signals(self):
+        """The signals list owned by the store"""
+        return self.index.signals
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, signal_id):
+        return signal_id in self.index
+
+    def get(self, signal_id):
+        """Get a signal by its ID
+
+        Args:
+            signal_id: The ID of the signal
+
+        Returns:
+            dict: The signal data, or None if not found
+        """
+        return self.index.get(signal_id)
+
+    # Consumers
+
+    def attach(self, index):
+        """Keep a secondary index in step with the store
+
+        Args:
+            index: Object with rebuild(signals), add(signal),
+                update(old_signal, new_signal) and remove(signal)
+        """
+        if index not in self.indexes:
+            index.rebuild(self.signals)
+            self.indexes.append(index)
+
+    def detach(self, index):
+        """Stop updating an index added with attach"""
+        if index in self.indexes:
+            self.indexes.remove(index)
+
+    def subscribe(self, callback):
+        """Register a callback for signal changes
+
+        Args:
+            callback: Callable taking (event, signal_ids)
+        """
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        """Unregister a callback added with subscribe"""
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def publish(self, event, signal_ids):
+        """Send a change event to every listener
+
+        Args:
+            event: "added", "updated", "removing", "removed" or "reset"
+            signal_ids: List of the IDs affected by the change
+        """
+        for callback in list(self.listeners):
+            callback(event, signal_ids)
+
+    # Whole-list operations
+
+    def load(self, signals, string_pool=None):
+        """Adopt a new signals list
+
+        Args:
+            signals: The list of signal dictionaries (used as is, not copied)
+            string_pool: Optional StringPool the signals were already interned
+                in (e.g. by the project loader); a new pool is filled otherwise
+        """
+        if string_pool is None:
+            string_pool = StringPool()
+            string_pool.intern_signals(signals)
+        self.string_pool = string_pool
+        self.index.rebuild(signals)
+        self.id_allocator.reset(self.index.ids())
+        self._rebuild_indexes()
+        self.publish("reset", [])
+
+    def sync(self, signals=None):
+        """Make the store describe a signals list again
+
+        Adopts signals if it is a different list, and rebuilds everything if
+        the current list was resized behind the store's back.
+
+        Args:
+            signals: Optional list the caller expects the store to hold
+
+        Returns:
+            bool: True if the store had to be rebuilt
+        """
+        if signals is not None and signals is not self.signals:
+            self.load(signals)
+            return True
+        if self.index.is_synced(self.signals):
+            return False
+
+        self.index.rebuild(self.signals)
+        self.id_allocator.register(self.index.ids())
+        self.string_pool.intern_signals(self.signals)
+        self._rebuild_indexes()
+        self.publish("reset", [])
+        return True
+
+    def set_case_sensitive_names(self, case_sensitive):
+        """Choose whether signal names that differ only in case count as duplicates
+
+        Args:
+            case_sensitive: True to compare names exactly, False to ignore case
+        """
+        self.index.names.case_sensitive = case_sensitive
+        self.index.rebuild(self.signals)
+
+    def _rebuild_indexes(self):
+        """Rebuild every attached index from the signals list"""
+        for index in self.indexes:
+            index.rebuild(self.signals)
+
+    def _is_large_batch(self, count):
+        """Check whether a batch is cheaper to apply by rebuilding the attached indexes"""
+        return count > max(self.index.MIN_COMPACT_SIZE, len(self.signals) // self.REBUILD_RATIO)
+
+    # Signal operations
+
+    def generate_id(self):
+        """Generate a new unique signal ID"""
+        return self.id_allocator.generate()
+
+    def reserve_ids(self, count):
+        """Reserve a block of unique signal IDs
+
+        Args:
+            count: Number of IDs to reserve
+
+        Returns:
+            list: The reserved IDs
+        """
+        return self.id_allocator.reserve(count)
+
+    def add(self, signal):
+        """Add a signal, giving it a new ID if it has none
+
+        Args:
+            signal: The signal data dictionary
+
+        Returns:
+            str: The signal's ID, or None if a signal with its ID already exists
+        """
+        if signal.get("id"):
+            if signal["id"] in self.index:
+                return None
+            self.id_allocator.register([signal["id"]])
+        else:
+            signal["id"] = self.id_allocator.generate()
+
+        self.string_pool.intern_signal(signal)
+        self.index.append(signal)
+        for index in self.indexes:
+            index.add(signal)
+        self.publish("added", [signal["id"]])
+        return signal["id"]
+
+    def add_many(self, signals):
+        """Add a batch of signals with a single change event
+
+        Signals without an ID get one from a single reserved block.
+
+        Args:
+            signals: List of signal data dictionaries
+
+        Returns:
+            list: The IDs of the added signals
+
+        Raises:
+            ValueError: If a supplied ID is already used or repeated in the batch
+        """
+        supplied = [signal["id"] for signal in signals if signal.get("id")]
+        if len(set(supplied)) != len(supplied) or any(signal_id in self.index for signal_id in supplied):
+            raise ValueError("Signal IDs must be new and unique")
+
+        missing = [signal for signal in signals if not signal.get("id")]
+        for signal, signal_id in zip(missing, self.id_allocator.reserve(len(missing))):
+            signal["id"] = signal_id
+        self.id_allocator.register(supplied)
+
+        self.string_pool.intern_signals(signals)
+        self.index.extend(signals)
+        return self._added(signals)
+
+    def insert_many(self, entries):
+        """Insert a batch of signals at given list positions with a single change event
+
+        Puts removed signals back where they were (undo of a delete).
+        Listeners get an "added" event like for appended signals and find
+        the rows through the ID index.
+
+        Args:
+            entries: List of (position, signal) pairs in ascending position
+                order, each position taken in the list as it is once the
+                earlier entries are in; every signal must carry its ID
+
+        Returns:
+            list: The IDs of the inserted signals
+
+        Raises:
+            ValueError: If an ID is missing, already used or repeated in the batch
+        """
+        signals = [signal for position, signal in entries]
+        signal_ids = [signal.get("id") for signal in signals]
+        if (not all(signal_ids) or len(set(signal_ids)) != len(signal_ids) or
+                any(signal_id in self.index for signal_id in signal_ids)):
+            raise ValueError("Signal IDs must be new and unique")
+
+        self.id_allocator.register(signal_ids)
+        self.string_pool.intern_signals(signals)
+        self.index.insert_many(entries)
+        return self._added(signals)
+
+    def _added(self, signals):
+        """Bring the attached indexes up to date with signals just listed and announce them
+
+        Returns:
+            list: The IDs of the signals
+        """
+        if self._is_large_batch(len(signals)):
+            self._rebuild_indexes()
+        else:
+            for index in self.indexes:
+                for signal in signals:
+                    index.add(signal)
+
+        signal_ids = [signal["id"] for signal in signals]
+        if signal_ids:
+            self.publish("added", signal_ids)
+        return signal_ids
+
+    def replace(self, signal_id, signal):
+        """Replace a signal, keeping its ID and position
+
+        Args:
+            signal_id: The ID of the signal to replace
+            signal: The new signal data dictionary
+
+        Returns:
+            dict: The previous signal data, or None if the ID is unknown
+        """
+        previous = self.index.get(signal_id)
+        if previous is None:
+            return None
+
+        signal["id"] = signal_id
+        self.string_pool.intern_signal(signal)
+        self.index.replace(signal_id, signal)
+        for index in self.indexes:
+            index.update(previous, signal)
+        self.publish("updated", [signal_id])
+        return previous
+
+    def replace_many(self, updates):
+        """Replace a batch of signals with a single change event
+
+        Args:
+            updates: Dictionary of signal ID -> new signal data; unknown IDs are skipped
+
+        Returns:
+            list: The IDs of the replaced signals
+        """
+        signal_ids = []
+        for signal_id, signal in updates.items():
+            previous = self.index.get(signal_id)
+            if previous is None:
+                continue
+            signal["id"] = signal_id
+            self.string_pool.intern_signal(signal)
+            self.index.replace(signal_id, signal)
+            for index in self.indexes:
+                index.update(previous, signal)
+            signal_ids.append(signal_id)
+
+        if signal_ids:
+            self.publish("updated", signal_ids)
+        return signal_ids
+
+    def remove(self, signal_id):
+        """Remove a signal
+
+        Args:
+            signal_id: The ID of the signal to remove
+
+        Returns:
+            dict: The removed signal, or None if the ID is unknown
+        """
+        if signal_id not in self.index:
+            return None
+
+        self.publish("removing", [signal_id])
+        signal = self.index.remove(signal_id)
+        for index in self.indexes:
+            index.remove(signal)
+        self.publish("removed", [signal_id])
+        return signal
+
+    def remove_many(self, signal_ids):
+        """Remove a batch of signals with a single change event
+
+        Args:
+            signal_ids: Iterable of IDs of the signals to remove
+
+        Returns:
+            list: The removed signals
+        """
+        signal_ids = [signal_id for signal_id in dict.fromkeys(signal_ids) if signal_id in self.index]
+        if not signal_ids:
+            return []
+
+        self.publish("removing", signal_ids)
+        removed = self.index.remove_many(signal_ids)
+
+        if self._is_large_batch(len(removed)):
+            self._rebuild_indexes()
+        else:
+            for index in self.indexes:
+                for signal in removed:
+                    index.remove(signal)
+
+        self.publish("removed", [signal.get("id") for signal in removed])
+        return removed
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SignalTreeModel module - item model showing the signals of a SignalStore in a QTreeView
+"""
+
+from PyQt5.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+
+class SignalTreeModel(QAbstractItemModel):
+    """Model reading its rows straight from a SignalStore
+
+    No item objects are created: every call to data() reads the signal at the
+    requested row of the store's list. Rows are exposed to the view in
+    batches of FETCH_SIZE through canFetchMore/fetchMore, so opening a large
+    project only costs the rows the user actually scrolls to.
+
+    Each signal row has one child row per entry of PROPERTY_ROWS (variable
+    port, data type, memory region). They are not stored either: data()
+    derives them from the parent signal, so they cost nothing until the
+    user expands a signal. A child index carries a small integer key of its
+    signal's ID, handed out on first use, so it stays valid while rows above
+    it are inserted or removed.
+
+    Store events become row insert, change and remove notifications, each
+    row found through the store's ID index in O(log n), so edits keep the
+    view's scroll position, selection and expansion state.
+    """
+
+    COLUMNS = ("Signal ID", "Signal Name")
+    COLUMN_KEYS = ("id", "name")
+
+    # Role returning the signal ID of a row, whatever the column
+    SIGNAL_ID_ROLE = Qt.UserRole
+
+    # Rows handed to the view per fetchMore call
+    FETCH_SIZE = 500
+
+    # Batches touching more separate runs of rows than this are sent as one
+    # notification (a model reset for removals)
+    BATCH_THRESHOLD = 256
+
+    # Child rows shown under each signal: (label, signal key)
+    PROPERTY_ROWS = (("Variable Port", "variable_port_name"),
+                     ("Data Type", "data_type"),
+                     ("Memory Region", "memory_region"))
+
+    ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    # Property rows have no children; telling the view so spares it a
+    # rowCount call per row whenever it lays the rows out again
+    PROPERTY_FLAGS = ITEM_FLAGS | Qt.ItemNeverHasChildren
+
+    def __init__(self, store, parent=None):
+        """Initialize the SignalTreeModel
+
+        Args:
+            store: The SignalStore to show
+            parent: Optional parent QObject
+        """
+        super(SignalTreeModel, self).__init__(parent)
+        self.store = store
+        self._fetched = 0
+        self._fetching = False
+        # Runs of store rows already removed from the view while the store
+        # still holds them (only set while a removal is being announced)
+        self._hidden_runs = []
+        self._reset_pending = False
+        # Keys of the signals whose property rows were asked for, and back
+        self._child_keys = {}
+        self._key_ids = {}
+        # Key 0 is left for the signal rows themselves
+        self._next_key = 1
+        self.store.subscribe(self._on_signals_changed)
+
+    def signal_at(self, index):
+        """Get the signal shown at a model index
+
+        Args:
+            index: A QModelIndex of this model, for a signal row or one of its
+                property rows
+
+        Returns:
+            dict: The signal data, or None for an invalid index
+        """
+        if not index.isValid():
+            return None
+        if index.internalId():
+            signal_id = self._key_ids.get(index.internalId())
+            return None if self._row_of(signal_id) is None else self.store.get(signal_id)
+        return self._signal_at_row(index.row())
+
+    def signal_id_at(self, row):
+        """Get the ID of the signal shown at a top-level row
+
+        Args:
+            row: The row number
+
+        Returns:
+            str: The signal ID, or None if the row is not shown
+        """
+        signal = self._signal_at_row(row)
+        return None if signal is None else signal.get("id")
+
+    def _signal_at_row(self, row):
+        """Get the signal shown at a top-level row, or None"""
+        if not 0 <= row < min(self._fetched, len(self.store.signals)):
+            return None
+        for first, last in self._hidden_runs:
+            if row < first:
+                break
+            row += last - first + 1
+        return self.store.signals[row]
+
+    def index_of(self, signal_id):
+        """Get the index of a signal's row, fetching rows up to it if needed
+
+        Args:
+            signal_id: The ID of the signal
+
+        Returns:
+            QModelIndex: The index of the signal's first column, or an invalid
+                index if the signal is unknown
+        """
+        row = self.store.index.position(signal_id)
+        if row is None:
+            return QModelIndex()
+        while self._fetched <= row and self.canFetchMore():
+            self.fetchMore()
+        return self.index(row, 0)
+
+    def _row_of(self, signal_id):
+        """Get the row the view shows a signal at, or None if it is not shown"""
+        row = self.store.index.position(signal_id) if signal_id is not None else None
+        if row is None:
+            return None
+        shown = row
+        for first, last in self._hidden_runs:
+            if row < first:
+                break
+            if row <= last:
+                return None
+            shown -= last - first + 1
+        return shown if shown < self._fetched else None
+
+    def _child_key(self, signal_id):
+        """Get the key identifying a signal in its property rows' indexes"""
+        key = self._child_keys.get(signal_id)
+        if key is None:
+            key = self._next_key
+            self._next_key += 1
+            self._child_keys[signal_id] = key
+            self._key_ids[key] = signal_id
+        return key
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not 0 <= column < len(self.COLUMNS):
+            return QModelIndex()
+        if not parent.isValid():
+            if not 0 <= row < self._fetched:
+                return QModelIndex()
+            return self.createIndex(row, column, 0)
+        if parent.internalId() or parent.column() != 0 or not 0 <= row < len(self.PROPERTY_ROWS):
+            return QModelIndex()
+        signal = self.signal_at(parent)
+        if signal is None:
+            return QModelIndex()
+        return self.createIndex(row, column, self._child_key(signal.get("id")))
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid() or not index.internalId():
+            return QModelIndex()
+        row = self._row_of(self._key_ids.get(index.internalId()))
+        if row is None:
+            return QModelIndex()
+        return self.createIndex(row, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return self._fetched
+        if parent.internalId() or parent.column() != 0:
+            return 0
+        return len(self.PROPERTY_ROWS)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        signal = self.signal_at(index)
+        if signal is None:
+            return None
+        if role == Qt.DisplayRole:
+            if index.internalId():
+                label, key = self.PROPERTY_ROWS[index.row()]
+                if index.column() == 0:
+                    return label
+                value = signal.get(key)
+            else:
+                value = signal.get(self.COLUMN_KEYS[index.column()])
+            return "" if value is None else str(value)
+        if role == self.SIGNAL_ID_ROLE:
+            return signal.get("id")
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.COLUMNS):
+            return self.COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return self.PROPERTY_FLAGS if index.internalId() else self.ITEM_FLAGS
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._fetching and self._fetched < len(self.store.signals)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._fetching:
+            return
+        count = min(self.FETCH_SIZE, len(self.store.signals) - self._fetched)
+        if count <= 0:
+            return
+        # Views may ask for more rows while reacting to the insertion itself
+        self._fetching = True
+        try:
+            self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+            self._fetched += count
+            self.endInsertRows()
+        finally:
+            self._fetching = False
+
+    def _on_signals_changed(self, event, signal_ids):
+        """Turn a store change event into row notifications"""
+        if event == "added":
+            self._rows_added(signal_ids)
+        elif event == "updated":
+            self._rows_changed(signal_ids)
+        elif event == "removing":
+            self._rows_removing(self._fetched_rows(signal_ids))
+        elif event == "removed":
+            self._hidden_runs = []
+            for signal_id in signal_ids:
+                key = self._child_keys.pop(signal_id, None)
+                if key is not None:
+                    del self._key_ids[key]
+            self._fetched = min(self._fetched, len(self.store.signals))
+            if self._reset_pending:
+                self._reset_pending = False
+                self.endResetModel()
+        elif event == "reset":
+            self.beginResetModel()
+            self._fetched = 0
+            self._child_keys = {}
+            self._key_ids = {}
+            self.endResetModel()
+
+    def _fetched_rows(self, signal_ids):
+        """Get the sorted rows of the given signals that the view already has"""
+        position = self.store.index.position
+        rows = []
+        for signal_id in signal_ids:
+            row = position(signal_id)
+            if row is not None and row < self._fetched:
+                rows.append(row)
+        rows.sort()
+        return rows
+
+    def _rows_added(self, signal_ids):
+        """Show added signals whose rows fall within the rows the view already has
+
+        Added signals are usually appended, but undo puts deleted ones back
+        at their old positions, so each run of new rows is announced where
+        the index places it.
+        """
+        position = self.store.index.position
+        rows = sorted(row for row in map(position, signal_ids) if row is not None)
+        if not rows or rows[0] > self._fetched:
+            # Not reached yet, fetchMore will pick them up
+            return
+
+        runs = self._row_runs(rows)
+        self._fetching = True
+        try:
+            if len(runs) > self.BATCH_THRESHOLD:
+                self.beginResetModel()
+                self._fetched = min(self._fetched + len(rows), len(self.store.signals))
+                self.endResetModel()
+                return
+            # Top-down: the rows above each run are then exactly the store's
+            for first, last in runs:
+                if first > self._fetched:
+                    break
+                self.beginInsertRows(QModelIndex(), first, last)
+                self._fetched += last - first + 1
+                self.endInsertRows()
+        finally:
+            self._fetching = False
+
+    def _rows_changed(self, signal_ids):
+        """Repaint the rows of updated signals"""
+        rows = self._fetched_rows(signal_ids)
+        if not rows:
+            return
+        last_column = len(self.COLUMNS) - 1
+        runs = self._row_runs(rows)
+        if len(runs) > self.BATCH_THRESHOLD and 2 * len(rows) >= rows[-1] - rows[0] + 1:
+            # One notification spanning a dense batch instead of one per run;
+            # a sparse batch (e.g. a scattered multi-selection) keeps one per
+            # run, as the filter proxy re-checks every row a notification spans
+            self.dataChanged.emit(self.index(rows[0], 0), self.index(rows[-1], last_column))
+        else:
+            for first, last in runs:
+                self.dataChanged.emit(self.index(first, 0), self.index(last, last_column))
+
+        # Property rows only need repainting if they were ever shown
+        last_property = len(self.PROPERTY_ROWS) - 1
+        for signal_id in signal_ids:
+            key = self._child_keys.get(signal_id)
+            if key is not None and self._row_of(signal_id) is not None:
+                self.dataChanged.emit(self.createIndex(0, 0, key), self.createIndex(last_property, last_column, key))
+
+    @staticmethod
+    def _row_runs(rows):
+        """Group sorted rows into contiguous [first, last] runs"""
+        runs = []
+        for row in rows:
+            if runs and runs[-1][1] == row - 1:
+                runs[-1][1] = row
+            else:
+                runs.append([row, row])
+        return runs
+
+    def _rows_removing(self, rows):
+        """Drop the rows of signals about to be removed, keeping the rest of the view state
+
+        Runs while the store still holds the signals, so the view can read
+        every row it is told about.
+        """
+        if not rows:
+            return
+
+        runs = self._row_runs(rows)
+        if len(runs) > self.BATCH_THRESHOLD:
+            # Finished by the "removed" event, once the store has shrunk
+            self.beginResetModel()
+            self._reset_pending = True
+            self._fetched -= len(rows)
+            return
+
+        # Remove bottom-up so the earlier row numbers stay valid; the rows
+        # still present in the store are skipped by signal_at, and fetchMore
+        # must not hand out rows until the store has caught up
+        self._fetching = True
+        try:
+            for first, last in reversed(runs):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                self._fetched -= last - first + 1
+                self._hidden_runs.insert(0, (first, last))
+                self.endRemoveRows()
+        finally:
+            self._fetching = False
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+StringPool module - project-scoped interning of categorical signal attribute values
+"""
+
+import sys
+from collections.abc import MutableMapping
+
+
+class StringPool:
+    """Pool of canonical strings for the categorical signal attributes
+
+    Values such as data types, ASIL levels or memory regions repeat across
+    most signals, but json.load creates a new string for every occurrence.
+    Interning a signal replaces each categorical value with the pool's
+    canonical copy, so equal values share one object: the duplicates are
+    freed, and comparisons and dict lookups on them (facet grouping, query
+    postings) succeed on the identity check without comparing characters.
+
+    The pool is scoped to one project so that values of a closed project do
+    not stay alive, unlike sys.intern.
+    """
+
+    CATEGORY_FIELDS = ("data_type", "asil", "memory_region", "impl_approach", "checksum",
+                       "source_core", "init_value_type", "board", "soc", "build_image",
+                       "array_element_type")
+    LIST_FIELDS = ("destination_cores",)
+
+    def __init__(self):
+        """Initialize an empty StringPool"""
+        self._strings = {}
+        self.references = 0
+        self.saved_bytes = 0
+
+    def __len__(self):
+        return len(self._strings)
+
+    def intern(self, value):
+        """Get the canonical copy of a string
+
+        Args:
+            value: The value to intern; anything but a str is returned as is
+
+        Returns:
+            The pooled string equal to value
+        """
+        if type(value) is not str:
+            return value
+        canonical = self._strings.get(value)
+        if canonical is value:
+            # Already the pooled copy, counted when it was first interned
+            return value
+        if canonical is None:
+            self._strings[value] = canonical = value
+        else:
+            self.saved_bytes += sys.getsizeof(value)
+        self.references += 1
+        return canonical
+
+    def _needs_interning(self, value):
+        """Check whether a value is a string other than its pooled copy"""
+        return type(value) is str and self._strings.get(value) is not value
+
+    def intern_signal(self, signal):
+        """Replace the categorical values of a signal with their pooled copies
+
+        Only values that are not pooled yet are written, so interning a
+        signal that already went through the pool (one put back by undo,
+        or held by the history and the autosave) leaves it untouched: the
+        store never changes a signal in place once it is shared (see
+        SignalStore).
+
+        Args:
+            signal: The signal data dictionary, updated in place where needed
+
+        Returns:
+            dict: The same signal
+        """
+        intern = self.intern
+        needs_interning = self._needs_interning
+        for field in self.CATEGORY_FIELDS:
+            value = signal.get(field)
+            if needs_interning(value):
+                signal[field] = intern(value)
+        for field in self.LIST_FIELDS:
+            values = signal.get(field)
+            if isinstance(values, list) and any(needs_interning(value) for value in values):
+                signal[field] = [intern(value) for value in values]
+        struct_fields = signal.get("struct_fields")
+        if isinstance(struct_fields, list):
+            for struct_field in struct_fields:
+                if not isinstance(struct_field, MutableMapping):
+                    continue
+                value = struct_field.get("data_type")
+                if needs_interning(value):
+                    struct_field["data_type"] = intern(value)
+        return signal
+
+    def intern_signals(self, signals):
+        """Intern every signal of a list in place
+
+        Args:
+            signals: Iterable of signal data dictionaries
+        """
+        for signal in signals:
+            self.intern_signal(signal)
+
+    def stats(self):
+        """Report the effect of the pool
+
+        Returns:
+            dict: "unique" distinct strings, "references" values interned
+                (each counted once, however often its signal is interned) and
+                "saved_bytes" held by the duplicates the pool replaced
+        """
+        return {"unique": len(self._strings), "references": self.references,
+                "saved_bytes": self.saved_bytes}
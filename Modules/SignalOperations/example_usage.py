@@ -12,7 +12,7 @@ import os
 import json
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QPushButton, QLabel, QStackedWidget, QFrame, 
-                           QSplitter, QLineEdit, QComboBox, QFormLayout)
+                           QSplitter, QLineEdit, QComboBox, QFormLayout, QTreeView)
 from PyQt5.QtCore import Qt, QSize, QDateTime, QSettings
 
 # Add import for SignalManager
@@ -77,10 +77,10 @@ class SignalManagerApp(QMainWindow):
     
     def update_signal_tree(self):
         """Update the signal tree using SignalManager"""
-        # Assuming the tree widget is named signal_tree_widget
-        tree_widget = self.findChild(QTreeWidget, "signal_tree_widget")
-        if tree_widget:
-            self.signal_manager.update_signal_tree(tree_widget)
+        # Assuming the tree view is named signal_tree_view
+        tree_view = self.findChild(QTreeView, "signal_tree_view")
+        if tree_view:
+            self.signal_manager.update_signal_tree(tree_view)
     
     def populate_signal_details(self, signal_data):
         """Populate signal details using SignalManager"""
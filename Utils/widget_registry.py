@@ -0,0 +1,143 @@
+import time
+
+
+class WidgetRegistry:
+    """
+    Widgets of a loaded UI, looked up by object name once instead of on every use
+
+    QObject.findChild walks the whole widget tree below the root on every
+    call. The registry resolves a fixed set of (type, object name) entries
+    after the UI is loaded, and handlers fetch them from a dict instead.
+    Groups cache the result of findChildren on a container for a list of
+    widget types.
+
+    The registry also times every findChild/findChildren call it replaces
+    while resolving, and counts the lookups of each handler, so stats()
+    reports the time each handler saves compared to looking its widgets up.
+    """
+
+    # Resolving takes the best of this many lookups as the cost of one
+    TIMING_REPEAT = 3
+
+    def __init__(self, root, widgets, groups=None):
+        """
+        Initialize the WidgetRegistry
+
+        Args:
+            root: The widget whose descendants are registered
+            widgets: Dict of object name -> widget type
+            groups: Optional dict of group name -> (object name of a registered
+                container widget, list of widget types)
+        """
+        self.root = root
+        self.widget_types = dict(widgets)
+        self.group_specs = dict(groups or {})
+        self._widgets = {}
+        self._costs = {}
+        self._stats = {}
+
+    def resolve(self):
+        """Look every registered widget and group up, timing each lookup"""
+        self._widgets = {}
+        self._costs = {}
+        self._stats = {}
+        for name, widget_type in self.widget_types.items():
+            self._widgets[name], self._costs[name] = self._timed(
+                lambda: self.root.findChild(widget_type, name))
+
+        for name, (container_name, widget_types) in self.group_specs.items():
+            container = self._widgets.get(container_name)
+
+            def find_group():
+                if container is None:
+                    return []
+                found = []
+                for widget_type in widget_types:
+                    found.extend(container.findChildren(widget_type))
+                return found
+
+            self._widgets[name], self._costs[name] = self._timed(find_group)
+
+    def _timed(self, lookup):
+        """Run a lookup and return (its result, its best time in seconds)"""
+        best = None
+        for _ in range(self.TIMING_REPEAT):
+            start = time.perf_counter()
+            result = lookup()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return result, best
+
+    def get(self, name):
+        """
+        Get a registered widget or group
+
+        Args:
+            name: The object name of a widget, or a group name
+
+        Returns:
+            The widget (None if the UI has none of that name and type), or
+            the list of widgets of a group
+        """
+        return self._widgets[name]
+
+    def fetch(self, handler, *names):
+        """
+        Get the registered widgets a handler uses and record the lookups
+
+        Args:
+            handler: Name the lookups are reported under, usually the
+                calling method's name
+            names: Object names of widgets or group names
+
+        Returns:
+            tuple: The widgets, in the order of names
+        """
+        start = time.perf_counter()
+        widgets = tuple(self._widgets[name] for name in names)
+        elapsed = time.perf_counter() - start
+
+        stats = self._stats.get(handler)
+        if stats is None:
+            stats = self._stats[handler] = {"calls": 0, "lookups": 0, "lookup_time": 0.0, "registry_time": 0.0}
+        stats["calls"] += 1
+        stats["lookups"] += len(names)
+        stats["lookup_time"] += sum(self._costs[name] for name in names)
+        stats["registry_time"] += elapsed
+        return widgets
+
+    def stats(self):
+        """
+        Get the time saved by each handler
+
+        Returns:
+            dict: Handler name -> dict with the number of calls and widget
+                lookups, the time the lookups would have taken with findChild
+                ("lookup_ms"), the time taken from the registry
+                ("registry_ms") and their difference ("saved_ms")
+        """
+        report = {}
+        for handler, stats in self._stats.items():
+            lookup_ms = stats["lookup_time"] * 1000
+            registry_ms = stats["registry_time"] * 1000
+            report[handler] = {
+                "calls": stats["calls"],
+                "lookups": stats["lookups"],
+                "lookup_ms": lookup_ms,
+                "registry_ms": registry_ms,
+                "saved_ms": lookup_ms - registry_ms,
+            }
+        return report
+
+    def format_stats(self):
+        """
+        Get the per-handler statistics as a printable table
+
+        Returns:
+            str: One line per handler, the handlers saving most first
+        """
+        lines = [f"{'handler':<36}{'calls':>7}{'lookups':>9}{'findChild ms':>14}{'registry ms':>13}{'saved ms':>10}"]
+        for handler, stats in sorted(self.stats().items(), key=lambda item: -item[1]["saved_ms"]):
+            lines.append(f"{handler:<36}{stats['calls']:>7}{stats['lookups']:>9}{stats['lookup_ms']:>14.3f}"
+                         f"{stats['registry_ms']:>13.3f}{stats['saved_ms']:>10.3f}")
+        return "\n".join(lines)
@@ -0,0 +1,92 @@
+"""Tests for the background autosave of the project (Modules/FileOperation/AutoSaver.py)"""
+
+import json
+import os
+import threading
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt5.QtCore")
+
+from Modules.FileOperation.AutoSaver import AutoSaver
+
+
+class BlockingWriter:
+    """Writes project files once released, as a slow write of a large project would"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def write_config_file(self, file_path, project_data):
+        self.started.set()
+        assert self.release.wait(5)
+        with open(file_path, "w") as f:
+            json.dump(project_data, f)
+
+
+@pytest.fixture
+def app():
+    QtCore.QStandardPaths.setTestModeEnabled(True)
+    application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    yield application
+    QtCore.QStandardPaths.setTestModeEnabled(False)
+
+
+def wait_until(app, condition):
+    """Process events until a condition holds, as the GUI event loop would"""
+    for step in range(500):
+        app.processEvents()
+        if condition():
+            return True
+        threading.Event().wait(0.01)
+    return False
+
+
+def test_discard_does_not_wait_for_a_running_write(app, tmp_path):
+    writer = BlockingWriter()
+    project_path = str(tmp_path / "project.smgr")
+    auto_saver = AutoSaver(writer, lambda: ({"signals": [{"id": "00000001"}]}, project_path))
+    saved = []
+    auto_saver.saved.connect(lambda path, error: saved.append(path))
+
+    auto_saver.save_now()
+    assert writer.started.wait(5)
+    # Returns while the write is still blocked
+    auto_saver.discard(project_path)
+    worker = auto_saver._worker
+    assert worker.is_alive()
+
+    writer.release.set()
+    worker.join(5)
+    assert wait_until(app, lambda: not worker.is_alive())
+    app.processEvents()
+    # The cancelled write deleted its file and reported nothing
+    assert not os.path.exists(AutoSaver.recovery_path(project_path))
+    assert saved == []
+
+
+def test_find_recovery_needs_a_newer_copy(app, tmp_path):
+    writer = BlockingWriter()
+    writer.release.set()
+    project_path = str(tmp_path / "project.smgr")
+    with open(project_path, "w") as f:
+        json.dump({"signals": []}, f)
+    auto_saver = AutoSaver(writer, lambda: ({"signals": [{"id": "00000001"}]}, project_path))
+    assert auto_saver.find_recovery(project_path) is None
+
+    saved = []
+    auto_saver.saved.connect(lambda path, error: saved.append((path, error)))
+    auto_saver.save_now()
+    assert wait_until(app, lambda: saved)
+    recovery_path = AutoSaver.recovery_path(project_path)
+    assert saved == [(recovery_path, "")]
+    os.utime(project_path, (0, 0))
+    assert auto_saver.find_recovery(project_path) == recovery_path
+
+    # Saving the project makes the copy stale
+    os.utime(project_path)
+    os.utime(recovery_path, (0, 0))
+    assert auto_saver.find_recovery(project_path) is None
+    auto_saver.discard(project_path)
+    assert not os.path.exists(recovery_path)
@@ -0,0 +1,141 @@
+"""Tests for the crash-safe edit journal (Modules/FileOperation/EditJournal.py)"""
+
+import json
+import os
+
+import pytest
+
+from Modules.FileOperation.EditJournal import EditJournal
+from Modules.SignalOperations.SignalStore import SignalStore
+
+
+def make_signals(count):
+    return [{"id": f"{number:08x}", "name": f"Signal_{number}"} for number in range(count)]
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    """A project file holding ten signals"""
+    path = str(tmp_path / "project.smgr")
+    with open(path, "w") as f:
+        json.dump({"signals": make_signals(10)}, f)
+    return path
+
+
+def load_signals(path):
+    with open(path) as f:
+        return json.load(f)["signals"]
+
+
+def record_edits(project_path):
+    """Journal a few edits of the project's signals
+
+    Returns:
+        list: The signals list after each edit
+    """
+    store = SignalStore(load_signals(project_path))
+    journal = EditJournal(project_path)
+    journal.start(store)
+    states = []
+    store.add({"id": "0000000a", "name": "Added"})
+    states.append([dict(signal) for signal in store.signals])
+    store.replace("00000002", {"name": "Renamed"})
+    states.append([dict(signal) for signal in store.signals])
+    store.remove_many(["00000003", "00000005"])
+    states.append([dict(signal) for signal in store.signals])
+    store.add_many([{"id": "0000000b", "name": "B"}, {"id": "0000000c", "name": "C"}])
+    states.append([dict(signal) for signal in store.signals])
+    journal.close()
+    return states
+
+
+def test_replay_restores_every_edit(project_path):
+    states = record_edits(project_path)
+    signals = load_signals(project_path)
+    assert EditJournal(project_path).replay(signals) == 4
+    assert signals == states[-1]
+
+
+@pytest.mark.parametrize("cut", [1, 5, 8, 20])
+def test_replay_stops_at_a_torn_tail(project_path, cut):
+    states = record_edits(project_path)
+    journal_path = project_path + EditJournal.SUFFIX
+    with open(journal_path, "rb") as f:
+        data = f.read()
+    # Cut into the last record, as a crash during its write would
+    with open(journal_path, "wb") as f:
+        f.write(data[:-cut])
+
+    signals = load_signals(project_path)
+    journal = EditJournal(project_path)
+    assert journal.replay(signals) == 3
+    assert signals == states[-2]
+
+    # Recording resumes after the last valid record
+    store = SignalStore(signals)
+    journal.start(store)
+    store.remove("00000000")
+    journal.close()
+    replayed = load_signals(project_path)
+    assert EditJournal(project_path).replay(replayed) == 4
+    assert replayed == store.signals
+
+
+def test_replay_stops_at_a_corrupt_record(project_path):
+    states = record_edits(project_path)
+    journal_path = project_path + EditJournal.SUFFIX
+    with open(journal_path, "rb") as f:
+        data = bytearray(f.read())
+    # Flip a byte in the payload of the last record
+    data[-2] ^= 0xFF
+    with open(journal_path, "wb") as f:
+        f.write(bytes(data))
+
+    signals = load_signals(project_path)
+    assert EditJournal(project_path).replay(signals) == 3
+    assert signals == states[-2]
+
+
+def test_journal_of_another_project_file_is_ignored(project_path):
+    record_edits(project_path)
+    with open(project_path, "w") as f:
+        json.dump({"signals": make_signals(3)}, f)
+
+    signals = load_signals(project_path)
+    assert EditJournal(project_path).replay(signals) == 0
+    assert signals == make_signals(3)
+
+
+def test_compact_and_close(project_path):
+    store = SignalStore(load_signals(project_path))
+    journal = EditJournal(project_path)
+    journal.start(store)
+    store.remove("00000001")
+    journal.compact()
+    journal.close()
+    # Only the header was left, so the journal is deleted
+    assert not os.path.exists(project_path + EditJournal.SUFFIX)
+
+    journal = EditJournal(project_path)
+    journal.start(store)
+    store.remove("00000002")
+    journal.close(discard=True)
+    assert not os.path.exists(project_path + EditJournal.SUFFIX)
+
+
+def test_rebase_keeps_the_records_for_a_rewritten_file(project_path):
+    store = SignalStore(load_signals(project_path))
+    journal = EditJournal(project_path)
+    journal.start(store)
+    store.replace("00000002", {"name": "Renamed"})
+
+    # The file is rewritten with its saved signals and another size
+    with open(project_path, "w") as f:
+        json.dump({"signals": make_signals(10), "core_config": {"cores": [1, 2, 3]}}, f)
+    journal.rebase()
+    store.remove("00000004")
+    journal.close()
+
+    signals = load_signals(project_path)
+    assert EditJournal(project_path).replay(signals) == 2
+    assert signals == store.signals
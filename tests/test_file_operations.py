@@ -0,0 +1,79 @@
+"""Tests for loading and saving project files (Modules/FileOperation/FileOperations.py)"""
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+
+from Modules.FileOperation.EditJournal import EditJournal
+from Modules.FileOperation.FileOperations import FileOperations
+from Modules.SignalOperations.SignalStore import SignalStore
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    path = str(tmp_path / "project.smgr")
+    with open(path, "w") as f:
+        json.dump({"signals": [{"id": f"{number:08x}", "name": f"Signal_{number}"} for number in range(5)]}, f)
+    return path
+
+
+def edit_and_close(project_path, undo_back):
+    """Load a project, edit a signal (and put it back) and close with the journal kept"""
+    file_operations = FileOperations(None)
+    assert file_operations.load_config_file(project_path)
+    store = SignalStore(file_operations.get_current_data()["signals"])
+    file_operations.start_journal(store)
+    previous = store.replace("00000001", {"name": "Renamed"})
+    if undo_back:
+        store.replace("00000001", previous)
+    file_operations.close_journal()
+
+
+def test_recovers_journaled_edits(project_path):
+    edit_and_close(project_path, undo_back=False)
+    file_operations = FileOperations(None)
+    assert file_operations.load_config_file(project_path)
+    assert file_operations.recovered_records == 1
+    assert file_operations.get_current_data()["signals"][1]["name"] == "Renamed"
+
+
+def test_edits_undone_back_are_not_recovered(project_path):
+    edit_and_close(project_path, undo_back=True)
+    file_operations = FileOperations(None)
+    assert file_operations.load_config_file(project_path)
+    assert file_operations.recovered_records == 0
+    # The useless journal is dropped rather than replayed again
+    file_operations.close_journal()
+    assert not os.path.exists(project_path + EditJournal.SUFFIX)
+
+
+def test_compact_journal(project_path):
+    file_operations = FileOperations(None)
+    assert file_operations.load_config_file(project_path)
+    store = SignalStore(file_operations.get_current_data()["signals"])
+    file_operations.start_journal(store)
+    previous = store.replace("00000001", {"name": "Renamed"})
+    store.replace("00000001", previous)
+    file_operations.compact_journal()
+    file_operations.close_journal()
+    assert not os.path.exists(project_path + EditJournal.SUFFIX)
+
+
+def test_update_config_file_keeps_the_journal(project_path):
+    file_operations = FileOperations(None)
+    assert file_operations.load_config_file(project_path)
+    store = SignalStore(file_operations.get_current_data()["signals"])
+    file_operations.start_journal(store)
+    store.remove("00000003")
+    file_operations.update_config_file({"cores": ["A53"]})
+    file_operations.close_journal()
+
+    file_operations = FileOperations(None)
+    assert file_operations.load_config_file(project_path)
+    assert file_operations.recovered_records == 1
+    data = file_operations.get_current_data()
+    assert data["core_config"] == {"cores": ["A53"]}
+    assert "00000003" not in [signal["id"] for signal in data["signals"]]
@@ -0,0 +1,190 @@
+"""Tests for the persistent map and the signal snapshots built on it
+(Modules/SignalOperations/PersistentMap.py, SignalSnapshots.py)"""
+
+import random
+
+import pytest
+
+from Modules.SignalOperations.PersistentMap import PersistentMap
+from Modules.SignalOperations.SignalHistory import SignalHistory
+from Modules.SignalOperations.SignalSnapshots import SignalSnapshots
+from Modules.SignalOperations.SignalStore import SignalStore
+
+
+class CollidingKey:
+    """A key whose hash is shared by every key of its group"""
+
+    def __init__(self, name, group=0):
+        self.name = name
+        self.group = group
+
+    def __hash__(self):
+        return self.group
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.name == self.name
+
+    def __repr__(self):
+        return f"CollidingKey({self.name!r})"
+
+
+def dict_diff(before, after):
+    """Compute the expected diff of two dictionaries, comparing values by identity"""
+    added = {key for key in after if key not in before}
+    removed = {key for key in before if key not in after}
+    changed = {key for key in after if key in before and after[key] is not before[key]}
+    return added, removed, changed
+
+
+def as_sets(diff):
+    return tuple(set(keys) for keys in diff)
+
+
+def random_edits(rng, keys, steps):
+    """Yield ("set", key, value) and ("delete", key) operations"""
+    for step in range(steps):
+        key = rng.choice(keys)
+        if rng.random() < 0.3:
+            yield "delete", key, None
+        else:
+            yield "set", key, object()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_dict(seed):
+    rng = random.Random(seed)
+    keys = [f"{number:08x}" for number in range(2000)] + [CollidingKey(name, 7) for name in "abcdef"]
+    expected = {key: object() for key in keys[::2]}
+    persistent = PersistentMap(expected)
+
+    for operation, key, value in random_edits(rng, keys, 3000):
+        if operation == "set":
+            expected[key] = value
+            persistent = persistent.set(key, value)
+        else:
+            expected.pop(key, None)
+            persistent = persistent.delete(key)
+        assert len(persistent) == len(expected)
+
+    assert set(persistent) == set(expected)
+    for key in keys:
+        assert persistent.get(key) is expected.get(key)
+        assert (key in persistent) == (key in expected)
+
+
+def test_old_versions_are_unchanged():
+    versions = [PersistentMap()]
+    for number in range(300):
+        versions.append(versions[-1].set(number, str(number)))
+    for number, version in enumerate(versions):
+        assert len(version) == number
+        assert sorted(version) == list(range(number))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_diff_matches_dict_diff(seed):
+    rng = random.Random(seed)
+    keys = [f"{number:08x}" for number in range(1000)] + [CollidingKey(name, 3) for name in "abcd"]
+    before = {key: object() for key in keys if rng.random() < 0.7}
+    after = dict(before)
+    persistent_before = PersistentMap(before)
+    persistent_after = persistent_before
+    for operation, key, value in random_edits(rng, keys, rng.randrange(1, 300)):
+        if operation == "set":
+            after[key] = value
+            persistent_after = persistent_after.set(key, value)
+        else:
+            after.pop(key, None)
+            persistent_after = persistent_after.delete(key)
+
+    assert as_sets(persistent_before.diff(persistent_after)) == dict_diff(before, after)
+    assert as_sets(persistent_after.diff(persistent_before)) == dict_diff(after, before)
+    # A map built from scratch shares no nodes, the diff must still agree
+    assert as_sets(PersistentMap(before).diff(persistent_after)) == dict_diff(before, after)
+
+
+def test_collisions():
+    keys = [CollidingKey(name) for name in "abc"]
+    persistent = PersistentMap()
+    for key in keys:
+        persistent = persistent.set(key, key.name)
+    assert len(persistent) == 3
+    assert [persistent[key] for key in keys] == ["a", "b", "c"]
+
+    shorter = persistent.delete(keys[1])
+    assert len(shorter) == 2 and keys[1] not in shorter and persistent[keys[1]] == "b"
+    assert as_sets(persistent.diff(shorter)) == (set(), {keys[1]}, set())
+    with pytest.raises(KeyError):
+        shorter[keys[1]]
+
+
+def test_setting_the_same_value_keeps_the_map():
+    value = object()
+    persistent = PersistentMap({"a": value})
+    assert persistent.set("a", value) is persistent
+    assert persistent.delete("missing") is persistent
+
+
+def make_store(count):
+    return SignalStore([{"id": f"{number:08x}", "name": f"Signal_{number}"} for number in range(count)])
+
+
+def test_snapshots_track_unsaved_changes():
+    store = make_store(100)
+    snapshots = SignalSnapshots()
+    store.attach(snapshots)
+    snapshots.mark_saved()
+    assert not snapshots.is_modified()
+
+    previous = store.replace("00000001", {"name": "Renamed"})
+    store.add({"id": "00001000", "name": "New"})
+    store.remove("00000002")
+    assert snapshots.is_modified()
+    assert as_sets(snapshots.changes_since_saved()) == ({"00001000"}, {"00000002"}, {"00000001"})
+    assert as_sets(snapshots.changes_since_saved()) == as_sets(snapshots.saved.diff(snapshots.current))
+
+    store.replace("00000001", previous)
+    store.remove("00001000")
+    assert as_sets(snapshots.changes_since_saved()) == (set(), {"00000002"}, set())
+
+
+def test_snapshots_follow_large_batches():
+    store = make_store(1000)
+    snapshots = SignalSnapshots()
+    store.attach(snapshots)
+    snapshots.mark_saved()
+
+    removed = store.remove_many([f"{number:08x}" for number in range(0, 1000, 3)])
+    assert as_sets(snapshots.changes_since_saved()) == as_sets(snapshots.saved.diff(snapshots.current))
+    store.add_many([dict(signal) for signal in removed])
+    assert snapshots.is_modified()
+    assert as_sets(snapshots.changes_since_saved()) == (set(), set(), {signal["id"] for signal in removed})
+
+
+def test_delete_and_undo_restores_the_saved_state():
+    store = make_store(50)
+    snapshots = SignalSnapshots()
+    store.attach(snapshots)
+    history = SignalHistory(store)
+    snapshots.mark_saved()
+    saved_order = list(store.signals)
+
+    history.record_removed("Delete", store.remove_many(["00000003", "00000010", "00000030"]))
+    assert snapshots.is_modified()
+    history.undo()
+    assert not snapshots.is_modified()
+    assert len(store.signals) == len(saved_order)
+    assert all(signal is saved for signal, saved in zip(store.signals, saved_order))
+
+
+def test_snapshots_after_load():
+    store = make_store(100)
+    snapshots = SignalSnapshots()
+    store.attach(snapshots)
+    snapshots.mark_saved()
+
+    store.load([{"id": f"{number:08x}", "name": f"Loaded_{number}"} for number in range(50, 150)])
+    added, removed, changed = as_sets(snapshots.changes_since_saved())
+    assert len(added) == 50 and len(removed) == 50 and len(changed) == 50
+    snapshots.mark_saved()
+    assert not snapshots.is_modified()
@@ -0,0 +1,90 @@
+"""Tests for the atomic, streaming project file writer (Modules/FileOperation/ProjectWriter.py)"""
+
+import json
+import os
+import stat
+
+import pytest
+
+from Modules.FileOperation import ProjectWriter
+from Modules.FileOperation.ProjectWriter import iter_project_json, write_project_file
+from Modules.SignalOperations.SignalRecord import Signal, StructField, json_default
+
+
+def make_project(count):
+    """Create project data with plain and record signals"""
+    signals = []
+    for number in range(count):
+        signal = {"id": f"{number:08x}", "name": f"Signal_{number}", "timeout": number,
+                  "description": "Ünïcode \"quoted\"\n", "destination_cores": ["A", "B"]}
+        if number % 2:
+            signal = Signal.from_json(signal)
+        if number % 5 == 0:
+            signal["struct_fields"] = [StructField.from_json({"field_name": "f", "data_type": "UINT8"})]
+        signals.append(signal)
+    return {"version": {"major": 1, "minor": 2}, "signals": signals, "core_configuration": {"cores": []}}
+
+
+def expected_json(project_data, compact):
+    """Encode project data the way the writer promises to match"""
+    if compact:
+        return json.dumps(project_data, separators=(",", ":"), default=json_default)
+    return json.dumps(project_data, indent=4, default=json_default)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("count", [0, 1, ProjectWriter.SIGNAL_BATCH, ProjectWriter.SIGNAL_BATCH * 2 + 3])
+def test_output_matches_json_dump(compact, count):
+    project_data = make_project(count)
+    assert "".join(iter_project_json(project_data, compact)) == expected_json(project_data, compact)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_small_documents(compact):
+    for project_data in ({}, {"signals": []}, {"version": "1"}):
+        assert "".join(iter_project_json(project_data, compact)) == expected_json(project_data, compact)
+
+
+def test_write_replaces_the_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(ProjectWriter, "WRITE_CHUNK_SIZE", 1000)
+    path = str(tmp_path / "project.smgr")
+    with open(path, "w") as f:
+        f.write("old")
+    os.chmod(path, 0o640)
+
+    project_data = make_project(600)
+    write_project_file(path, project_data)
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == expected_json(project_data, False)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert os.listdir(tmp_path) == ["project.smgr"]
+
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    path = str(tmp_path / "project.smgr")
+    with open(path, "w") as f:
+        f.write("old")
+
+    project_data = make_project(10)
+    project_data["signals"][-1]["timeout"] = object()
+    with pytest.raises(TypeError):
+        write_project_file(path, project_data)
+    with open(path) as f:
+        assert f.read() == "old"
+    assert os.listdir(tmp_path) == ["project.smgr"]
+
+
+def test_interrupted_rename_keeps_the_old_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "project.smgr")
+    with open(path, "w") as f:
+        f.write("old")
+
+    def fail(source, target):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ProjectWriter.os, "replace", fail)
+    with pytest.raises(OSError):
+        write_project_file(path, make_project(3), compact=True)
+    with open(path) as f:
+        assert f.read() == "old"
+    assert os.listdir(tmp_path) == ["project.smgr"]
@@ -0,0 +1,121 @@
+"""Tests for the signal query planner (Modules/DataBaseOperation/query_engine.py)"""
+
+import random
+import re
+
+import pytest
+
+from Modules.DataBaseOperation.query_engine import (And, Eq, In, Or, Prefix, Range, Regex,
+                                                    SignalQueryIndex, predicate_from_kwargs)
+from Modules.SignalOperations.SignalStore import SignalStore
+
+
+def make_store(count=500, seed=0):
+    """Create a store of random signals and attach a query index to it"""
+    rng = random.Random(seed)
+    prefixes = ["Brake", "Throttle", "xThrottle", "Steer", "brake"]
+    signals = [{"id": f"{i:08x}",
+                "name": f"{rng.choice(prefixes)}{i}",
+                "board": rng.choice(["DCu1", "DCu2", "ZCU"]),
+                "asil": rng.choice(["QM", "A", "B", "C", "D"]),
+                "timeout": rng.choice([5, 10, 50, 100, 500, None])}
+               for i in range(count)]
+    store = SignalStore(signals)
+    index = SignalQueryIndex(store.index)
+    store.attach(index)
+    return store, index
+
+
+def planned(store, index, predicate):
+    """Answer a query the way DatabaseOperations.query does"""
+    candidate_ids, residual = index.candidates(predicate)
+    if candidate_ids is None:
+        return {signal["id"] for signal in store.signals if predicate.matches(signal)}
+    candidates = store.index.in_list_order(candidate_ids)
+    return {signal["id"] for signal in candidates if residual is None or residual.matches(signal)}
+
+
+def scanned(store, predicate):
+    """Answer a query by checking every signal"""
+    return {signal["id"] for signal in store.signals if predicate.matches(signal)}
+
+
+QUERIES = [
+    Eq("board", "DCu1"),
+    In("asil", ["C", "D"]),
+    Range("timeout", low=10, high=100),
+    Range("timeout", low=10, include_low=False),
+    Prefix("name", "Brake"),
+    Regex("name", "^Brake1"),
+    Regex("name", "^Brake|Throttle"),
+    Regex("name", "^(Brake|Steer)2"),
+    Regex("name", "^Brake", 0),
+    Eq("board", "DCu2") & Range("timeout", high=50) | Prefix("name", "Steer"),
+    And(Eq("asil", "QM"), Regex("name", "7$"), In("board", ["ZCU", "DCu1"])),
+    Or(Eq("id", "00000010"), Eq("name", "nope"), Eq("asil", ["x"])),
+    Eq("asil", ["x"]),
+    predicate_from_kwargs(board="DCu1", timeout__lte=100, name__startswith="Thr"),
+]
+
+
+@pytest.mark.parametrize("predicate", QUERIES, ids=repr)
+def test_planner_matches_scan(predicate):
+    store, index = make_store()
+    assert planned(store, index, predicate) == scanned(store, predicate)
+
+
+def test_planner_follows_edits():
+    store, index = make_store()
+    rng = random.Random(1)
+    for step in range(200):
+        signal = store.signals[rng.randrange(len(store.signals))]
+        if step % 3 == 0:
+            store.remove(signal["id"])
+        else:
+            updated = dict(signal)
+            updated["board"] = rng.choice(["DCu1", "ZCU"])
+            updated["timeout"] = rng.randrange(200)
+            store.replace(signal["id"], updated)
+    for predicate in QUERIES:
+        assert planned(store, index, predicate) == scanned(store, predicate)
+
+
+@pytest.mark.parametrize("pattern, flags, prefix", [
+    ("^Brake", 0, "Brake"),
+    ("^Brakes?", 0, "Brake"),
+    ("^Brake|Throttle", 0, ""),
+    ("^(Brake|Throttle)", 0, ""),
+    ("^Bra[k|c]e", 0, "Bra"),
+    ("^Brake", re.MULTILINE, ""),
+    ("^Brake", re.IGNORECASE, ""),
+    ("Brake", 0, ""),
+])
+def test_literal_prefix(pattern, flags, prefix):
+    assert Regex("name", pattern, flags).literal_prefix() == prefix
+
+
+def test_alternation_regex_finds_every_branch():
+    store = SignalStore([{"id": "1", "name": "BrakeA"}, {"id": "2", "name": "xThrottle"},
+                         {"id": "3", "name": "Throttle"}, {"id": "4", "name": "Steer"}])
+    index = SignalQueryIndex(store.index)
+    store.attach(index)
+    assert planned(store, index, Regex("name", "^Brake|Throttle")) == {"1", "2", "3"}
+
+
+def test_unhashable_eq_value_falls_back_to_scan():
+    store, index = make_store(50)
+    predicate = Eq("asil", ["x"])
+    assert index.candidates(predicate) == (None, predicate)
+    assert planned(store, index, predicate) == set()
+
+
+@pytest.mark.parametrize("predicate", [Eq("id", 5), In("id", [5, 7]), Eq("name", None),
+                                       In("name", [None, "Named_3"]), Eq("id", "5"),
+                                       predicate_from_kwargs(id=5), predicate_from_kwargs(name=None)])
+def test_non_string_keys_fall_back(predicate):
+    # Projects with integer IDs and unnamed signals, matched by the baseline scan
+    signals = [{"id": number, "name": f"Named_{number}" if number % 4 else None} for number in range(10)]
+    store = SignalStore(signals)
+    index = SignalQueryIndex(store.index)
+    store.attach(index)
+    assert planned(store, index, predicate) == scanned(store, predicate)
@@ -0,0 +1,48 @@
+"""Tests for the signal store shared by SignalManager and DatabaseOperations"""
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+
+from Modules.DataBaseOperation.database_operations import DatabaseOperations
+from Modules.SignalOperations.SignalManager import SignalManager
+
+
+@pytest.fixture
+def facades():
+    """A signal manager and database operations sharing one store, as the app creates them"""
+    manager = SignalManager()
+    manager.set_project_data({"signals": [
+        {"id": "00000001", "name": "Speed", "board": "DCu1", "soc": "SoC1", "build_image": "Image1"},
+        {"id": "00000002", "name": "Brake", "board": "DCu1", "soc": "SoC2", "build_image": "Image2"},
+    ]})
+    database = DatabaseOperations(store=manager.store)
+    return manager, database
+
+
+def test_manager_edits_are_visible_to_the_database(facades):
+    manager, database = facades
+    signal_id = manager.add_signal_to_database({"name": "Door", "board": "ZCu2"})
+    assert database.get_signal(signal_id)["name"] == "Door"
+    assert database.get_boards() == ["DCu1", "ZCu2"]
+
+    manager.update_signal_in_database("00000001", {"name": "Velocity", "board": "DCu1"})
+    assert [signal["id"] for signal in database.filter_signals(name="Velocity")] == ["00000001"]
+
+    manager.delete_signals(["00000002"])
+    assert database.get_signal("00000002") is None
+    assert database.get_signal_count(board="DCu1") == 1
+
+
+def test_database_edits_are_visible_to_the_manager(facades):
+    manager, database = facades
+    assert database.add_signal({"id": "00000003", "name": "Door", "board": "ZCu2"})
+    assert manager.find_signal_by_id("00000003")["name"] == "Door"
+    assert manager.project_data["signals"] is database.signals
+
+    assert database.update_signal("00000001", {"name": "Velocity"})
+    assert manager.find_signal_by_id("00000001")["name"] == "Velocity"
+    assert manager.has_unsaved_signal_changes()
+
+    assert database.delete_signal("00000002")
+    assert manager.find_signal_by_id("00000002") is None
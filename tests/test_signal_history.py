@@ -0,0 +1,155 @@
+"""Tests for the undo/redo history of signal edits (Modules/SignalOperations/SignalHistory.py)"""
+
+import pytest
+
+from Modules.FileOperation.EditJournal import EditJournal
+from Modules.SignalOperations.SignalHistory import SignalHistory
+from Modules.SignalOperations.SignalStore import SignalStore
+
+
+def make_store(count):
+    """Create a store of numbered signals"""
+    return SignalStore([{"id": f"{number:08x}", "name": f"Signal_{number}"} for number in range(count)])
+
+
+def names(store):
+    """Get the signal names in list order"""
+    return [signal["name"] for signal in store.signals]
+
+
+def update(store, history, signal_id, **fields):
+    """Replace a signal with a copy carrying new field values, as SignalManager does"""
+    signal = dict(store.get(signal_id), **fields)
+    previous = store.replace(signal_id, signal)
+    history.record_updated("Edit", [(previous, signal)])
+
+
+def delete(store, history, signal_ids):
+    """Remove signals and record it, as SignalManager does"""
+    history.record_removed("Delete", store.remove_many(signal_ids))
+
+
+def test_undo_redo_update():
+    store = make_store(5)
+    history = SignalHistory(store)
+    update(store, history, "00000002", name="Renamed")
+
+    assert history.undo() == "Edit"
+    assert store.get("00000002")["name"] == "Signal_2"
+    assert not history.can_undo() and history.can_redo()
+    history.redo()
+    assert store.get("00000002")["name"] == "Renamed"
+
+
+def test_undo_redo_add():
+    store = make_store(5)
+    history = SignalHistory(store)
+    added = {"name": "New"}
+    store.add(added)
+    history.record_added("Add", [added])
+
+    history.undo()
+    assert added["id"] not in store
+    history.redo()
+    assert names(store)[-1] == "New"
+
+
+@pytest.mark.parametrize("doomed", [[2], [0, 4], [1, 2, 3], [4, 0, 2], list(range(100, 300))])
+def test_undo_delete_restores_positions(doomed):
+    store = make_store(400)
+    history = SignalHistory(store)
+    original = names(store)
+    signal_ids = [store.signals[position]["id"] for position in doomed]
+
+    delete(store, history, signal_ids)
+    assert len(store) == 400 - len(doomed)
+    history.undo()
+    assert names(store) == original
+    assert [store.index.position(signal["id"]) for signal in store.signals] == list(range(400))
+
+    history.redo()
+    history.undo()
+    assert names(store) == original
+
+
+def test_undo_delete_after_other_deletes():
+    store = make_store(10)
+    history = SignalHistory(store)
+    delete(store, history, ["00000003", "00000007"])
+    delete(store, history, ["00000001", "00000005"])
+
+    history.undo()
+    assert names(store) == [f"Signal_{number}" for number in (0, 1, 2, 4, 5, 6, 8, 9)]
+    history.undo()
+    assert names(store) == [f"Signal_{number}" for number in range(10)]
+
+
+def test_merge_edits_of_the_same_field():
+    store = make_store(3)
+    history = SignalHistory(store, merge_edits=True)
+    for text in ("A", "AB", "ABC"):
+        update(store, history, "00000001", name=text)
+    update(store, history, "00000001", description="Other field")
+
+    history.undo()
+    assert store.get("00000001")["name"] == "ABC"
+    history.undo()
+    assert store.get("00000001")["name"] == "Signal_1"
+    assert not history.can_undo()
+
+
+def test_new_edit_clears_redo():
+    store = make_store(3)
+    history = SignalHistory(store)
+    update(store, history, "00000000", name="First")
+    history.undo()
+    update(store, history, "00000000", name="Second")
+    assert not history.can_redo()
+
+
+def test_eviction_keeps_the_newest_entry():
+    store = make_store(50)
+    history = SignalHistory(store)
+    for number in range(50):
+        update(store, history, f"{number:08x}", name=f"Edited_{number}")
+    entry_size = history.size // 50
+
+    history.set_memory_budget(entry_size * 10)
+    assert history.size <= entry_size * 10 + entry_size
+    undone = 0
+    while history.undo() is not None:
+        undone += 1
+    assert 1 <= undone <= 11
+    assert store.get(f"{49:08x}")["name"] == "Signal_49"
+    assert store.get(f"{0:08x}")["name"] == "Edited_0"
+
+    history.set_memory_budget(0)
+    history.redo()
+    assert history.can_undo()
+
+
+def test_reset_clears_history():
+    store = make_store(3)
+    history = SignalHistory(store)
+    update(store, history, "00000000", name="Changed")
+    store.load([{"id": "00000009", "name": "Other"}])
+    assert not history.can_undo()
+
+
+def test_journal_replays_restored_positions(tmp_path):
+    project_path = str(tmp_path / "project.smgr")
+    with open(project_path, "w") as f:
+        f.write("{}")
+    store = make_store(10)
+    saved = [dict(signal) for signal in store.signals]
+    history = SignalHistory(store)
+    journal = EditJournal(project_path)
+    journal.start(store)
+
+    delete(store, history, ["00000002", "00000006"])
+    history.undo()
+    journal.close()
+
+    signals = [dict(signal) for signal in saved]
+    EditJournal(project_path).replay(signals)
+    assert [signal["name"] for signal in signals] == names(store)
@@ -0,0 +1,132 @@
+"""Tests for the signal name index behind name uniqueness (Modules/SignalOperations/SignalIndex.py)"""
+
+import pytest
+
+from Modules.SignalOperations.SignalIndex import SignalNameIndex
+from Modules.SignalOperations.SignalStore import SignalStore
+
+
+def make_store(names, case_sensitive_names=True):
+    signals = [{"id": f"{number:08x}", "name": name} for number, name in enumerate(names)]
+    return SignalStore(signals, case_sensitive_names=case_sensitive_names)
+
+
+def test_is_taken_allows_the_owner():
+    names = SignalNameIndex()
+    names.add("Speed", "a")
+    assert names.is_taken("Speed")
+    assert names.is_taken("Speed", "b")
+    assert not names.is_taken("Speed", "a")
+    assert not names.is_taken("Other")
+
+
+def test_shared_names_switch_to_sets_and_back():
+    names = SignalNameIndex()
+    names.add("Speed", "a")
+    names.add("Speed", "b")
+    assert names.owners("Speed") == {"a", "b"}
+    # A duplicated name is taken even for one of its holders
+    assert names.is_taken("Speed", "a")
+
+    names.discard("Speed", "b")
+    assert names.owners("Speed") == {"a"}
+    assert not names.is_taken("Speed", "a")
+    names.discard("Speed", "a")
+    assert names.owners("Speed") == set()
+
+
+def test_empty_names_are_ignored():
+    names = SignalNameIndex()
+    names.add("", "a")
+    names.add(None, "b")
+    assert not names.is_taken("")
+    assert names.find_conflicts(["", None, ""]) == {}
+
+
+def test_case_insensitive_names():
+    names = SignalNameIndex(case_sensitive=False)
+    names.add("Speed", "a")
+    assert names.is_taken("SPEED", "b")
+    assert names.owners("speed") == {"a"}
+    assert not SignalNameIndex().is_taken("SPEED")
+
+
+def test_find_conflicts_checks_the_batch_and_the_index():
+    names = SignalNameIndex()
+    names.add("Speed", "a")
+    conflicts = names.find_conflicts(["Speed", "Brake", "Brake", "Door"])
+    assert set(conflicts) == {"Speed", "Brake"}
+    assert "already exists" in conflicts["Speed"]
+    assert "more than once" in conflicts["Brake"]
+
+    # A signal may keep its own name
+    assert names.find_conflicts(["Speed"], ["a"]) == {}
+    assert set(names.find_conflicts(["Speed"], ["b"])) == {"Speed"}
+
+
+def test_store_keeps_names_current():
+    store = make_store(["Speed", "Brake"])
+    names = store.index.names
+    store.replace("00000000", {"name": "Velocity"})
+    assert not names.is_taken("Speed")
+    assert names.is_taken("Velocity")
+
+    signal_id = store.add({"name": "Door"})
+    assert names.owners("Door") == {signal_id}
+    store.remove_many(["00000001", signal_id])
+    assert not names.is_taken("Brake") and not names.is_taken("Door")
+
+
+def test_store_switches_case_sensitivity():
+    store = make_store(["Speed", "speed"])
+    assert not store.index.names.is_taken("speed", "00000001")
+    store.set_case_sensitive_names(False)
+    assert store.index.names.owners("SPEED") == {"00000000", "00000001"}
+    assert store.index.names.is_taken("speed", "00000001")
+
+
+def test_unchanged_shared_names_pass():
+    store = make_store(["Dup", "Dup", "Other"])
+    names = store.index.names
+    assert names.find_conflicts(["Dup", "Dup"], ["00000000", "00000001"], ["Dup", "Dup"]) == {}
+    # Only a change of case, with case ignored
+    store.set_case_sensitive_names(False)
+    assert names.find_conflicts(["DUP"], ["00000000"], ["Dup"]) == {}
+    # Renaming one of them onto the other name still conflicts
+    assert set(names.find_conflicts(["Dup"], ["00000002"], ["Other"])) == {"Dup"}
+
+
+def test_batch_may_swap_names():
+    store = make_store(["Y", "Z", "Other"])
+    names = store.index.names
+    assert names.find_conflicts(["Z", "Y"], ["00000000", "00000001"], ["Y", "Z"]) == {}
+    # A name freed by the batch can only be taken once
+    conflicts = names.find_conflicts(["Z", "Y", "Y"], ["00000000", "00000001", "00000002"], ["Y", "Z", "Other"])
+    assert set(conflicts) == {"Y"}
+    assert "more than once" in conflicts["Y"]
+
+
+def make_manager(names):
+    pytest.importorskip("PyQt5.QtWidgets")
+    from Modules.SignalOperations.SignalManager import SignalManager
+    manager = SignalManager()
+    manager.set_project_data({"signals": [{"id": f"{number:08x}", "name": name, "data_type": "UINT8"}
+                                          for number, name in enumerate(names)]})
+    return manager
+
+
+def test_attribute_edit_of_signals_sharing_a_name():
+    manager = make_manager(["Dup", "Dup", "Other"])
+    signal_ids, errors = manager.set_signal_attributes(["00000000", "00000001", "00000002"], {"asil": "B"})
+    assert errors == {}
+    assert sorted(signal_ids) == ["00000000", "00000001", "00000002"]
+    assert manager.validate_signal_data(dict(manager.find_signal_by_id("00000000"), asil="C")) == (True, "")
+
+
+def test_update_swapping_names():
+    manager = make_manager(["Y", "Z"])
+    signal_ids, errors = manager.update_signals({"00000000": {"name": "Z", "data_type": "UINT8"},
+                                                 "00000001": {"name": "Y", "data_type": "UINT8"}})
+    assert errors == {}
+    assert manager.find_signal_by_id("00000000")["name"] == "Z"
+    assert not manager.validate_signal_data({"id": "00000000", "name": "Y", "data_type": "UINT8"})[0]
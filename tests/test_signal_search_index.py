@@ -0,0 +1,83 @@
+"""Tests for the free-text signal search index (Modules/SignalOperations/SignalSearchIndex.py)"""
+
+import random
+
+import pytest
+
+from Modules.SignalOperations.SignalSearchIndex import SignalSearchIndex
+from Modules.SignalOperations.SignalStore import SignalStore
+
+WORDS = ["Vehicle", "Speed", "Brake", "Pressure", "Door", "Left", "Right", "Front", "Rear"]
+
+QUERIES = ["speed", "brakepressure", "rp_door", "left front", "zzz", "ve", "s", "le sp", "DOOR"]
+
+
+def make_signal(rng, number):
+    """Create a synthetic signal (without an ID, as the store gives one)"""
+    name = "".join(rng.sample(WORDS, 3))
+    return {"name": f"{name}_{number}", "variable_port_name": f"Rp_{name}",
+            "description": " ".join(rng.sample(WORDS, 4)).lower()}
+
+
+def scanned(signals, text):
+    """Answer a search by checking every field of every signal"""
+    terms = SignalSearchIndex.terms(text)
+    result = set()
+    for signal in signals:
+        values = [signal[field].casefold() for field in SignalSearchIndex.FIELDS if signal.get(field)]
+        if all(any(value.startswith(term) if len(term) < 3 else term in value for value in values)
+               for term in terms):
+            result.add(signal["id"])
+    return result
+
+
+def make_store(rng, count):
+    """Create a store of synthetic signals"""
+    signals = [make_signal(rng, number) for number in range(count)]
+    for number, signal in enumerate(signals):
+        signal["id"] = f"{number:08x}"
+    return SignalStore(signals)
+
+
+def edit(store, rng, steps):
+    """Add, replace and remove random signals"""
+    for step in range(steps):
+        signal = store.signals[rng.randrange(len(store.signals))]
+        if step % 3 == 0:
+            store.remove(signal["id"])
+        elif step % 3 == 1:
+            store.add(make_signal(rng, 10000 + step))
+        else:
+            store.replace(signal["id"], make_signal(rng, 20000 + step))
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_search_matches_scan_across_edits(background):
+    rng = random.Random(0)
+    store = make_store(rng, 2000)
+    index = SignalSearchIndex()
+    store.attach(index)
+    if background:
+        # Edits made while the worker builds are applied when it is installed
+        index.build_in_background()
+    edit(store, rng, 300)
+    for text in QUERIES:
+        assert index.search(text) == scanned(store.signals, text), text
+    edit(store, rng, 300)
+    for text in QUERIES:
+        assert index.search(text) == scanned(store.signals, text), text
+
+
+def test_followed_results_stay_current():
+    rng = random.Random(1)
+    store = make_store(rng, 500)
+    index = SignalSearchIndex()
+    store.attach(index)
+    results = index.follow("brake")
+    edit(store, rng, 200)
+    assert results == scanned(store.signals, "brake")
+    index.unfollow(results)
+
+
+def test_empty_search_filters_nothing():
+    assert SignalSearchIndex([]).search("  ") is None
@@ -0,0 +1,176 @@
+"""Tests for the signals list, its ID index and change events
+(Modules/SignalOperations/SignalIndex.py, SignalStore.py)"""
+
+import random
+
+import pytest
+
+from Modules.SignalOperations.SignalIndex import SignalIndex
+from Modules.SignalOperations.SignalStore import SignalStore
+
+
+def make_signals(count):
+    return [{"id": f"{number:08x}", "name": f"Signal_{number}"} for number in range(count)]
+
+
+def check_index(index):
+    """Compare every lookup of an index with a scan of its list"""
+    assert len(index) == len(index.signals)
+    assert index.is_synced(index.signals)
+    for position, signal in enumerate(index.signals):
+        assert index.get(signal["id"]) is signal
+        assert index.position(signal["id"]) == position
+    assert index.in_list_order(reversed(list(index.ids()))) == index.signals
+
+
+class RecordingIndex:
+    """Attached index keeping its own dict of the signals"""
+
+    def __init__(self):
+        self.signals = {}
+        self.rebuilds = 0
+
+    def rebuild(self, signals):
+        self.rebuilds += 1
+        self.signals = {signal["id"]: signal for signal in signals}
+
+    def add(self, signal):
+        self.signals[signal["id"]] = signal
+
+    def update(self, old_signal, new_signal):
+        assert self.signals[old_signal["id"]] is old_signal
+        self.signals[new_signal["id"]] = new_signal
+
+    def remove(self, signal):
+        assert self.signals.pop(signal["id"]) is signal
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_index_follows_random_edits(seed):
+    rng = random.Random(seed)
+    index = SignalIndex(make_signals(500))
+    expected = list(index.signals)
+    next_number = 500
+
+    for step in range(2000):
+        choice = rng.random()
+        if choice < 0.3 or not expected:
+            signal = {"id": f"{next_number:08x}", "name": f"Signal_{next_number}"}
+            next_number += 1
+            index.append(signal)
+            expected.append(signal)
+        elif choice < 0.5:
+            position = rng.randrange(len(expected))
+            signal = dict(expected[position], name=f"Renamed_{step}")
+            assert index.replace(signal["id"], signal)
+            expected[position] = signal
+        elif choice < 0.9:
+            signal = expected.pop(rng.randrange(len(expected)))
+            assert index.remove(signal["id"]) is signal
+        else:
+            doomed = rng.sample(expected, min(len(expected), rng.choice([3, 200])))
+            removed = index.remove_many([signal["id"] for signal in doomed])
+            assert {signal["id"] for signal in removed} == {signal["id"] for signal in doomed}
+            expected = [signal for signal in expected if signal not in removed]
+        if step % 100 == 0:
+            assert index.signals == expected
+            check_index(index)
+
+    assert index.signals == expected
+    check_index(index)
+    assert index.remove("missing") is None
+    assert not index.replace("missing", {"id": "missing"})
+
+
+def test_small_remove_many_keeps_input_order():
+    index = SignalIndex(make_signals(100))
+    signal_ids = ["00000009", "00000002", "00000009", "00000005", "missing"]
+    removed = index.remove_many(signal_ids)
+    assert [signal["id"] for signal in removed] == ["00000009", "00000002", "00000005"]
+    check_index(index)
+
+
+def test_large_remove_many_returns_list_order():
+    index = SignalIndex(make_signals(1000))
+    signal_ids = [f"{number:08x}" for number in range(999, 0, -2)]
+    removed = index.remove_many(signal_ids)
+    assert [signal["id"] for signal in removed] == sorted(signal_ids)
+    check_index(index)
+
+
+def test_insert_many_puts_signals_back():
+    signals = make_signals(20)
+    index = SignalIndex(list(signals))
+    doomed = [signals[number] for number in (0, 7, 8, 19)]
+    index.remove_many([signal["id"] for signal in doomed])
+    index.insert_many([(position, signals[position]) for position in (0, 7, 8, 19)])
+    assert index.signals == signals
+    check_index(index)
+
+
+def test_store_add_replace_remove_events():
+    store = SignalStore(make_signals(10))
+    attached = RecordingIndex()
+    store.attach(attached)
+    events = []
+    store.subscribe(lambda event, signal_ids: events.append((event, list(signal_ids))))
+
+    signal_id = store.add({"name": "New"})
+    assert signal_id and signal_id not in {signal["id"] for signal in make_signals(10)}
+    assert store.add({"id": signal_id, "name": "Duplicate"}) is None
+
+    previous = store.get("00000003")
+    replacement = {"name": "Replaced"}
+    assert store.replace("00000003", replacement) is previous
+    assert replacement["id"] == "00000003"
+    assert store.index.position("00000003") == 3
+    assert store.replace("missing", {}) is None
+
+    removed = store.remove("00000004")
+    assert removed["id"] == "00000004" and "00000004" not in store
+    assert store.remove("00000004") is None
+
+    assert events == [("added", [signal_id]), ("updated", ["00000003"]),
+                      ("removing", ["00000004"]), ("removed", ["00000004"])]
+    assert attached.signals == {signal["id"]: signal for signal in store.signals}
+
+
+def test_store_batches():
+    store = SignalStore(make_signals(1000))
+    attached = RecordingIndex()
+    store.attach(attached)
+    events = []
+    store.subscribe(lambda event, signal_ids: events.append(event))
+
+    added = store.add_many([{"name": f"Batch_{number}"} for number in range(5)] + [{"id": "custom", "name": "C"}])
+    assert len(set(added)) == 6 and added[-1] == "custom"
+    with pytest.raises(ValueError):
+        store.add_many([{"id": "custom"}])
+    with pytest.raises(ValueError):
+        store.add_many([{"id": "twice"}, {"id": "twice"}])
+
+    replaced = store.replace_many({"00000001": {"name": "One"}, "missing": {"name": "Gone"}})
+    assert replaced == ["00000001"]
+
+    # Large enough to rebuild the attached indexes instead of updating them
+    rebuilds = attached.rebuilds
+    removed = store.remove_many([f"{number:08x}" for number in range(0, 1000, 2)] + ["missing"])
+    assert len(removed) == 500
+    assert attached.rebuilds == rebuilds + 1
+    assert store.remove_many(["missing"]) == []
+
+    assert events == ["added", "updated", "removing", "removed"]
+    assert attached.signals == {signal["id"]: signal for signal in store.signals}
+    check_index(store.index)
+
+
+def test_store_sync_after_outside_change():
+    store = SignalStore(make_signals(10))
+    events = []
+    store.subscribe(lambda event, signal_ids: events.append(event))
+    assert not store.sync()
+    store.signals.append({"id": "outside", "name": "Outside"})
+    assert store.sync()
+    assert events == ["reset"]
+    assert store.get("outside") is store.signals[-1]
+    check_index(store.index)
@@ -0,0 +1,61 @@
+"""Tests for the interning of categorical signal values (Modules/SignalOperations/StringPool.py)"""
+
+from Modules.SignalOperations.SignalHistory import SignalHistory
+from Modules.SignalOperations.SignalStore import SignalStore
+from Modules.SignalOperations.StringPool import StringPool
+
+
+def make_signal(number):
+    """Create a signal whose strings are separate objects, as json.load makes them"""
+    return {"id": f"{number:08x}", "name": f"Signal_{number}", "data_type": "".join(["UINT", "32"]),
+            "destination_cores": ["".join(["Core", "A"]), "".join(["Core", "B"])],
+            "struct_fields": [{"field_name": "f", "data_type": "".join(["UINT", "8"])}]}
+
+
+def test_equal_values_share_one_object():
+    pool = StringPool()
+    first, second = pool.intern_signal(make_signal(1)), pool.intern_signal(make_signal(2))
+    assert first["data_type"] is second["data_type"]
+    assert first["destination_cores"][1] is second["destination_cores"][1]
+    assert first["struct_fields"][0]["data_type"] is second["struct_fields"][0]["data_type"]
+    assert pool.stats()["unique"] == 4
+    assert pool.stats()["references"] == 8
+
+
+def test_interning_again_changes_nothing():
+    pool = StringPool()
+    signal = pool.intern_signal(make_signal(1))
+    cores = signal["destination_cores"]
+    struct_field = dict(signal["struct_fields"][0])
+    stats = pool.stats()
+
+    # Writing to the signal would fail, it must not be touched
+    class ReadOnlySignal(dict):
+        def __setitem__(self, key, value):
+            raise AssertionError(f"{key} was rewritten")
+
+    pool.intern_signal(ReadOnlySignal(signal))
+    assert signal["destination_cores"] is cores
+    assert signal["struct_fields"][0] == struct_field
+    assert pool.stats() == stats
+
+
+def test_undo_and_redo_leave_stored_signals_alone():
+    store = SignalStore([make_signal(number) for number in range(5)])
+    history = SignalHistory(store)
+    stats = store.string_pool.stats()
+
+    updated = dict(store.get("00000001"), name="Renamed")
+    previous = store.replace("00000001", updated)
+    history.record_updated("Edit", [(previous, updated)])
+    history.record_removed("Delete", store.remove_many(["00000002"]))
+    cores = [signal["destination_cores"] for signal in (previous, updated)]
+
+    for step in range(3):
+        history.undo()
+        history.undo()
+        history.redo()
+        history.redo()
+    assert [signal["destination_cores"] for signal in (previous, updated)] == cores
+    assert all(a is b for a, b in zip(cores, (previous["destination_cores"], updated["destination_cores"])))
+    assert store.string_pool.stats() == stats